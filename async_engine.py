@@ -0,0 +1,313 @@
+"""
+비동기 엔진 - asyncio로 Reddit 수집과 LLM 평가를 한 프로세스에서 대량으로 동시 실행
+
+동기 경로(RedditClient, ContentAnalyzer)의 변환 로직과 관련성 평가 흐름을 그대로 재사용하므로
+같은 응답에 대해 같은 결과를 냅니다. asyncpraw와 httpx가 필요합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import ASYNC_CONFIG, FILTER_CRITERIA, REDDIT_CONFIG
+from content_analyzer import ContentAnalyzer
+from reddit_client import DEEP_SEARCH_SLICES, LISTING_CEILING, RedditClient
+
+logger = logging.getLogger(__name__)
+
+# 진행 상황 콜백: (단계 이름, 완료 수, 전체 수)
+ProgressCallback = Callable[[str, int, int], None]
+
+# 평가 결과 콜백: 평가가 끝난 게시물 (완료 순서대로 호출)
+ResultCallback = Callable[[Dict[str, Any]], None]
+
+
+def _require_async_deps():
+    """비동기 엔진 의존성 import (없으면 설치 안내와 함께 ImportError)"""
+    try:
+        import asyncpraw
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "비동기 엔진에는 asyncpraw와 httpx가 필요합니다: pip install asyncpraw httpx"
+        ) from e
+    return asyncpraw, httpx
+
+
+class AsyncRedditClient:
+    """asyncpraw 기반 Reddit 검색 클라이언트 (RedditClient와 같은 결과 형식)"""
+
+    def __init__(self, max_inflight: Optional[int] = None):
+        """
+        클라이언트 초기화 (실행 중인 이벤트 루프 안에서 생성해야 함)
+
+        Args:
+            max_inflight: 동시 검색 요청 수 (None이면 config에서 가져옴)
+        """
+        asyncpraw, _ = _require_async_deps()
+        self.reddit = asyncpraw.Reddit(
+            client_id=REDDIT_CONFIG["client_id"],
+            client_secret=REDDIT_CONFIG["client_secret"],
+            user_agent=REDDIT_CONFIG["user_agent"],
+        )
+        self._limit = asyncio.Semaphore(max_inflight or ASYNC_CONFIG["reddit_inflight"])
+
+    async def close(self) -> None:
+        """HTTP 세션 종료"""
+        await self.reddit.close()
+
+    async def _fetch_search(
+        self,
+        subreddit_name: str,
+        query: str,
+        limit: int,
+        sort: str = "relevance",
+        time_filter: str = "all",
+    ) -> List[Dict[str, Any]]:
+        """서브레딧 검색 목록 요청 (RedditClient._fetch_search와 동일)"""
+        async with self._limit:
+            name = "all" if subreddit_name.lower() == "all" else subreddit_name
+            subreddit = await self.reddit.subreddit(name)
+            return [
+                RedditClient._submission_to_dict(submission)
+                async for submission in subreddit.search(
+                    query, sort=sort, time_filter=time_filter, limit=limit
+                )
+            ]
+
+    async def search_posts(
+        self, keywords: List[str], subreddits: List[str], limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        키워드로 Reddit 게시물 검색 (서브레딧별 요청을 동시에 실행)
+
+        Args:
+            keywords: 검색할 키워드 리스트
+            subreddits: 검색할 서브레딧 리스트
+            limit: 서브레딧당 가져올 게시물 수
+
+        Returns:
+            게시물 정보 딕셔너리 리스트 (서브레딧 순서 유지)
+        """
+        query = " OR ".join(keywords)
+        listings = await asyncio.gather(
+            *(self._fetch_search(name, query, limit) for name in subreddits),
+            return_exceptions=True,
+        )
+
+        posts = []
+        for name, listing in zip(subreddits, listings):
+            if isinstance(listing, Exception):
+                logger.error(f"서브레딧 {name} 검색 중 오류: {listing}")
+                continue
+            posts.extend(RedditClient._with_matches(listing, keywords))
+        return posts
+
+    async def search_posts_deep(
+        self, keywords: List[str], subreddits: List[str], limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        목록 상한을 넘는 심층 검색 (RedditClient.search_posts_deep과 같은 병합 순서)
+
+        Args:
+            keywords: 검색할 키워드 리스트
+            subreddits: 검색할 서브레딧 리스트
+            limit: 서브레딧별 최대 고유 게시물 수
+
+        Returns:
+            중복 제거된 게시물 정보 딕셔너리 리스트
+        """
+        if limit <= LISTING_CEILING:
+            return await self.search_posts(keywords, subreddits, limit)
+
+        query = " OR ".join(keywords)
+        window = min(limit, LISTING_CEILING)
+        slices = [
+            (name, sort, time_filter)
+            for name in subreddits
+            for sort, time_filter in DEEP_SEARCH_SLICES
+        ]
+        listings = await asyncio.gather(
+            *(self._fetch_search(name, query, window, sort, tf) for name, sort, tf in slices),
+            return_exceptions=True,
+        )
+
+        # gather는 입력 순서대로 결과를 돌려주므로 병합 순서가 안정적
+        for index, ((name, sort, time_filter), listing) in enumerate(zip(slices, listings)):
+            if isinstance(listing, Exception):
+                logger.error(
+                    f"서브레딧 {name} 심층 검색({sort}/{time_filter}) 중 오류: {listing}"
+                )
+                listings[index] = []
+
+        merged = RedditClient._merge_slices(slices, listings, limit)
+        logger.info(
+            "심층 검색: 창 %d개에서 고유 게시물 %d개 수집", len(slices), len(merged)
+        )
+        return RedditClient._with_matches(merged, keywords)
+
+
+class AsyncContentAnalyzer:
+    """
+    httpx 기반 비동기 관련성 평가기
+
+    동기 ContentAnalyzer.relevance_flow의 결정 흐름(회로 차단기, 2단계 평가, 폴백)과
+    지표를 그대로 구동하고 HTTP 요청만 비동기로 보냅니다. 호스트 선택과 호스트별 동시 요청 제한은
+    analyzer의 OllamaRouter 상태를 그대로 사용합니다.
+    """
+
+    def __init__(self, analyzer: ContentAnalyzer):
+        """
+        평가기 초기화 (실행 중인 이벤트 루프 안에서 생성해야 함)
+
+        Args:
+            analyzer: 설정/지표를 공유할 동기 분석기
+        """
+        _, httpx = _require_async_deps()
+        self._httpx = httpx
+        self.analyzer = analyzer
+        self.router = analyzer.router
+        pool = sum(ep.max_concurrency for ep in self.router.endpoints)
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=pool, max_keepalive_connections=pool)
+        )
+        self._released = asyncio.Condition()
+
+    async def close(self) -> None:
+        """HTTP 클라이언트 종료"""
+        await self.client.aclose()
+
+    async def _acquire(self, exclude: List[Any]) -> Tuple[Any, bool]:
+        """사용 가능한 호스트 선택 (없으면 다른 요청이 끝날 때까지 대기)"""
+        async with self._released:
+            while True:
+                selected = self.router.try_acquire(exclude)
+                if selected is not None:
+                    return selected
+                try:
+                    await asyncio.wait_for(self._released.wait(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _release(self, endpoint, latency: float, ok: bool, probe: bool) -> None:
+        """호스트 반환 및 대기 중인 요청 깨우기"""
+        self.router.release(endpoint, latency, ok, probe)
+        async with self._released:
+            self._released.notify_all()
+
+    async def _post(self, path: str, json: Dict[str, Any], timeout: float):
+        """선택한 호스트로 POST 요청 (OllamaRouter.post와 같은 재시도 규칙)"""
+        tried: List[Any] = []
+        last_error: Optional[Exception] = None
+
+        for _ in range(min(2, len(self.router.endpoints))):
+            endpoint, probe = await self._acquire(tried)
+            tried.append(endpoint)
+            started = time.perf_counter()
+            try:
+                response = await self.client.post(
+                    f"{endpoint.url}{path}", json=json, timeout=timeout
+                )
+                ok = response.status_code < 500
+                await self._release(endpoint, time.perf_counter() - started, ok, probe)
+                if ok or len(tried) == len(self.router.endpoints):
+                    return response
+                last_error = self._httpx.HTTPError(
+                    f"{endpoint.url} 응답 {response.status_code}"
+                )
+            except self._httpx.HTTPError as e:
+                await self._release(endpoint, time.perf_counter() - started, False, probe)
+                last_error = e
+                # httpx 예외는 메시지가 비어 있는 경우가 있어 repr로 기록
+                logger.warning("Ollama 호스트 %s 요청 실패: %r", endpoint.url, e)
+
+        raise last_error
+
+    async def analyze_relevance(
+        self,
+        post: Dict[str, Any],
+        keywords: List[str],
+        criteria: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[float, str]:
+        """
+        게시물의 관련성 분석 (ContentAnalyzer.analyze_relevance의 비동기 버전)
+
+        Returns:
+            (관련성 점수 0-1, 분석 이유)
+        """
+        # 흐름이 내보낸 요청을 비동기로 보내고 응답(또는 전송 예외)을 돌려줌
+        flow = self.analyzer.relevance_flow(post, keywords, criteria)
+        try:
+            body = next(flow)
+            while True:
+                try:
+                    response = await self._post("/api/generate", json=body, timeout=10)
+                except Exception as e:
+                    body = flow.throw(e)
+                else:
+                    body = flow.send(response)
+        except StopIteration as done:
+            return done.value
+
+
+async def search_and_score_async(
+    analyzer: ContentAnalyzer,
+    keywords: List[str],
+    subreddits: List[str],
+    limit: int,
+    deep: bool = False,
+    progress: Optional[ProgressCallback] = None,
+    on_result: Optional[ResultCallback] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    비동기로 게시물 수집 후 모든 게시물을 동시에 평가
+
+    평가 요청은 ASYNC_LLM_INFLIGHT개까지 동시에 대기하며, 실제 전송은 호스트별
+    동시 요청 한도(OLLAMA_MAX_CONCURRENCY)를 따릅니다. 결과 순서는 수집 순서와 같습니다.
+
+    Args:
+        analyzer: 설정/지표를 공유할 동기 분석기
+        keywords: 검색 키워드
+        subreddits: 검색할 서브레딧
+        limit: 가져올 게시물 수
+        deep: 심층 검색 여부
+        progress: 진행 상황 콜백
+        on_result: 게시물 하나의 평가가 끝날 때마다 호출할 콜백
+
+    Returns:
+        (수집한 게시물, 관련성 점수가 임계값 이상인 게시물)
+    """
+    reddit = AsyncRedditClient()
+    scorer = AsyncContentAnalyzer(analyzer)
+    try:
+        if deep:
+            posts = await reddit.search_posts_deep(keywords, subreddits, limit)
+        else:
+            posts = await reddit.search_posts(keywords, subreddits, limit)
+        if progress:
+            progress("fetch", len(posts), len(posts))
+
+        inflight = asyncio.Semaphore(ASYNC_CONFIG["llm_inflight"])
+        done = 0
+
+        async def _score(post: Dict[str, Any]) -> None:
+            nonlocal done
+            async with inflight:
+                score, reason = await scorer.analyze_relevance(post, keywords)
+            post["relevance_score"] = score
+            post["analysis_reason"] = reason
+            done += 1
+            if on_result:
+                on_result(post)
+            if progress:
+                progress("analyze", done, len(posts))
+
+        await asyncio.gather(*(_score(post) for post in posts))
+    finally:
+        await scorer.close()
+        await reddit.close()
+
+    threshold = FILTER_CRITERIA["min_relevance_score"]
+    filtered_posts = [p for p in posts if p["relevance_score"] >= threshold]
+    return posts, filtered_posts
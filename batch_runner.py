@@ -0,0 +1,189 @@
+"""
+배치 실행기 - 여러 검색 조합을 한 프로세스에서 처리
+"""
+
+import json
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+
+from client_registry import get_registry
+from config import SEARCH_CONFIG, BATCH_CONFIG, FILTER_CRITERIA
+from insight_summarizer import comments_loader_for
+from reddit_client import DEEP_MAX_LIMIT
+
+logger = logging.getLogger(__name__)
+
+
+def load_batch_specs(path: str) -> List[Dict[str, Any]]:
+    """
+    JSONL 파일에서 검색 스펙 목록 읽기
+
+    각 줄은 {"keywords": [...], "subreddits": [...], "limit": N, "deep": bool}
+    형식이며 keywords 외의 항목은 생략 가능합니다.
+
+    Args:
+        path: 배치 파일 경로
+
+    Returns:
+        정규화된 검색 스펙 리스트
+
+    Raises:
+        ValueError: 형식이 잘못된 줄이 있는 경우
+    """
+    specs = []
+
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            try:
+                raw = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no} JSON 형식 오류: {e}") from e
+
+            keywords = raw.get("keywords")
+            if isinstance(keywords, str):
+                keywords = [keywords]
+            if not keywords:
+                raise ValueError(f"{path}:{line_no} keywords가 비어 있습니다")
+
+            subreddits = raw.get("subreddits") or SEARCH_CONFIG["default_subreddits"]
+            if isinstance(subreddits, str):
+                subreddits = [subreddits]
+
+            deep = bool(raw.get("deep", False))
+            max_limit = DEEP_MAX_LIMIT if deep else SEARCH_CONFIG["max_limit"]
+            limit = int(raw.get("limit", SEARCH_CONFIG["default_limit"]))
+            if limit < SEARCH_CONFIG["min_limit"] or limit > max_limit:
+                raise ValueError(
+                    f"{path}:{line_no} limit은 {SEARCH_CONFIG['min_limit']} 이상 "
+                    f"{max_limit} 이하여야 합니다"
+                )
+
+            specs.append(
+                {
+                    "keywords": list(keywords),
+                    "subreddits": list(subreddits),
+                    "limit": limit,
+                    "deep": deep,
+                }
+            )
+
+    return specs
+
+
+def run_batch(
+    ui, db, specs: List[Dict[str, Any]], workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    여러 검색 스펙을 공유 클라이언트/분석기/DB로 실행
+
+    쿼리 간에 겹치는 게시물은 ID로 병합되어 한 번만 분석됩니다.
+    이때 게시물을 반환한 모든 쿼리의 키워드를 합쳐 평가합니다.
+
+    Args:
+        ui: 터미널 UI
+        db: 데이터베이스
+        specs: 검색 스펙 리스트
+        workers: 동시 분석 스레드 수 (None이면 config에서 가져옴)
+
+    Returns:
+        {"queries": 쿼리별 결과 요약, "fetched": 수집 수, "unique": 고유 게시물 수}
+    """
+    registry = get_registry()
+    reddit_client = registry.get_reddit_client()
+    analyzer = registry.get_analyzer()
+    comments_loader = comments_loader_for(reddit_client)
+    workers = workers or BATCH_CONFIG["analyze_workers"]
+
+    unique_posts: Dict[str, Dict[str, Any]] = {}  # reddit_id -> 게시물
+    post_keywords: Dict[str, List[str]] = {}  # reddit_id -> 평가 키워드
+    query_post_ids: List[List[str]] = []
+
+    with ui.show_progress("배치 실행 중...") as progress:
+        # 1단계: 모든 쿼리 수집 및 ID 기준 병합
+        task = progress.add_task("게시물 수집 중...", total=len(specs))
+        for spec in specs:
+            search = (
+                reddit_client.search_posts_deep
+                if spec["deep"]
+                else reddit_client.search_posts
+            )
+            posts = search(spec["keywords"], spec["subreddits"], spec["limit"])
+            ids = []
+            for post in posts:
+                existing = unique_posts.get(post["id"])
+                if existing is None:
+                    unique_posts[post["id"]] = post
+                    post_keywords[post["id"]] = list(spec["keywords"])
+                else:
+                    for kw in post["keywords_matched"]:
+                        if kw not in existing["keywords_matched"]:
+                            existing["keywords_matched"].append(kw)
+                    for kw in spec["keywords"]:
+                        if kw not in post_keywords[post["id"]]:
+                            post_keywords[post["id"]].append(kw)
+                ids.append(post["id"])
+            query_post_ids.append(ids)
+            progress.update(task, advance=1)
+
+        # 2단계: 고유 게시물만 병렬 분석
+        analyze_task = progress.add_task("AI 분석 중...", total=len(unique_posts))
+
+        def _score(post: Dict[str, Any]) -> None:
+            score, reason = analyzer.analyze_relevance(post, post_keywords[post["id"]])
+            post["relevance_score"] = score
+            post["analysis_reason"] = reason
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(_score, unique_posts.values()):
+                progress.update(analyze_task, advance=1)
+
+        # 3단계: 쿼리별 인사이트 추출 및 저장
+        save_task = progress.add_task("데이터 저장 중...", total=len(specs))
+        results = []
+        for spec, ids in zip(specs, query_post_ids):
+            search_id = str(uuid.uuid4())
+            posts = [unique_posts[pid] for pid in dict.fromkeys(ids)]
+            threshold = FILTER_CRITERIA["min_relevance_score"]
+            filtered_posts = [p for p in posts if p["relevance_score"] >= threshold]
+            insights = analyzer.extract_insights(
+                filtered_posts, cache=db, comments_loader=comments_loader
+            )
+
+            db.save_search(
+                search_id,
+                spec["keywords"],
+                spec["subreddits"],
+                len(posts),
+                len(filtered_posts),
+                insights,
+                heuristic_post_ids=[
+                    p["id"] for p in posts if p.get("scored_by") == "heuristic"
+                ],
+            )
+            db.save_posts(search_id, filtered_posts)
+
+            results.append(
+                {
+                    "search_id": search_id,
+                    "keywords": spec["keywords"],
+                    "subreddits": spec["subreddits"],
+                    "post_count": len(posts),
+                    "filtered_count": len(filtered_posts),
+                }
+            )
+            progress.update(save_task, advance=1)
+
+    fetched = sum(len(ids) for ids in query_post_ids)
+    logger.info(
+        "배치 완료: 쿼리 %d개, 수집 %d개, 고유 게시물 %d개 분석",
+        len(specs),
+        fetched,
+        len(unique_posts),
+    )
+    return {"queries": results, "fetched": fetched, "unique": len(unique_posts)}
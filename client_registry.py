@@ -0,0 +1,114 @@
+"""
+클라이언트 레지스트리 - 프로세스 수명 동안 재사용되는 API 클라이언트 관리
+"""
+
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from config import REDDIT_CONFIG, OLLAMA_CONFIG
+from content_analyzer import ContentAnalyzer, create_http_session
+from llm_router import OllamaRouter
+from reddit_client import RedditClient
+
+logger = logging.getLogger(__name__)
+
+
+class ClientRegistry:
+    """
+    인증된 Reddit 클라이언트와 Ollama 분석기를 캐시하는 레지스트리
+
+    PRAW 인스턴스는 OAuth 토큰을 내부적으로 보관하고 만료 시에만 갱신하므로,
+    인스턴스를 재사용하면 토큰 발급 비용도 검색마다 반복되지 않습니다.
+    Ollama 분석기는 엔드포인트 구성별 라우터(연결 풀 포함)를 공유합니다.
+    """
+
+    def __init__(self):
+        """레지스트리 초기화"""
+        self._lock = threading.Lock()
+        self._reddit_clients: Dict[Tuple[str, str, str], RedditClient] = {}
+        self._analyzers: Dict[Tuple[str, Tuple[str, ...]], ContentAnalyzer] = {}
+        self._routers: Dict[Tuple[str, ...], OllamaRouter] = {}
+
+    def get_reddit_client(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> RedditClient:
+        """
+        자격증명별 Reddit 클라이언트 조회 (없으면 생성)
+
+        Args:
+            client_id: Reddit API 클라이언트 ID
+            client_secret: Reddit API 클라이언트 시크릿
+            user_agent: User Agent 문자열
+
+        Returns:
+            캐시된 Reddit 클라이언트
+        """
+        key = (
+            client_id or REDDIT_CONFIG["client_id"],
+            client_secret or REDDIT_CONFIG["client_secret"],
+            user_agent or REDDIT_CONFIG["user_agent"],
+        )
+
+        with self._lock:
+            client = self._reddit_clients.get(key)
+            if client is None:
+                logger.info("Reddit 클라이언트 생성")
+                client = RedditClient(*key)
+                self._reddit_clients[key] = client
+            return client
+
+    def get_analyzer(
+        self, model: Optional[str] = None, ollama_url: Optional[str] = None
+    ) -> ContentAnalyzer:
+        """
+        모델/엔드포인트별 콘텐츠 분석기 조회 (없으면 생성)
+
+        Args:
+            model: 사용할 Ollama 모델
+            ollama_url: Ollama API URL (None이면 config의 urls 또는 url)
+
+        Returns:
+            캐시된 콘텐츠 분석기
+        """
+        urls = tuple(
+            [ollama_url] if ollama_url else OLLAMA_CONFIG["urls"] or [OLLAMA_CONFIG["url"]]
+        )
+        key = (model or OLLAMA_CONFIG["default_model"], urls)
+
+        with self._lock:
+            analyzer = self._analyzers.get(key)
+            if analyzer is None:
+                # 같은 엔드포인트 구성의 분석기끼리는 라우터(부하 상태, 연결 풀)를 공유
+                router = self._routers.get(urls)
+                if router is None:
+                    router = OllamaRouter(list(urls), create_http_session())
+                    if len(urls) > 1:
+                        # 응답하지 않는 호스트는 첫 요청 전에 제외 (이후 주기적으로 복구 확인)
+                        router.check_health()
+                    self._routers[urls] = router
+                analyzer = ContentAnalyzer(key[0], router=router)
+                self._analyzers[key] = analyzer
+            return analyzer
+
+    def close(self) -> None:
+        """캐시된 모든 클라이언트와 연결 풀 정리"""
+        with self._lock:
+            for router in self._routers.values():
+                router.session.close()
+            for client in self._reddit_clients.values():
+                client.close()
+            self._routers.clear()
+            self._analyzers.clear()
+            self._reddit_clients.clear()
+
+
+_registry = ClientRegistry()
+
+
+def get_registry() -> ClientRegistry:
+    """프로세스 전역 클라이언트 레지스트리 반환"""
+    return _registry
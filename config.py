@@ -13,13 +13,41 @@ REDDIT_CONFIG = {
     "client_id": os.getenv("REDDIT_CLIENT_ID", "your_client_id"),
     "client_secret": os.getenv("REDDIT_CLIENT_SECRET", "your_client_secret"),
     "user_agent": "RedditScraper/1.0 by YourUsername",
+    "listing_cache_ttl": int(os.getenv("REDDIT_LISTING_CACHE_TTL", "60")),  # 초
+}
+
+# Reddit HTTP 응답 디스크 캐시 (ETag/Last-Modified 조건부 요청 지원)
+HTTP_CACHE_CONFIG = {
+    "enabled": os.getenv("HTTP_CACHE", "true").lower() == "true",
+    "path": os.getenv("HTTP_CACHE_PATH", "reddit_http_cache.db"),
+    # 엔드포인트 종류별 TTL (초, 0이면 캐시 안 함) - 지나면 조건부 요청으로 재검증
+    "ttls": {
+        "search": int(os.getenv("HTTP_CACHE_SEARCH_TTL", "300")),
+        "listing": int(os.getenv("HTTP_CACHE_LISTING_TTL", "300")),
+        "comments": int(os.getenv("HTTP_CACHE_COMMENTS_TTL", "900")),
+    },
+    "max_age_days": int(os.getenv("HTTP_CACHE_MAX_AGE_DAYS", "7")),  # 오래된 항목 삭제 기준
 }
 
 # Ollama 설정
 OLLAMA_CONFIG = {
     "url": os.getenv("OLLAMA_URL", "http://localhost:11434"),
     "default_model": os.getenv("OLLAMA_MODEL", "gemma3:1b"),
+    # 2단계 평가: 임계값 근처 게시물을 재확인할 큰 모델 (비워두면 사용 안 함)
+    "escalation_model": os.getenv("OLLAMA_ESCALATION_MODEL", ""),
+    "escalation_band": float(os.getenv("OLLAMA_ESCALATION_BAND", "0.1")),  # 재확인할 임계값 ± 폭
+    # 응답 형식으로 JSON 스키마 전달 (Ollama 0.5 이상, false면 format="json")
+    "json_schema": os.getenv("OLLAMA_JSON_SCHEMA", "true").lower() == "true",
     "timeout": 30,
+    "pool_size": int(os.getenv("OLLAMA_POOL_SIZE", "10")),  # HTTP 연결 풀 크기
+    # 여러 Ollama 호스트 (쉼표로 구분, 비워두면 url 하나만 사용)
+    "urls": [u.strip() for u in os.getenv("OLLAMA_URLS", "").split(",") if u.strip()],
+    "max_concurrency_per_host": int(os.getenv("OLLAMA_MAX_CONCURRENCY", "4")),  # 호스트당 동시 요청 수
+    "host_failure_threshold": 3,  # 연속 오류 시 호스트 제외
+    "host_retry_interval": 30,  # 제외된 호스트 재확인 간격 (초)
+    "latency_ewma_alpha": 0.3,  # 지연 시간 이동평균 가중치
+    "breaker_failure_threshold": int(os.getenv("OLLAMA_BREAKER_THRESHOLD", "3")),  # 연속 실패 시 LLM 차단
+    "breaker_reset_seconds": int(os.getenv("OLLAMA_BREAKER_RESET", "30")),  # 차단 후 복구 확인 간격 (초)
 }
 
 # 필터링 기준
@@ -44,10 +72,42 @@ FILTER_CRITERIA = {
 }
 
 # 데이터베이스 설정
-DATABASE_CONFIG = {"path": "reddit_scraper.db", "echo": False}
+DATABASE_CONFIG = {
+    "path": "reddit_scraper.db",
+    "url": os.getenv("DATABASE_URL"),  # 예: postgresql+psycopg://user:pw@localhost/reddit (없으면 SQLite)
+    "echo": False,
+    "pool_size": int(os.getenv("DATABASE_POOL_SIZE", "10")),
+    "max_overflow": int(os.getenv("DATABASE_MAX_OVERFLOW", "20")),
+    "pool_recycle": 1800,  # 초
+    "busy_timeout": 30,  # SQLite 잠금 대기 시간 (초)
+}
+
+# 보존 정책 설정 (enabled가 False면 자동 실행하지 않음, `main.py maintain`으로 수동 실행 가능)
+RETENTION_CONFIG = {
+    "enabled": os.getenv("RETENTION_ENABLED", "false").lower() == "true",
+    "max_age_days": int(os.getenv("RETENTION_MAX_AGE_DAYS", "90")),  # 이보다 오래된 기록 보관
+    "keep_min_relevance": float(os.getenv("RETENTION_KEEP_MIN_RELEVANCE", "0.8")),  # 이 점수 이상은 유지
+    "archive_path": os.getenv("RETENTION_ARCHIVE_PATH", "reddit_scraper_archive.db"),
+    "interval_hours": int(os.getenv("RETENTION_INTERVAL_HOURS", "24")),  # 자동 실행 간격
+    "vacuum_pages": int(os.getenv("RETENTION_VACUUM_PAGES", "2000")),  # 1회 증분 VACUUM 페이지 수
+    "chunk_size": 500,  # 한 번에 옮길 행 수 (ID IN 목록이 SQLite 바인드 변수 한도 999를 넘지 않게)
+}
 
 # UI 설정
-UI_CONFIG = {"max_posts_display": 20, "max_title_length": 50, "theme": "default"}
+UI_CONFIG = {
+    "max_posts_display": 20,
+    "max_title_length": 50,
+    "theme": "default",
+    "live_top_k": int(os.getenv("LIVE_TOP_K", "10")),  # 검색 중 실시간 표에 유지할 상위 게시물 수 (0이면 표 없음)
+    "live_refresh_per_second": 4,
+}
+
+# 프로파일링 설정 (--profile, --trace-memory)
+PROFILE_CONFIG = {
+    "dir": os.getenv("PROFILE_DIR", ""),  # 보고서 저장 위치 (비워두면 DB 파일 옆 profiles/)
+    "top_n": int(os.getenv("PROFILE_TOP_N", "25")),  # 보고서에 남길 상위 함수/할당 위치 수
+    "memory_frames": 1,  # 할당 위치마다 기록할 호출 스택 깊이
+}
 
 # 검색 설정
 SEARCH_CONFIG = {
@@ -55,5 +115,63 @@ SEARCH_CONFIG = {
     "default_subreddits": ["all"], 
     "max_limit": int(os.getenv("MAX_POST_LIMIT", "1000")),
     "min_limit": int(os.getenv("MIN_POST_LIMIT", "1")),
+    "deep_workers": int(os.getenv("DEEP_SEARCH_WORKERS", "4")),  # 심층 검색 동시 요청 수
     "limit_options": list(map(int, os.getenv("POST_LIMIT_OPTIONS", "10,25,50,100,200,500").split(",")))
 }
+
+# 배치 모드 설정
+BATCH_CONFIG = {
+    "analyze_workers": int(os.getenv("BATCH_ANALYZE_WORKERS", "4")),  # 동시 분석 스레드 수
+}
+
+# 분산 작업 큐 설정
+QUEUE_CONFIG = {
+    "lease_seconds": int(os.getenv("QUEUE_LEASE_SECONDS", "300")),  # 작업 임대 시간
+    "max_attempts": int(os.getenv("QUEUE_MAX_ATTEMPTS", "3")),  # 최대 시도 횟수
+    "retry_backoff": int(os.getenv("QUEUE_RETRY_BACKOFF", "30")),  # 재시도 대기 시간 (초, 시도마다 배수 증가)
+    "analyze_batch_size": int(os.getenv("QUEUE_ANALYZE_BATCH_SIZE", "20")),  # 분석 작업당 게시물 수
+    "poll_interval": float(os.getenv("QUEUE_POLL_INTERVAL", "2")),  # 빈 큐 대기 간격 (초)
+}
+
+# 비동기 엔진 설정 (--async, asyncpraw/httpx 필요)
+ASYNC_CONFIG = {
+    "reddit_inflight": int(os.getenv("ASYNC_REDDIT_INFLIGHT", "16")),  # 동시 Reddit 검색 요청 수
+    "llm_inflight": int(os.getenv("ASYNC_LLM_INFLIGHT", "256")),  # 동시에 대기시킬 평가 요청 수
+}
+
+# 인사이트 요약 설정
+INSIGHTS_CONFIG = {
+    "chunk_size": int(os.getenv("INSIGHTS_CHUNK_SIZE", "25")),  # 청크당 평균 게시물 수
+    "reduce_fanout": 8,  # 한 번에 합칠 평균 부분 요약 수
+    "workers": int(os.getenv("INSIGHTS_WORKERS", "4")),  # 병렬 요약 스레드 수
+    "max_text_chars": 200,  # 게시물/댓글당 프롬프트에 넣을 본문 길이
+    # 댓글 포함 여부 (게시물마다 Reddit API 요청이 추가됨)
+    "include_comments": os.getenv("INSIGHTS_INCLUDE_COMMENTS", "false").lower() == "true",
+    "comments_per_post": int(os.getenv("INSIGHTS_COMMENTS_PER_POST", "3")),
+    "max_topics": 10,  # 요약 실패 시 키워드 빈도로 채울 토픽 수
+}
+
+# 토픽 클러스터링 설정 (numpy, scipy 필요)
+TOPIC_CONFIG = {
+    "enabled": os.getenv("TOPIC_CLUSTERING", "true").lower() == "true",
+    "min_posts": 10,  # 이보다 적으면 클러스터링 생략
+    "max_clusters": int(os.getenv("TOPIC_MAX_CLUSTERS", "8")),
+    "max_features": 5000,  # TF-IDF 단어 수 상한
+    "min_df": 2,  # 최소 문서 빈도
+    "max_df": 0.5,  # 이 비율 이상의 문서에 나오는 단어 제외 (검색 키워드 등)
+    "batch_size": 256,  # 미니배치 크기
+    "iterations": 30,  # 미니배치 반복 횟수
+    "merge_similarity": 0.6,  # 중심 유사도가 이 이상인 클러스터는 병합
+    "top_terms": 5,  # 클러스터당 대표 단어 수
+    "representatives": 3,  # 클러스터당 대표 게시물 수
+}
+
+# 재평가 작업 설정
+RESCORE_CONFIG = {
+    "background": os.getenv("RESCORE_BACKGROUND", "true").lower() == "true",  # 대화형 모드에서 백그라운드 실행
+    "batch_size": int(os.getenv("RESCORE_BATCH_SIZE", "20")),  # 한 번에 재평가할 게시물 수
+    "batch_delay": float(os.getenv("RESCORE_BATCH_DELAY", "1.0")),  # 배치 사이 대기 시간 (초)
+    "idle_delay": 60,  # 재평가 대상이 없거나 Ollama가 차단되었을 때 대기 시간 (초)
+    "retry_hours": float(os.getenv("RESCORE_RETRY_HOURS", "24")),  # 재평가를 시도한 게시물을 다시 시도하기까지 대기 시간
+    "include_unversioned": os.getenv("RESCORE_INCLUDE_UNVERSIONED", "false").lower() == "true",  # 버전 기록 이전 게시물 포함
+}
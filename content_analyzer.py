@@ -2,60 +2,257 @@
 콘텐츠 분석기 - Ollama를 사용한 지능형 콘텐츠 필터링
 """
 
-import json
 import subprocess
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+import time
+from collections import Counter
+from typing import List, Dict, Any, Generator, Optional, Tuple
 import requests
-from config import OLLAMA_CONFIG
+from requests.adapters import HTTPAdapter
+from config import FILTER_CRITERIA, INSIGHTS_CONFIG, OLLAMA_CONFIG, TOPIC_CONFIG
+from llm_json import (
+    RELEVANCE_SCHEMA,
+    parse_llm_json,
+    validate_relevance,
+)
+from insight_summarizer import CommentsLoader, InsightSummarizer
+from llm_router import OllamaRouter
+from topic_clusters import cluster_topics
+import traffic_archive
 
 logger = logging.getLogger(__name__)
 
+# 관련성 평가 프롬프트 버전 - 프롬프트나 점수 계산을 바꾸면 올려서 재평가 대상으로 표시
+PROMPT_VERSION = "2"
+
+# 관련성 평가 흐름: /api/generate 요청 본문을 내보내고(yield) HTTP 응답을 받아(send)
+# 최종 (점수, 이유)를 반환. 응답은 status_code와 json()이 있는 객체(requests/httpx),
+# 전송 실패는 throw()로 흐름에 전달
+RelevanceFlow = Generator[Dict[str, Any], Any, Tuple[float, str]]
+
+
+class _BreakerOpen(Exception):
+    """회로 차단 중임을 알리는 내부 예외"""
+
+
+class _InvalidOutput(ValueError):
+    """LLM 응답에서 유효한 JSON을 얻지 못했음을 알리는 내부 예외"""
+
+
+# `ollama list` 결과 캐시 (프로세스 수명 동안 유지)
+_installed_models: Optional[List[str]] = None
+_installed_models_lock = threading.Lock()
+
+
+def _query_installed_models() -> List[str]:
+    """`ollama list` 명령으로 설치된 모델 이름 조회 (실패 시 빈 리스트)"""
+    models: List[str] = []
+    try:
+        # ollama list 명령으로 설치된 모델 확인
+        result = subprocess.run(
+            ["ollama", "list"], capture_output=True, text=True, check=True
+        )
+        lines = result.stdout.strip().split("\n")
+        if len(lines) > 1:  # 헤더 제외
+            models = [line.split()[0] for line in lines[1:] if line.strip()]
+    except Exception as e:
+        logger.error("Ollama 모델 확인 실패: %s", e)
+    return models
+
+
+def list_installed_models(refresh: bool = False) -> List[str]:
+    """
+    설치된 Ollama 모델 목록 조회 (프로세스 단위 캐시)
+
+    Args:
+        refresh: True이면 캐시를 무시하고 다시 조회
+
+    Returns:
+        설치된 모델 이름 리스트 (조회 실패 시 빈 리스트)
+    """
+    global _installed_models
+
+    with _installed_models_lock:
+        if _installed_models is not None and not refresh:
+            return _installed_models
+
+        # 녹화/재생 중에는 모델 목록도 아카이브에 기록해 같은 모델로 재현
+        archive = traffic_archive.active_archive()
+        if archive is not None:
+            models = archive.value("ollama_models", _query_installed_models)
+        else:
+            models = _query_installed_models()
+
+        # 실패도 캐시하여 검색마다 프로세스를 다시 띄우지 않음
+        _installed_models = models
+        return models
+
+
+def create_http_session(pool_size: Optional[int] = None) -> requests.Session:
+    """
+    연결 풀을 사용하는 HTTP 세션 생성
+
+    Args:
+        pool_size: 호스트당 유지할 연결 수 (None이면 config에서 가져옴)
+
+    Returns:
+        keep-alive 연결을 재사용하는 requests 세션
+    """
+    size = pool_size or OLLAMA_CONFIG["pool_size"]
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return traffic_archive.mount(session)
+
+
+class CircuitBreaker:
+    """
+    연속 실패 시 LLM 호출을 차단하는 회로 차단기
+
+    failure_threshold번 연속 실패하면 열림(open) 상태가 되어 호출을 막고,
+    reset_timeout이 지나면 요청 하나만 통과시켜(half-open) 복구 여부를 확인합니다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+    ):
+        """
+        회로 차단기 초기화
+
+        Args:
+            failure_threshold: 차단까지의 연속 실패 횟수 (None이면 config에서 가져옴)
+            reset_timeout: 차단 후 복구 확인까지의 시간 (초, None이면 config에서 가져옴)
+        """
+        self.failure_threshold = failure_threshold or OLLAMA_CONFIG["breaker_failure_threshold"]
+        self.reset_timeout = reset_timeout or OLLAMA_CONFIG["breaker_reset_seconds"]
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """차단 상태 여부"""
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """LLM 호출 허용 여부 (차단 중이면 복구 확인 요청 하나만 허용)"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if not self._probing and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """호출 성공 기록 (차단 해제)"""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Ollama 복구 확인 - LLM 분석 재개")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """호출 실패 기록 (임계치 도달 또는 복구 확인 실패 시 차단)"""
+        with self._lock:
+            self._failures += 1
+            if self._probing or (
+                self._opened_at is None and self._failures >= self.failure_threshold
+            ):
+                if self._opened_at is None:
+                    logger.warning(
+                        "Ollama 연속 %d회 실패 - 규칙 기반 평가로 전환", self._failures
+                    )
+                self._opened_at = time.monotonic()
+            self._probing = False
+
 
 class ContentAnalyzer:
-    """Ollama API를 사용한 콘텐츠 분석기"""
+    """
+    Ollama API를 사용한 콘텐츠 분석기
+
+    escalation_model이 설정되면 2단계로 평가합니다. 작은 모델이 모든 게시물을 먼저
+    평가하고, 점수가 필터링 임계값 ± escalation_band 안에 드는 게시물만 큰 모델로
+    다시 평가합니다.
+    """
 
     def __init__(
-        self, model: str = None, ollama_url: str = None
+        self,
+        model: str = None,
+        ollama_url: str = None,
+        session: Optional[requests.Session] = None,
+        router: Optional[OllamaRouter] = None,
+        escalation_model: Optional[str] = None,
+        escalation_band: Optional[float] = None,
     ):
         """
         콘텐츠 분석기 초기화
 
         Args:
             model: 사용할 Ollama 모델 (None이면 config에서 가져옴)
-            ollama_url: Ollama API URL (None이면 config에서 가져옴)
+            ollama_url: Ollama API URL (None이면 config의 urls 또는 url 사용)
+            session: 재사용할 HTTP 세션 (None이면 연결 풀 세션 생성)
+            router: 재사용할 호스트 라우터 (주어지면 ollama_url/session 무시)
+            escalation_model: 애매한 게시물을 재확인할 큰 모델 (None이면 config에서 가져옴)
+            escalation_band: 재확인할 임계값 주변 점수 폭 (None이면 config에서 가져옴)
         """
         self.model = model or OLLAMA_CONFIG["default_model"]
-        self.ollama_url = ollama_url or OLLAMA_CONFIG["url"]
+        self.escalation_model = escalation_model or OLLAMA_CONFIG["escalation_model"] or None
+        self.escalation_band = (
+            escalation_band
+            if escalation_band is not None
+            else OLLAMA_CONFIG["escalation_band"]
+        )
+        self._metrics_lock = threading.Lock()
+        self.reset_metrics()
+        if router is None:
+            urls = [ollama_url] if ollama_url else OLLAMA_CONFIG["urls"] or [OLLAMA_CONFIG["url"]]
+            router = OllamaRouter(urls, session or create_http_session())
+        self.router = router
+        self.ollama_url = router.primary_url
+        self.breaker = CircuitBreaker()
         self._check_and_suggest_model()
 
     def _check_and_suggest_model(self) -> None:
         """사용 가능한 모델 확인 및 제안"""
-        try:
-            # ollama list 명령으로 설치된 모델 확인
-            result = subprocess.run(
-                ["ollama", "list"], capture_output=True, text=True, check=True
+        models = list_installed_models()
+
+        if models:
+            logger.info("설치된 Ollama 모델: %s", ", ".join(models))
+
+            # 기본 모델이 없으면 첫 번째 모델 사용
+            if self.model not in models:
+                self.model = models[0]
+                logger.info("기본 모델 '%s'로 변경", self.model)
+
+            # 재확인 모델이 없으면 1단계 평가만 수행
+            if self.escalation_model and self.escalation_model not in models:
+                logger.warning(
+                    "재확인 모델 '%s'이 설치되지 않아 2단계 평가를 끕니다", self.escalation_model
+                )
+                self.escalation_model = None
+        else:
+            logger.warning(
+                "설치된 Ollama 모델이 없습니다. 'ollama pull gemma3:1b' 실행 필요"
             )
 
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                if len(lines) > 1:  # 헤더 제외
-                    models = [line.split()[0] for line in lines[1:] if line.strip()]
-
-                    if models:
-                        logger.info("설치된 Ollama 모델: %s", ", ".join(models))
+        if self.escalation_model == self.model:
+            self.escalation_model = None
 
-                        # 기본 모델이 없으면 첫 번째 모델 사용
-                        if self.model not in models:
-                            self.model = models[0]
-                            logger.info("기본 모델 '%s'로 변경", self.model)
-                    else:
-                        logger.warning(
-                            "설치된 Ollama 모델이 없습니다. 'ollama pull gemma3:1b' 실행 필요"
-                        )
+    @property
+    def models(self) -> List[str]:
+        """평가에 쓰는 모델 목록 (1단계, 재확인 순)"""
+        return [m for m in (self.model, self.escalation_model) if m]
 
-        except Exception as e:
-            logger.error("Ollama 모델 확인 실패: %s", e)
+    def close(self) -> None:
+        """HTTP 세션 종료"""
+        self.router.session.close()
 
     def analyze_relevance(
         self,
@@ -73,8 +270,90 @@ class ContentAnalyzer:
 
         Returns:
             (관련성 점수 0-1, 분석 이유)
+
+        post["scored_by"]에 평가 방식("llm" 또는 "heuristic")을, LLM으로 평가한 경우
+        post["scored_model"], post["prompt_version"]에 모델과 프롬프트 버전을 기록합니다.
+        """
+        # 흐름이 내보낸 요청을 라우터로 보내고 응답(또는 전송 예외)을 돌려줌
+        flow = self.relevance_flow(post, keywords, criteria)
+        try:
+            body = next(flow)
+            while True:
+                try:
+                    response = self.router.post("/api/generate", json=body, timeout=10)
+                except Exception as e:
+                    body = flow.throw(e)
+                else:
+                    body = flow.send(response)
+        except StopIteration as done:
+            return done.value
+
+    def relevance_flow(
+        self,
+        post: Dict[str, Any],
+        keywords: List[str],
+        criteria: Optional[Dict[str, Any]] = None,
+    ) -> RelevanceFlow:
+        """
+        관련성 평가 결정 흐름 (회로 차단, 2단계 평가, 규칙 기반 폴백)
+
+        HTTP 전송과 분리된 제너레이터로, 동기 analyze_relevance와 비동기 엔진이 같은
+        흐름을 각자의 방식으로 전송하며 구동합니다. 호출마다 /api/generate 요청 본문을
+        내보내고, send()로 HTTP 응답을, throw()로 전송 실패를 받습니다.
+
+        Args:
+            post: Reddit 게시물 데이터
+            keywords: 관심 키워드 리스트
+            criteria: 추가 평가 기준
+
+        Returns:
+            (관련성 점수 0-1, 분석 이유) - 흐름이 끝날 때 StopIteration.value로 전달
         """
-        # 기본 평가 기준
+        default_criteria = self._relevance_criteria(criteria)
+        prompt = self._relevance_prompt(post, keywords)
+
+        try:
+            # 회로 차단 중이면 LLM 호출 없이 바로 규칙 기반 평가
+            if not self.breaker.allow():
+                raise _BreakerOpen()
+
+            # 1단계: 작은 모델로 모든 게시물 평가
+            combined_score, reason = yield from self._score_with_model(
+                "screen", self.model, prompt, post, default_criteria
+            )
+            self.breaker.record_success()
+            scored_model = self.model
+
+            # 2단계: 필터링 임계값 근처의 애매한 게시물만 큰 모델로 재확인
+            if self._should_escalate(combined_score):
+                with self._metrics_lock:
+                    self._escalated += 1
+                try:
+                    combined_score, reason = yield from self._score_with_model(
+                        "confirm", self.escalation_model, prompt, post, default_criteria
+                    )
+                    scored_model = self.escalation_model
+                except Exception as e:
+                    # 재확인에 실패하면 1단계 점수 유지
+                    logger.warning("상위 모델 재확인 실패: %s", e)
+
+            self._mark_scored(post, scored_model)
+            return combined_score, reason
+
+        except _BreakerOpen:
+            pass
+        except _InvalidOutput:
+            # Ollama는 응답했으므로 차단하지 않고 규칙 기반 평가 (재평가 대상으로 남음)
+            self.breaker.record_success()
+        except Exception as e:
+            self.breaker.record_failure()
+            logger.error("LLM 분석 실패: %s", e)
+
+        return self._heuristic_score(post, default_criteria)
+
+    @staticmethod
+    def _relevance_criteria(criteria: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """기본 평가 기준에 추가 기준 반영"""
         default_criteria = {
             "quality_indicators": [
                 "detailed",
@@ -89,9 +368,12 @@ class ContentAnalyzer:
 
         if criteria:
             default_criteria.update(criteria)
+        return default_criteria
 
-        # LLM 프롬프트 구성
-        prompt = f"""
+    @staticmethod
+    def _relevance_prompt(post: Dict[str, Any], keywords: List[str]) -> str:
+        """관련성 평가 LLM 프롬프트 구성"""
+        return f"""
         Analyze this Reddit post for relevance and quality.
         
         Keywords of interest: {', '.join(keywords)}
@@ -116,146 +398,289 @@ class ContentAnalyzer:
         }}
         """
 
-        try:
-            # Ollama API 호출
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "format": "json",
-                },
-                timeout=10,
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                raw_response = result.get("response", "{}")
-                
-                # JSON 파싱 시도
-                try:
-                    # 응답에서 실제 JSON 부분만 추출
-                    start_idx = raw_response.find("{")
-                    end_idx = raw_response.rfind("}") + 1
-                    
-                    if start_idx != -1 and end_idx > start_idx:
-                        json_str = raw_response[start_idx:end_idx]
-                        analysis = json.loads(json_str)
-                    else:
-                        # JSON 형태가 아니면 기본값 사용
-                        analysis = {
-                            "relevance_score": 0.5,
-                            "quality_score": 0.5,
-                            "reason": "JSON 파싱 실패"
-                        }
-                        
-                except json.JSONDecodeError as json_err:
-                    logger.warning("JSON 파싱 실패, 원본 응답: %s", raw_response[:200])
-                    analysis = {
-                        "relevance_score": 0.5,
-                        "quality_score": 0.5,
-                        "reason": "JSON 파싱 오류"
-                    }
-
-                # 종합 점수 계산
-                relevance = analysis.get("relevance_score", 0.5)
-                quality = analysis.get("quality_score", 0.5)
-                combined_score = relevance * 0.7 + quality * 0.3
-
-                # 커뮤니티 참여도 고려
-                if post["score"] >= default_criteria["min_score"]:
-                    combined_score += 0.1
-                if post["num_comments"] >= default_criteria["min_comments"]:
-                    combined_score += 0.1
-
-                combined_score = min(combined_score, 1.0)
-
-                return combined_score, analysis.get("reason", "분석 완료")
-
-        except Exception as e:
-            logger.error("LLM 분석 실패: %s", e)
+    @staticmethod
+    def _mark_scored(post: Dict[str, Any], model: Optional[str]) -> None:
+        """평가 방식/모델/프롬프트 버전 기록 (model이 None이면 규칙 기반)"""
+        post["scored_by"] = "llm" if model else "heuristic"
+        post["scored_model"] = model
+        post["prompt_version"] = PROMPT_VERSION if model else None
 
-        # 폴백: 간단한 규칙 기반 평가
+    def _heuristic_score(
+        self, post: Dict[str, Any], criteria: Dict[str, Any]
+    ) -> Tuple[float, str]:
+        """폴백: 간단한 규칙 기반 평가"""
         score = 0.5
         matched_keywords = len(post.get("keywords_matched", []))
 
         if matched_keywords > 0:
             score += 0.2 * matched_keywords
-        if post["score"] >= default_criteria["min_score"]:
+        if post["score"] >= criteria["min_score"]:
             score += 0.1
-        if post["num_comments"] >= default_criteria["min_comments"]:
+        if post["num_comments"] >= criteria["min_comments"]:
             score += 0.1
 
+        self._mark_scored(post, None)
         return min(score, 1.0), f"키워드 {matched_keywords}개 일치"
 
-    def extract_insights(self, posts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _relevance_request(self, model: str, prompt: str) -> Dict[str, Any]:
+        """관련성 평가 /api/generate 요청 본문"""
+        return {
+            "model": model,
+            "prompt": prompt,
+            "stream": False,
+            "format": self._response_format(RELEVANCE_SCHEMA),
+        }
+
+    def _score_with_model(
+        self,
+        tier: str,
+        model: str,
+        prompt: str,
+        post: Dict[str, Any],
+        criteria: Dict[str, Any],
+    ) -> RelevanceFlow:
         """
-        게시물 목록에서 주요 인사이트 추출
+        지정한 모델로 관련성 평가 한 번 수행 (요청 본문을 내보내고 응답을 받는 하위 흐름)
 
         Args:
-            posts: 분석할 게시물 리스트
+            tier: 단계 이름 ("screen" 또는 "confirm", 지연 시간 집계용)
+            model: 사용할 Ollama 모델
+            prompt: 평가 프롬프트
+            post: Reddit 게시물 데이터
+            criteria: 평가 기준
 
         Returns:
-            추출된 인사이트
+            (관련성 점수 0-1, 분석 이유)
+
+        Raises:
+            requests.HTTPError: 200이 아닌 응답 (전송 실패는 throw()로 받은 예외가 그대로 전파)
+            _InvalidOutput: 응답에서 유효한 평가 결과를 얻지 못한 경우
         """
-        if not posts:
-            return {"summary": "분석할 게시물이 없습니다.", "trends": [], "topics": []}
+        started = time.perf_counter()
+        response = yield self._relevance_request(model, prompt)
+        self._record_latency(tier, time.perf_counter() - started)
 
-        # 상위 5개 게시물로 요약 생성
-        top_posts = sorted(
-            posts, key=lambda x: x.get("relevance_score", 0), reverse=True
-        )[:5]
+        if response.status_code != 200:
+            raise requests.HTTPError(f"Ollama 응답 {response.status_code}")
+        return self._score_response(response.json(), post, criteria)
 
-        titles = [p["title"] for p in top_posts]
-        prompt = f"""
-        Analyze these Reddit post titles and extract key insights:
-        
-        {chr(10).join(f"{i+1}. {title}" for i, title in enumerate(titles))}
-        
-        Provide:
-        1. Main trends or patterns
-        2. Common topics discussed
-        3. Brief summary of community interest
-        
-        Respond in JSON format.
+    def _score_response(
+        self, result: Dict[str, Any], post: Dict[str, Any], criteria: Dict[str, Any]
+    ) -> Tuple[float, str]:
+        """
+        /api/generate 응답을 종합 점수로 변환
+
+        Raises:
+            _InvalidOutput: 응답에서 유효한 평가 결과를 얻지 못한 경우
+        """
+        raw_response = result.get("response", "{}")
+
+        analysis = self._parse_response(raw_response, validate_relevance)
+        if analysis is None:
+            raise _InvalidOutput("관련성 평가 응답 파싱 실패")
+
+        # 종합 점수 계산 (점수는 검증 단계에서 0-1로 보정됨)
+        relevance = analysis["relevance_score"]
+        quality = analysis["quality_score"]
+        combined_score = relevance * 0.7 + quality * 0.3
+
+        # 커뮤니티 참여도 고려
+        if post["score"] >= criteria["min_score"]:
+            combined_score += 0.1
+        if post["num_comments"] >= criteria["min_comments"]:
+            combined_score += 0.1
+
+        return min(combined_score, 1.0), analysis["reason"]
+
+    def _response_format(self, schema: Dict[str, Any]) -> Any:
+        """Ollama format 파라미터 (JSON 스키마 지원 여부에 따라 스키마 또는 "json")"""
+        return schema if OLLAMA_CONFIG["json_schema"] else "json"
+
+    def _parse_response(self, raw_response: str, validate) -> Optional[Dict[str, Any]]:
+        """
+        LLM 응답 파싱 및 검증 (잘린 출력 복구, 파싱 성공/실패 집계)
+
+        Args:
+            raw_response: LLM 원본 출력
+            validate: 파싱된 객체를 검증/정규화하는 함수
+
+        Returns:
+            검증된 응답 (실패 시 None)
+        """
+        data, repaired = parse_llm_json(raw_response)
+        result = validate(data)
+
+        with self._metrics_lock:
+            if result is None:
+                self._parse_stats["failed"] += 1
+            elif repaired:
+                self._parse_stats["repaired"] += 1
+            else:
+                self._parse_stats["ok"] += 1
+
+        if result is None:
+            logger.warning("LLM 응답 파싱 실패, 원본 응답: %s", raw_response[:200])
+        elif repaired:
+            logger.debug("잘린 LLM 응답 복구: %s", raw_response[-80:])
+        return result
+
+    def parse_metrics(self) -> Dict[str, Any]:
+        """
+        LLM 응답 파싱 지표
+
+        Returns:
+            정상/복구/실패 응답 수와 실패율
+        """
+        with self._metrics_lock:
+            stats = dict(self._parse_stats)
+        total = sum(stats.values())
+        stats["total"] = total
+        stats["failure_rate"] = stats["failed"] / total if total else 0.0
+        return stats
+
+    def _should_escalate(self, score: float) -> bool:
+        """상위 모델 재확인 대상 여부 (임계값 ± escalation_band 안의 점수)"""
+        if not self.escalation_model:
+            return False
+        threshold = FILTER_CRITERIA["min_relevance_score"]
+        return abs(score - threshold) <= self.escalation_band
+
+    def _record_latency(self, tier: str, latency: float) -> None:
+        """단계별 호출 수/지연 시간 누적"""
+        with self._metrics_lock:
+            stats = self._tier_stats[tier]
+            stats[0] += 1
+            stats[1] += latency
+
+    def cascade_metrics(self) -> Dict[str, Any]:
+        """
+        2단계 평가 지표
+
+        Returns:
+            상위 모델 사용 여부, 평가/재확인 게시물 수, 재확인 비율,
+            단계별 모델/호출 수/평균 지연 시간(초)
         """
+        with self._metrics_lock:
+            screened = self._tier_stats["screen"][0]
+            tiers = []
+            for tier, model in (("screen", self.model), ("confirm", self.escalation_model)):
+                calls, total = self._tier_stats[tier]
+                if model:
+                    tiers.append(
+                        {
+                            "tier": tier,
+                            "model": model,
+                            "calls": calls,
+                            "avg_latency": total / calls if calls else 0.0,
+                        }
+                    )
+            return {
+                "enabled": bool(self.escalation_model),
+                "screened": screened,
+                "escalated": self._escalated,
+                "escalation_rate": self._escalated / screened if screened else 0.0,
+                "tiers": tiers,
+            }
+
+    def average_latency(self) -> float:
+        """관련성 평가 1차 모델 호출의 평균 지연 시간(초, 호출이 없으면 0)"""
+        with self._metrics_lock:
+            calls, total = self._tier_stats["screen"]
+        return total / calls if calls else 0.0
+
+    def reset_metrics(self) -> None:
+        """2단계 평가/응답 파싱 지표 초기화 (검색마다 새로 집계할 때 사용)"""
+        with self._metrics_lock:
+            self._tier_stats = {"screen": [0, 0.0], "confirm": [0, 0.0]}
+            self._escalated = 0
+            self._parse_stats = {"ok": 0, "repaired": 0, "failed": 0}
+
+    def generate_json(
+        self, prompt: str, schema: Dict[str, Any], validate
+    ) -> Optional[Dict[str, Any]]:
+        """
+        기본 모델로 JSON 응답 생성 (회로 차단/응답 파싱 포함)
 
+        Args:
+            prompt: 프롬프트
+            schema: 응답 JSON 스키마
+            validate: 파싱된 객체를 검증/정규화하는 함수
+
+        Returns:
+            검증된 응답 (차단 중이거나 실패하면 None)
+        """
         try:
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
+            if not self.breaker.allow():
+                return None
+
+            response = self.router.post(
+                "/api/generate",
                 json={
-                    "model": self.model, 
-                    "prompt": prompt, 
+                    "model": self.model,
+                    "prompt": prompt,
                     "stream": False,
-                    "format": "json"
+                    "format": self._response_format(schema),
                 },
-                timeout=10,
+                timeout=OLLAMA_CONFIG["timeout"],
             )
 
-            if response.status_code == 200:
-                result = response.json()
-                raw_response = result.get("response", "{}")
-                
-                try:
-                    # JSON 부분 추출 및 파싱
-                    start_idx = raw_response.find("{")
-                    end_idx = raw_response.rfind("}") + 1
-                    
-                    if start_idx != -1 and end_idx > start_idx:
-                        json_str = raw_response[start_idx:end_idx]
-                        return json.loads(json_str)
-                    
-                except json.JSONDecodeError:
-                    logger.warning("인사이트 JSON 파싱 실패")
+            if response.status_code != 200:
+                self.breaker.record_failure()
+                return None
+
+            self.breaker.record_success()
+            return self._parse_response(response.json().get("response", "{}"), validate)
 
         except Exception as e:
-            logger.error("인사이트 추출 실패: %s", e)
+            self.breaker.record_failure()
+            logger.error("LLM 요청 실패: %s", e)
+            return None
 
-        return {
-            "summary": "상위 게시물 분석 완료",
-            "trends": [f"{len(posts)}개 게시물 발견"],
-            "topics": list(
-                set(kw for p in posts for kw in p.get("keywords_matched", []))
-            ),
-        }
+    def extract_insights(
+        self,
+        posts: List[Dict[str, Any]],
+        cache=None,
+        comments_loader: Optional[CommentsLoader] = None,
+    ) -> Dict[str, Any]:
+        """
+        게시물 목록에서 주요 인사이트 추출
+
+        모든 게시물을 청크로 나누어 병렬 요약한 뒤 부분 요약을 다시 합쳐
+        트렌드/토픽을 만듭니다 (insight_summarizer 참고). 게시물이 충분하면
+        TF-IDF 토픽 클러스터를 "clusters"에 함께 담습니다 (topic_clusters 참고).
+
+        Args:
+            posts: 분석할 게시물 리스트
+            cache: 청크 요약 캐시로 쓸 Database (None이면 캐시 없이 요약)
+            comments_loader: 게시물 ID -> 댓글 리스트 함수 (주어지면 댓글도 요약에 포함)
+
+        Returns:
+            추출된 인사이트
+        """
+        if not posts:
+            return {"summary": "분석할 게시물이 없습니다.", "trends": [], "topics": []}
+
+        # 로컬 TF-IDF 토픽 클러스터 (LLM 없이 계산, NumPy/SciPy 필요)
+        clusters = cluster_topics(posts) if TOPIC_CONFIG["enabled"] else None
+
+        insights = InsightSummarizer(self, cache, comments_loader).summarize(posts)
+        if insights is None:
+            if clusters:
+                topics = [" / ".join(c["terms"][:2]) for c in clusters if c["terms"]]
+            else:
+                # 가장 많이 일치한 키워드 순 (Counter.most_common은 힙으로 상위 N개만 선택)
+                keyword_counts = Counter(
+                    kw for p in posts for kw in p.get("keywords_matched", [])
+                )
+                topics = [
+                    kw for kw, _ in keyword_counts.most_common(INSIGHTS_CONFIG["max_topics"])
+                ]
+            insights = {
+                "summary": "상위 게시물 분석 완료",
+                "trends": [f"{len(posts)}개 게시물 발견"],
+                "topics": topics,
+            }
+
+        if clusters:
+            insights["clusters"] = clusters
+        return insights
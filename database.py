@@ -3,9 +3,10 @@
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from sqlalchemy import (
     create_engine,
+    event,
     Column,
     Integer,
     String,
@@ -13,12 +14,29 @@ from sqlalchemy import (
     DateTime,
     Text,
     JSON,
+    Index,
+    UniqueConstraint,
+    and_,
+    or_,
+    func,
+    inspect,
+    update,
 )
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from config import DATABASE_CONFIG
+
 Base = declarative_base()
 
+# PostgreSQL에서는 JSONB, 그 외에는 일반 JSON
+JSONType = JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+# 문장 하나에 넣을 최대 바인드 변수 수 - SQLite 3.32 이전 빌드의 기본 한도
+# (3.32 이후는 32766, PostgreSQL은 65535). 다중 행 INSERT와 IN 목록은 이 한도에 맞춰 나눔
+MAX_BIND_VARIABLES = 999
+
 
 class SearchRecord(Base):
     """검색 기록 테이블"""
@@ -27,12 +45,13 @@ class SearchRecord(Base):
 
     id = Column(Integer, primary_key=True)
     search_id = Column(String(50), unique=True)
-    keywords = Column(JSON)  # 검색 키워드 리스트
-    subreddits = Column(JSON)  # 검색한 서브레딧 리스트
+    keywords = Column(JSONType)  # 검색 키워드 리스트
+    subreddits = Column(JSONType)  # 검색한 서브레딧 리스트
     created_at = Column(DateTime, default=datetime.utcnow)
     post_count = Column(Integer)
     filtered_count = Column(Integer)  # 필터링 후 게시물 수
-    insights = Column(JSON)  # AI가 추출한 인사이트
+    insights = Column(JSONType)  # AI가 추출한 인사이트
+    heuristic_post_ids = Column(JSONType)  # LLM 대신 규칙 기반으로 평가된 게시물 ID (재평가 대상)
 
 
 class PostRecord(Base):
@@ -54,23 +73,188 @@ class PostRecord(Base):
     permalink = Column(Text)
     relevance_score = Column(Float)  # AI 분석 점수
     analysis_reason = Column(Text)  # AI 분석 이유
-    keywords_matched = Column(JSON)
+    scored_by = Column(String(20))  # 평가 방식 (llm, heuristic)
+    scored_model = Column(String(100))  # 평가에 사용한 LLM 모델
+    prompt_version = Column(String(20))  # 평가 프롬프트 버전
+    rescore_attempted_at = Column(DateTime)  # 마지막 재평가 시도 시각
+    keywords_matched = Column(JSONType)
     saved_at = Column(DateTime, default=datetime.utcnow)
 
+    # 키셋 페이지네이션 (relevance_score, id) 정렬용 인덱스
+    # saved_at까지 포함해 기간 조건도 테이블을 읽지 않고 인덱스에서 거름
+    __table_args__ = (
+        Index("ix_post_records_relevance_id_saved", "relevance_score", "id", "saved_at"),
+        Index("ix_post_records_search_relevance_id", "search_id", "relevance_score", "id"),
+    )
+
+
+class TrendRollup(Base):
+    """일별 (서브레딧, 키워드) 집계 테이블 - save_posts와 같은 트랜잭션에서 갱신"""
+
+    __tablename__ = "trend_rollups"
+
+    id = Column(Integer, primary_key=True)
+    day = Column(String(10))  # 게시물 작성일 (YYYY-MM-DD)
+    subreddit = Column(String(100))
+    keyword = Column(String(200))  # 일치 키워드 (없으면 빈 문자열)
+    post_count = Column(Integer, default=0)
+    relevance_sum = Column(Float, default=0.0)
+    score_sum = Column(Integer, default=0)
+    comments_sum = Column(Integer, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("day", "subreddit", "keyword", name="uq_trend_rollups_key"),
+    )
+
+
+class MaintenanceRun(Base):
+    """보존 정책/압축 실행 기록 테이블"""
+
+    __tablename__ = "maintenance_runs"
+
+    id = Column(Integer, primary_key=True)
+    ran_at = Column(DateTime, default=datetime.utcnow)
+    archived_posts = Column(Integer, default=0)
+    archived_searches = Column(Integer, default=0)
+
+
+class QueueTask(Base):
+    """분산 작업 큐 테이블 (임대/재시도 지원)"""
+
+    __tablename__ = "queue_tasks"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(20))  # fetch, analyze, finalize
+    search_id = Column(String(50))
+    dedupe_key = Column(String(100), unique=True)  # 중복 등록 방지 키 (선택)
+    payload = Column(JSONType)
+    status = Column(String(10), default="pending")  # pending, leased, done, failed
+    attempts = Column(Integer, default=0)
+    lease_owner = Column(String(100))
+    lease_expires_at = Column(DateTime)
+    available_at = Column(DateTime, default=datetime.utcnow)
+    result = Column(JSONType)
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_queue_tasks_status_available", "status", "available_at"),
+        Index("ix_queue_tasks_search_kind", "search_id", "kind"),
+    )
+
+
+class SummaryCache(Base):
+    """인사이트 청크/중간 요약 캐시 (입력 게시물 ID와 모델로 만든 키 기준)"""
+
+    __tablename__ = "summary_cache"
+
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(64), unique=True)
+    summary = Column(JSONType)  # summary/trends/topics
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+def create_db_engine(url: str):
+    """
+    백엔드별로 조정된 SQLAlchemy 엔진 생성
+
+    SQLite는 WAL 모드와 잠금 대기 시간을 설정해 읽기와 쓰기가 서로 막지 않게 하고,
+    PostgreSQL 등 서버형 DB는 연결 풀 크기와 연결 재확인 옵션을 적용합니다.
+
+    Args:
+        url: SQLAlchemy 접속 URL
+
+    Returns:
+        엔진
+    """
+    echo = DATABASE_CONFIG["echo"]
+    if url.startswith("sqlite"):
+        engine = create_engine(
+            url, echo=echo, connect_args={"timeout": DATABASE_CONFIG["busy_timeout"]}
+        )
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_conn, _record):
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+
+        return engine
+
+    return create_engine(
+        url,
+        echo=echo,
+        pool_size=DATABASE_CONFIG["pool_size"],
+        max_overflow=DATABASE_CONFIG["max_overflow"],
+        pool_recycle=DATABASE_CONFIG["pool_recycle"],
+        pool_pre_ping=True,
+    )
+
+
+def add_missing_columns(engine, metadata) -> None:
+    """
+    기존 테이블에 모델에 새로 추가된 컬럼 생성 (create_all은 컬럼을 추가하지 않음)
+
+    Args:
+        engine: 대상 엔진
+        metadata: 테이블 정의 (create_all 이후 호출)
+    """
+    inspector = inspect(engine)
+    for table in metadata.sorted_tables:
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_type = column.type.compile(dialect=engine.dialect)
+            with engine.begin() as conn:
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                )
+
+
+def _chunks(items: List[Any], columns: int = 1, reserved: int = 0) -> Iterator[List[Any]]:
+    """
+    바인드 변수 한도에 맞춰 나눈 조각
+
+    Args:
+        items: 나눌 행 또는 IN 목록 값
+        columns: 항목 하나가 쓰는 바인드 변수 수 (INSERT는 컬럼 수, IN 목록은 1)
+        reserved: 같은 문장의 다른 바인드 변수 수 (예: UPDATE의 SET 값)
+    """
+    size = max(1, (MAX_BIND_VARIABLES - reserved) // columns)
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _dialect_insert(session):
+    """세션 백엔드에 맞는 INSERT 구성자 (ON CONFLICT 지원)"""
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
 
 class Database:
     """데이터베이스 관리 클래스"""
 
-    def __init__(self, db_path: str = "reddit_scraper.db"):
+    def __init__(self, db_path: str = "reddit_scraper.db", url: Optional[str] = None):
         """
         데이터베이스 초기화
 
         Args:
             db_path: SQLite 데이터베이스 파일 경로
+            url: SQLAlchemy 접속 URL (예: postgresql+psycopg://user:pw@host/db).
+                None이면 config의 DATABASE_URL, 그것도 없으면 db_path의 SQLite 사용
         """
-        self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        self.engine = create_db_engine(url or DATABASE_CONFIG["url"] or f"sqlite:///{db_path}")
         Base.metadata.create_all(self.engine)
+        add_missing_columns(self.engine, Base.metadata)
+        # create_all은 기존 테이블에 새 인덱스를 추가하지 않으므로 개별 생성
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
         self.session_local = sessionmaker(bind=self.engine)
+        self._backfill_trends()
 
     def save_search(
         self,
@@ -80,6 +264,7 @@ class Database:
         post_count: int,
         filtered_count: int,
         insights: Dict[str, Any],
+        heuristic_post_ids: Optional[List[str]] = None,
     ) -> None:
         """
         검색 기록 저장
@@ -91,6 +276,7 @@ class Database:
             post_count: 전체 게시물 수
             filtered_count: 필터링된 게시물 수
             insights: AI 인사이트
+            heuristic_post_ids: 규칙 기반으로 평가된 게시물 ID (나중에 재평가)
         """
         with self.session_local() as session:
             record = SearchRecord(
@@ -100,6 +286,7 @@ class Database:
                 post_count=post_count,
                 filtered_count=filtered_count,
                 insights=insights,
+                heuristic_post_ids=heuristic_post_ids or [],
             )
             session.add(record)
             session.commit()
@@ -112,33 +299,320 @@ class Database:
             search_id: 검색 ID
             posts: 저장할 게시물 리스트
         """
+        # 같은 호출 안의 중복 ID 제거 (먼저 나온 게시물 우선)
+        unique_posts = list({post["id"]: post for post in reversed(posts)}.values())[::-1]
+        saved_at = datetime.utcnow()
+        rows = [
+            {
+                "search_id": search_id,
+                "reddit_id": post["id"],
+                "title": post["title"],
+                "author": post["author"],
+                "subreddit": post["subreddit"],
+                "content": post["text"],
+                "url": post["url"],
+                "score": post["score"],
+                "num_comments": post["num_comments"],
+                "created_utc": post["created_utc"],
+                "permalink": post["permalink"],
+                "relevance_score": post.get("relevance_score", 0.0),
+                "analysis_reason": post.get("analysis_reason", ""),
+                "keywords_matched": post.get("keywords_matched", []),
+                "scored_by": post.get("scored_by"),
+                "scored_model": post.get("scored_model"),
+                "prompt_version": post.get("prompt_version"),
+                "saved_at": saved_at,
+            }
+            for post in unique_posts
+        ]
+
         with self.session_local() as session:
-            for post in posts:
-                # 중복 확인
-                existing = (
-                    session.query(PostRecord).filter_by(reddit_id=post["id"]).first()
+            insert = _dialect_insert(session)
+            inserted = set()
+            for chunk in _chunks(rows, len(rows[0]) if rows else 1):
+                # 이미 저장된 게시물은 건너뛰고 실제로 삽입된 ID만 돌려받음
+                stmt = (
+                    insert(PostRecord)
+                    .values(chunk)
+                    .on_conflict_do_nothing(index_elements=["reddit_id"])
+                    .returning(PostRecord.reddit_id)
                 )
+                inserted.update(session.execute(stmt).scalars())
 
-                if not existing:
-                    record = PostRecord(
-                        search_id=search_id,
-                        reddit_id=post["id"],
-                        title=post["title"],
-                        author=post["author"],
-                        subreddit=post["subreddit"],
-                        content=post["text"],
-                        url=post["url"],
-                        score=post["score"],
-                        num_comments=post["num_comments"],
-                        created_utc=post["created_utc"],
-                        permalink=post["permalink"],
-                        relevance_score=post.get("relevance_score", 0.0),
-                        analysis_reason=post.get("analysis_reason", ""),
-                        keywords_matched=post.get("keywords_matched", []),
-                    )
-                    session.add(record)
+            # 새로 저장된 게시물만 집계에 반영 (같은 트랜잭션)
+            self._apply_rollups(session, [r for r in rows if r["reddit_id"] in inserted])
+            session.commit()
+
+    def update_scores(self, updates: List[Dict[str, Any]]) -> None:
+        """
+        재평가된 게시물 점수 일괄 갱신 (트렌드 집계 관련성 합계도 함께 보정)
+
+        Args:
+            updates: 게시물별 갱신 값. id, relevance_score, analysis_reason, scored_by,
+                scored_model, prompt_version과 집계 보정용 old_relevance_score,
+                created_utc, subreddit, keywords_matched를 포함
+        """
+        if not updates:
+            return
+
+        columns = (
+            "id",
+            "relevance_score",
+            "analysis_reason",
+            "scored_by",
+            "scored_model",
+            "prompt_version",
+        )
+        with self.session_local() as session:
+            # 기본 키 기준 ORM 일괄 UPDATE (executemany)
+            session.execute(
+                update(PostRecord), [{c: u[c] for c in columns} for u in updates]
+            )
+            self._apply_rollups(
+                session,
+                [
+                    {
+                        "created_utc": u["created_utc"],
+                        "subreddit": u["subreddit"],
+                        "keywords_matched": u["keywords_matched"],
+                        "relevance_score": u["relevance_score"]
+                        - (u["old_relevance_score"] or 0.0),
+                        "score": 0,
+                        "num_comments": 0,
+                    }
+                    for u in updates
+                ],
+                count_rows=False,
+            )
+            session.commit()
+
+    def mark_rescore_attempted(self, ids: List[int]) -> None:
+        """
+        재평가를 시도한 게시물의 시도 시각 기록 (성공 여부와 관계없이)
+
+        Args:
+            ids: 게시물 기본 키 리스트
+        """
+        if not ids:
+            return
+        with self.session_local() as session:
+            now = datetime.utcnow()
+            for chunk in _chunks(ids, reserved=1):
+                session.execute(
+                    update(PostRecord)
+                    .where(PostRecord.id.in_(chunk))
+                    .values(rescore_attempted_at=now)
+                )
+            session.commit()
+
+    def get_cached_summaries(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        캐시된 요약 조회
+
+        Args:
+            keys: 캐시 키 리스트
+
+        Returns:
+            캐시 키 -> 요약 (없는 키는 제외)
+        """
+        if not keys:
+            return {}
+
+        found: Dict[str, Dict[str, Any]] = {}
+        with self.session_local() as session:
+            for chunk in _chunks(keys):
+                rows = session.query(SummaryCache.cache_key, SummaryCache.summary).filter(
+                    SummaryCache.cache_key.in_(chunk)
+                )
+                found.update({key: summary for key, summary in rows})
+        return found
+
+    def save_cached_summaries(self, summaries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        요약 캐시 저장 (이미 있는 키는 유지)
+
+        Args:
+            summaries: 캐시 키 -> 요약
+        """
+        if not summaries:
+            return
+
+        now = datetime.utcnow()
+        rows = [
+            {"cache_key": key, "summary": summary, "created_at": now}
+            for key, summary in summaries.items()
+        ]
+        with self.session_local() as session:
+            insert = _dialect_insert(session)
+            for chunk in _chunks(rows, len(rows[0])):
+                session.execute(
+                    insert(SummaryCache)
+                    .values(chunk)
+                    .on_conflict_do_nothing(index_elements=["cache_key"])
+                )
+            session.commit()
+
+    @staticmethod
+    def _apply_rollups(
+        session, rows: List[Dict[str, Any]], count_rows: bool = True
+    ) -> None:
+        """
+        게시물 행을 일별 (서브레딧, 키워드) 집계에 더하기
+
+        ON CONFLICT 증분 업서트로 처리하므로 여러 프로세스가 동시에 저장해도
+        집계가 어긋나지 않습니다.
+
+        Args:
+            session: 진행 중인 세션 (커밋은 호출자가 수행)
+            rows: PostRecord 컬럼명 -> 값 딕셔너리 리스트
+            count_rows: False면 게시물 수는 늘리지 않고 합계만 보정
+        """
+        deltas: Dict[Tuple[str, str, str], List[float]] = {}
+        for row in rows:
+            day = (row["created_utc"] or datetime.utcnow()).strftime("%Y-%m-%d")
+            for keyword in set(row["keywords_matched"] or []) or {""}:
+                delta = deltas.setdefault((day, row["subreddit"], keyword), [0, 0.0, 0, 0])
+                delta[0] += 1 if count_rows else 0
+                delta[1] += row["relevance_score"] or 0.0
+                delta[2] += row["score"] or 0
+                delta[3] += row["num_comments"] or 0
+
+        if not deltas:
+            return
+
+        values = [
+            {
+                "day": day,
+                "subreddit": subreddit,
+                "keyword": keyword,
+                "post_count": count,
+                "relevance_sum": relevance,
+                "score_sum": score,
+                "comments_sum": comments,
+            }
+            for (day, subreddit, keyword), (count, relevance, score, comments) in deltas.items()
+        ]
+        insert = _dialect_insert(session)
+        for chunk in _chunks(values, len(values[0])):
+            stmt = insert(TrendRollup).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["day", "subreddit", "keyword"],
+                set_={
+                    name: getattr(TrendRollup, name) + getattr(stmt.excluded, name)
+                    for name in ("post_count", "relevance_sum", "score_sum", "comments_sum")
+                },
+            )
+            session.execute(stmt)
+
+    def _backfill_trends(self) -> None:
+        """집계 테이블이 비어 있고 게시물이 있으면 기존 게시물로 한 번 채우기"""
+        with self.session_local() as session:
+            if session.query(TrendRollup.id).first() is not None:
+                return
+            if session.query(PostRecord.id).first() is None:
+                return
+
+            query = session.query(
+                PostRecord.created_utc,
+                PostRecord.subreddit,
+                PostRecord.keywords_matched,
+                PostRecord.relevance_score,
+                PostRecord.score,
+                PostRecord.num_comments,
+            ).yield_per(1000)
+            batch = []
+            for record in query:
+                batch.append(record._asdict())
+                if len(batch) >= 1000:
+                    self._apply_rollups(session, batch)
+                    batch = []
+            self._apply_rollups(session, batch)
             session.commit()
 
+    def get_trends(
+        self,
+        days: int = 30,
+        subreddit: Optional[str] = None,
+        keyword: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        최근 N일간 (서브레딧, 키워드)별 트렌드 조회 - 집계 테이블만 읽음
+
+        (서브레딧, 키워드)별 합계와 상위 limit개 선택은 DB에서 GROUP BY/LIMIT로 처리하고,
+        일별 추이는 선택된 조합의 행만 읽습니다.
+
+        Args:
+            days: 조회 기간 (일, 게시물 작성일 기준)
+            subreddit: 특정 서브레딧만 조회 (None이면 전체)
+            keyword: 특정 키워드만 조회 (None이면 전체)
+            limit: 게시물 수 상위 몇 개 조합만 조회할지 (None이면 전체)
+
+        Returns:
+            게시물 수 내림차순 (서브레딧, 키워드)별 게시물 수와 평균 지표, 일별 게시물 수 리스트
+        """
+        cutoff_day = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+        filters = [TrendRollup.day >= cutoff_day]
+        if subreddit:
+            filters.append(func.lower(TrendRollup.subreddit) == subreddit.lower())
+        if keyword:
+            filters.append(func.lower(TrendRollup.keyword) == keyword.lower())
+
+        with self.session_local() as session:
+            post_count = func.sum(TrendRollup.post_count)
+            groups = (
+                session.query(
+                    TrendRollup.subreddit,
+                    TrendRollup.keyword,
+                    post_count.label("post_count"),
+                    func.sum(TrendRollup.relevance_sum).label("relevance_sum"),
+                    func.sum(TrendRollup.score_sum).label("score_sum"),
+                    func.sum(TrendRollup.comments_sum).label("comments_sum"),
+                )
+                .filter(*filters)
+                .group_by(TrendRollup.subreddit, TrendRollup.keyword)
+                .order_by(
+                    post_count.desc(), TrendRollup.subreddit, TrendRollup.keyword
+                )
+            )
+            if limit is not None:
+                groups = groups.limit(limit)
+
+            trends: Dict[Tuple[str, str], Dict[str, Any]] = {}
+            for g in groups:
+                count = g.post_count or 0
+                trends[(g.subreddit, g.keyword)] = {
+                    "subreddit": g.subreddit,
+                    "keyword": g.keyword,
+                    "post_count": count,
+                    "avg_relevance": (g.relevance_sum or 0.0) / count if count else 0.0,
+                    "avg_score": (g.score_sum or 0) / count if count else 0.0,
+                    "avg_comments": (g.comments_sum or 0) / count if count else 0.0,
+                    "daily_counts": {},
+                }
+            if not trends:
+                return []
+
+            # 선택된 조합의 일별 게시물 수
+            daily = session.query(
+                TrendRollup.day,
+                TrendRollup.subreddit,
+                TrendRollup.keyword,
+                TrendRollup.post_count,
+            ).filter(*filters)
+            if limit is not None:
+                daily = daily.filter(
+                    TrendRollup.subreddit.in_({sub for sub, _ in trends}),
+                    TrendRollup.keyword.in_({kw for _, kw in trends}),
+                )
+            for r in daily:
+                trend = trends.get((r.subreddit, r.keyword))
+                if trend is not None:
+                    trend["daily_counts"][r.day] = r.post_count
+
+        return list(trends.values())
+
     def get_recent_searches(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         최근 검색 기록 조회
@@ -166,73 +640,92 @@ class Database:
                     "post_count": s.post_count,
                     "filtered_count": s.filtered_count,
                     "insights": s.insights,
+                    "heuristic_post_ids": s.heuristic_post_ids or [],
                 }
                 for s in searches
             ]
 
-    def get_posts_by_search(self, search_id: str) -> List[Dict[str, Any]]:
+    def get_posts_page(
+        self,
+        search_id: Optional[str] = None,
+        days: Optional[int] = None,
+        after: Optional[Tuple[float, int]] = None,
+        page_size: int = 20,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[float, int]]]:
         """
-        특정 검색의 게시물 조회
+        관련성 순 게시물 한 페이지 조회 (키셋 페이지네이션)
+
+        OFFSET 없이 (relevance_score, id) 커서 다음 행부터 인덱스 순서로 읽으므로
+        몇 번째 페이지든 조회 비용과 메모리가 페이지 크기에만 비례합니다.
 
         Args:
-            search_id: 검색 ID
+            search_id: 검색 ID 또는 그 접두사 (None이면 전체)
+            days: 최근 N일간 저장된 게시물만 조회 (None이면 전체)
+            after: 이전 페이지가 반환한 커서 (None이면 첫 페이지)
+            page_size: 페이지당 게시물 수
 
         Returns:
-            게시물 리스트
+            (게시물 리스트, 다음 페이지 커서 또는 마지막 페이지면 None)
         """
         with self.session_local() as session:
-            posts = (
-                session.query(PostRecord)
-                .filter_by(search_id=search_id)
-                .order_by(PostRecord.relevance_score.desc())
-                .all()
+            query = session.query(
+                PostRecord.id,
+                PostRecord.reddit_id,
+                PostRecord.title,
+                PostRecord.author,
+                PostRecord.subreddit,
+                PostRecord.content,
+                PostRecord.score,
+                PostRecord.num_comments,
+                PostRecord.relevance_score,
+                PostRecord.analysis_reason,
+                PostRecord.permalink,
+                PostRecord.keywords_matched,
             )
 
-            return [
-                {
-                    "reddit_id": p.reddit_id,
-                    "title": p.title,
-                    "author": p.author,
-                    "subreddit": p.subreddit,
-                    "score": p.score,
-                    "relevance_score": p.relevance_score,
-                    "analysis_reason": p.analysis_reason,
-                    "permalink": p.permalink,
-                    "saved_at": p.saved_at.isoformat(),
-                }
-                for p in posts
-            ]
-
-    def get_top_posts(self, days: int = 7, limit: int = 20) -> List[Dict[str, Any]]:
-        """
-        최근 N일간 상위 게시물 조회
-
-        Args:
-            days: 조회 기간 (일)
-            limit: 조회할 게시물 수
-
-        Returns:
-            상위 게시물 리스트
-        """
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+            if search_id:
+                query = query.filter(PostRecord.search_id.like(f"{search_id}%"))
+            if days is not None:
+                cutoff_date = datetime.utcnow() - timedelta(days=days)
+                query = query.filter(PostRecord.saved_at >= cutoff_date)
+            if after is not None:
+                last_score, last_id = after
+                query = query.filter(
+                    or_(
+                        PostRecord.relevance_score < last_score,
+                        and_(
+                            PostRecord.relevance_score == last_score,
+                            PostRecord.id < last_id,
+                        ),
+                    )
+                )
 
-        with self.session_local() as session:
-            posts = (
-                session.query(PostRecord)
-                .filter(PostRecord.saved_at >= cutoff_date)
-                .order_by(PostRecord.relevance_score.desc())
-                .limit(limit)
+            # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+            rows = (
+                query.order_by(PostRecord.relevance_score.desc(), PostRecord.id.desc())
+                .limit(page_size + 1)
                 .all()
             )
 
-            return [
-                {
-                    "title": p.title,
-                    "subreddit": p.subreddit,
-                    "score": p.score,
-                    "relevance_score": p.relevance_score,
-                    "permalink": p.permalink,
-                    "keywords_matched": p.keywords_matched,
-                }
-                for p in posts
-            ]
+        page = [
+            {
+                "id": r.id,
+                "reddit_id": r.reddit_id,
+                "title": r.title,
+                "author": r.author,
+                "subreddit": r.subreddit,
+                "text": r.content or "",
+                "score": r.score,
+                "num_comments": r.num_comments,
+                "relevance_score": r.relevance_score,
+                "analysis_reason": r.analysis_reason,
+                "permalink": r.permalink,
+                "keywords_matched": r.keywords_matched,
+            }
+            for r in rows[:page_size]
+        ]
+        next_cursor = None
+        if len(rows) > page_size:
+            last = page[-1]
+            next_cursor = (last["relevance_score"], last["id"])
+        return page, next_cursor
@@ -0,0 +1,218 @@
+"""
+데이터 내보내기 - 스크래핑 기록을 Parquet/Arrow/JSONL/CSV로 스트리밍 출력
+"""
+
+import csv
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import DateTime, Float, Integer, JSON, select
+
+from database import Database, PostRecord, SearchRecord
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ["parquet", "arrow", "jsonl", "csv"]
+
+EXPORT_TABLES = {
+    "posts": PostRecord.__table__,
+    "searches": SearchRecord.__table__,
+}
+
+# 값 종류가 적어 사전(dictionary) 인코딩이 유리한 컬럼
+DICTIONARY_COLUMNS = {"subreddit", "author", "search_id"}
+
+# 문자열 리스트로 저장되는 JSON 컬럼 (나머지 JSON 컬럼은 JSON 문자열로 출력)
+LIST_COLUMNS = {"keywords_matched", "keywords", "subreddits"}
+
+
+def iter_chunks(
+    db: Database, table_name: str, chunk_size: int, search_id: Optional[str] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    테이블 행을 청크 단위로 스트리밍 조회
+
+    서버 측 커서(stream_results)와 yield_per로 읽으므로
+    메모리에는 한 청크만 올라갑니다.
+
+    Args:
+        db: 데이터베이스
+        table_name: 내보낼 테이블 (posts 또는 searches)
+        chunk_size: 청크당 행 수
+        search_id: 검색 ID 또는 접두사 (None이면 전체)
+
+    Yields:
+        컬럼명 -> 값 딕셔너리 리스트
+    """
+    table = EXPORT_TABLES[table_name]
+    query = select(table).order_by(table.c.id)
+    if search_id:
+        query = query.where(table.c.search_id.like(f"{search_id}%"))
+
+    with db.engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True, yield_per=chunk_size
+        ).execute(query)
+        for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+
+
+def export_table(
+    db: Database,
+    table_name: str,
+    fmt: str,
+    path: str,
+    chunk_size: int = 10000,
+    search_id: Optional[str] = None,
+) -> int:
+    """
+    테이블을 지정 형식의 파일로 내보내기
+
+    Args:
+        db: 데이터베이스
+        table_name: 내보낼 테이블 (posts 또는 searches)
+        fmt: 출력 형식 (parquet, arrow, jsonl, csv)
+        path: 출력 파일 경로
+        chunk_size: 청크당 행 수
+        search_id: 검색 ID 또는 접두사 (None이면 전체)
+
+    Returns:
+        내보낸 행 수
+
+    Raises:
+        ValueError: 지원하지 않는 테이블/형식인 경우
+        ImportError: parquet/arrow 형식에 pyarrow가 없는 경우
+    """
+    if table_name not in EXPORT_TABLES:
+        raise ValueError(f"지원하지 않는 테이블: {table_name}")
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+
+    chunks = iter_chunks(db, table_name, chunk_size, search_id)
+    columns = [c.name for c in EXPORT_TABLES[table_name].columns]
+
+    if fmt in ("parquet", "arrow"):
+        count = _write_arrow(chunks, table_name, fmt, path)
+    elif fmt == "jsonl":
+        count = _write_jsonl(chunks, path)
+    else:
+        count = _write_csv(chunks, columns, path)
+
+    logger.info("%s 테이블 %d행을 %s(%s)로 내보냄", table_name, count, path, fmt)
+    return count
+
+
+def _json_default(value: Any) -> Any:
+    """JSON 직렬화 보조 (datetime -> ISO 문자열)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+def _write_jsonl(chunks: Iterator[List[Dict[str, Any]]], path: str) -> int:
+    """JSONL 형식으로 스트리밍 저장"""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in chunks:
+            f.writelines(
+                json.dumps(row, ensure_ascii=False, default=_json_default) + "\n"
+                for row in chunk
+            )
+            count += len(chunk)
+    return count
+
+
+def _write_csv(
+    chunks: Iterator[List[Dict[str, Any]]], columns: List[str], path: str
+) -> int:
+    """CSV 형식으로 스트리밍 저장 (JSON 컬럼은 JSON 문자열)"""
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for chunk in chunks:
+            for row in chunk:
+                writer.writerow(
+                    {
+                        key: (
+                            json.dumps(value, ensure_ascii=False)
+                            if isinstance(value, (list, dict))
+                            else value.isoformat()
+                            if isinstance(value, datetime)
+                            else value
+                        )
+                        for key, value in row.items()
+                    }
+                )
+            count += len(chunk)
+    return count
+
+
+def _arrow_schema(table_name: str):
+    """SQLAlchemy 테이블 정의로부터 Arrow 스키마 생성"""
+    import pyarrow as pa
+
+    fields = []
+    for column in EXPORT_TABLES[table_name].columns:
+        if column.name in DICTIONARY_COLUMNS:
+            arrow_type = pa.dictionary(pa.int32(), pa.string())
+        elif isinstance(column.type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, Float):
+            arrow_type = pa.float64()
+        elif isinstance(column.type, DateTime):
+            arrow_type = pa.timestamp("us")
+        elif isinstance(column.type, JSON) and column.name in LIST_COLUMNS:
+            arrow_type = pa.list_(pa.string())
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type))
+    return pa.schema(fields)
+
+
+def _write_arrow(
+    chunks: Iterator[List[Dict[str, Any]]], table_name: str, fmt: str, path: str
+) -> int:
+    """Parquet 또는 Arrow IPC 형식으로 청크 단위 저장"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "parquet/arrow 내보내기에는 pyarrow가 필요합니다: pip install pyarrow"
+        ) from e
+
+    schema = _arrow_schema(table_name)
+    json_columns = [
+        f.name
+        for f in schema
+        if isinstance(EXPORT_TABLES[table_name].c[f.name].type, JSON)
+        and f.name not in LIST_COLUMNS
+    ]
+
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(path, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_file(path, schema)
+
+    count = 0
+    try:
+        for chunk in chunks:
+            columns = {name: [row[name] for row in chunk] for name in schema.names}
+            for name in json_columns:
+                columns[name] = [
+                    None if v is None else json.dumps(v, ensure_ascii=False)
+                    for v in columns[name]
+                ]
+            batch = pa.RecordBatch.from_pydict(columns, schema=schema)
+            if fmt == "parquet":
+                writer.write_batch(batch)
+            else:
+                writer.write(batch)
+            count += len(chunk)
+    finally:
+        writer.close()
+
+    return count
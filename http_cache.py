@@ -0,0 +1,311 @@
+"""
+HTTP 캐시 - Reddit 목록/댓글 응답을 디스크(SQLite)에 보관하고 조건부 요청으로 재검증
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import HTTP_CACHE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 엔드포인트 종류 판별 (정규화된 경로 기준, 위에서부터 검사)
+_ENDPOINT_PATTERNS = [
+    ("search", re.compile(r"(^|/)search(\.json)?$")),
+    ("comments", re.compile(r"(^|/)comments/[a-z0-9]+")),
+    ("listing", re.compile(r"^/(r/[^/]+/?)?(hot|new|top|rising|controversial)?(\.json)?$")),
+]
+
+# 저장하지 않는 응답 헤더 (요청 시점에만 의미가 있음)
+_VOLATILE_HEADERS = ("x-ratelimit-", "set-cookie", "date", "content-encoding", "content-length")
+
+
+def normalize_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    캐시 키용 URL 정규화
+
+    호스트/경로를 소문자로 바꾸고 끝의 '/'를 제거한 뒤, URL의 쿼리와 params를 합쳐
+    키 순서로 정렬합니다. 같은 요청은 인자 순서와 관계없이 같은 키가 됩니다.
+
+    Args:
+        url: 요청 URL
+        params: 쿼리 파라미터
+
+    Returns:
+        정규화된 URL
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    for key, value in (params or {}).items():
+        if value is not None:
+            query.append((key, str(value)))
+    path = parts.path.lower().rstrip("/") or "/"
+    normalized = f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}"
+    if query:
+        normalized += "?" + urlencode(sorted(query))
+    return normalized
+
+
+def endpoint_type(url: str) -> Optional[str]:
+    """
+    URL의 엔드포인트 종류 (search, comments, listing)
+
+    Returns:
+        엔드포인트 종류 (캐시 대상이 아니면 None)
+    """
+    path = urlsplit(url).path.lower().rstrip("/") or "/"
+    for name, pattern in _ENDPOINT_PATTERNS:
+        if pattern.search(path):
+            return name
+    return None
+
+
+class HTTPCache:
+    """
+    SQLite 파일 기반 HTTP 응답 캐시
+
+    정규화된 URL을 키로 상태 코드/헤더/본문과 ETag, Last-Modified를 저장합니다.
+    엔드포인트 종류별 TTL 안에서는 저장된 응답을 그대로 쓰고, TTL이 지나면
+    검증 헤더로 조건부 요청을 보내 304이면 저장된 본문을 재사용합니다.
+    """
+
+    def __init__(self, path: str, ttls: Dict[str, int], max_age_days: int = 7):
+        """
+        캐시 초기화
+
+        Args:
+            path: 캐시 파일 경로
+            ttls: 엔드포인트 종류별 TTL (초, 0이면 캐시 안 함)
+            max_age_days: 이 기간 동안 재검증되지 않은 항목은 시작 시 삭제
+        """
+        self.path = path
+        self.ttls = ttls
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                cache_key TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_http_cache_stored_at ON http_cache (stored_at)"
+        )
+        self._conn.execute(
+            "DELETE FROM http_cache WHERE stored_at < ?",
+            (time.time() - max_age_days * 86400,),
+        )
+        self._conn.commit()
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0}
+
+    def record(self, outcome: str) -> None:
+        """조회 결과 집계 (hits, revalidated, misses)"""
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def ttl_for(self, endpoint: Optional[str]) -> int:
+        """엔드포인트 종류의 TTL (초, 캐시 대상이 아니면 0)"""
+        return self.ttls.get(endpoint, 0) if endpoint else 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 응답 조회
+
+        Returns:
+            status/headers/body/etag/last_modified/stored_at 딕셔너리 (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, etag, last_modified, stored_at "
+                "FROM http_cache WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        status, headers, body, etag, last_modified, stored_at = row
+        return {
+            "status": status,
+            "headers": json.loads(headers),
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": stored_at,
+        }
+
+    def put(self, key: str, response: requests.Response) -> None:
+        """성공 응답 저장 (요청 시점에만 의미가 있는 헤더는 제외)"""
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if not name.lower().startswith(_VOLATILE_HEADERS)
+        }
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(cache_key, status, headers, body, etag, last_modified, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status_code,
+                    json.dumps(headers),
+                    response.content,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def touch(self, key: str) -> None:
+        """재검증(304)된 항목의 저장 시각 갱신"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE http_cache SET stored_at = ? WHERE cache_key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """캐시 파일 닫기"""
+        with self._lock:
+            self._conn.close()
+
+
+def _cached_response(
+    entry: Dict[str, Any], request: requests.PreparedRequest, source: str
+) -> requests.Response:
+    """저장된 응답으로 requests.Response 생성 (X-Cache 헤더에 출처 표시)"""
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.headers["X-Cache"] = source
+    response._content = entry["body"]
+    response.url = request.url
+    response.request = request
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+class CachingSession(requests.Session):
+    """
+    HTTPCache를 거치는 requests 세션
+
+    PRAW(prawcore)에 세션으로 넘기면 GET 목록/댓글 요청만 캐시하고,
+    인증 토큰 발급 등 나머지 요청은 그대로 전송합니다.
+
+    prawcore 속도 제한기는 x-ratelimit 헤더가 없는 응답을 요청 한 번으로 세어 남은 수를
+    줄이므로, 캐시 적중 응답에는 마지막 실제 응답의 남은 수를 그대로 붙입니다.
+    """
+
+    def __init__(self, cache: HTTPCache):
+        """
+        세션 초기화
+
+        Args:
+            cache: 응답을 보관할 HTTPCache (여러 세션이 공유 가능)
+        """
+        super().__init__()
+        self.cache = cache
+        # 마지막 실제 응답의 (남은 요청 수, 초기화 시각)
+        self._rate_limit: Optional[Tuple[str, float]] = None
+
+    def _note_rate_limit(self, response: requests.Response) -> None:
+        """실제 응답의 속도 제한 상태 기록"""
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        if remaining is not None and reset is not None:
+            self._rate_limit = (remaining, time.time() + float(reset))
+
+    def _rate_limit_headers(self) -> Dict[str, str]:
+        """
+        캐시 적중 응답에 붙일 속도 제한 헤더
+
+        남은 수는 마지막 실제 응답 값을 유지하고, used=0으로 보내 prawcore가 다음 요청
+        대기 간격을 늘리지 않게 합니다. 실제 응답을 받은 적이 없으면 빈 딕셔너리입니다.
+        """
+        if self._rate_limit is None:
+            return {}
+        remaining, reset_at = self._rate_limit
+        return {
+            "x-ratelimit-remaining": remaining,
+            "x-ratelimit-used": "0",
+            "x-ratelimit-reset": str(max(0, int(reset_at - time.time()))),
+        }
+
+    def request(self, method, url, params=None, headers=None, **kwargs):
+        """캐시 대상 GET이면 캐시/조건부 요청, 아니면 그대로 전송"""
+        ttl = self.cache.ttl_for(endpoint_type(url)) if method.upper() == "GET" else 0
+        if not ttl:
+            response = super().request(method, url, params=params, headers=headers, **kwargs)
+            self._note_rate_limit(response)
+            return response
+
+        key = normalize_url(url, params)
+        entry = self.cache.get(key)
+        request = requests.Request(method, url, params=params).prepare()
+
+        if entry is not None and time.time() - entry["stored_at"] < ttl:
+            self.cache.record("hits")
+            cached = _cached_response(entry, request, "HIT")
+            cached.headers.update(self._rate_limit_headers())
+            return cached
+
+        # TTL이 지났으면 검증 헤더로 조건부 요청
+        headers = dict(headers or {})
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().request(method, url, params=params, headers=headers, **kwargs)
+        self._note_rate_limit(response)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(key)
+            self.cache.record("revalidated")
+            cached = _cached_response(entry, response.request, "REVALIDATED")
+            # 속도 제한 헤더는 새 응답 것을 사용
+            for name, value in response.headers.items():
+                if name.lower().startswith("x-ratelimit-"):
+                    cached.headers[name] = value
+            return cached
+
+        self.cache.record("misses")
+        if response.status_code == 200:
+            self.cache.put(key, response)
+        return response
+
+
+def create_http_cache() -> Optional[HTTPCache]:
+    """
+    설정에 따라 HTTP 캐시 생성 (세션마다 CachingSession(cache)로 감싸서 사용)
+
+    Returns:
+        HTTPCache (HTTP_CACHE가 꺼져 있으면 None)
+    """
+    if not HTTP_CACHE_CONFIG["enabled"]:
+        return None
+    return HTTPCache(
+        HTTP_CACHE_CONFIG["path"],
+        HTTP_CACHE_CONFIG["ttls"],
+        HTTP_CACHE_CONFIG["max_age_days"],
+    )
@@ -0,0 +1,295 @@
+"""
+인사이트 요약기 - 게시물 전체를 청크 단위로 요약한 뒤 계층적으로 합치는 map-reduce 요약
+"""
+
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from config import INSIGHTS_CONFIG
+from llm_json import INSIGHTS_SCHEMA, validate_insights
+
+logger = logging.getLogger(__name__)
+
+# 요약 프롬프트 버전 - 프롬프트를 바꾸면 올려서 캐시된 요약을 무효화
+SUMMARY_PROMPT_VERSION = "1"
+
+# 게시물 ID -> 댓글 딕셔너리 리스트 (RedditClient.get_post_comments 형태)
+CommentsLoader = Callable[[str], List[Dict[str, Any]]]
+
+T = TypeVar("T")
+
+
+def _post_order(post: Dict[str, Any]) -> Tuple[int, str]:
+    """
+    청크 정렬 키
+
+    Reddit ID는 base36 증가 값이므로 (길이, ID) 순서가 작성 순서와 같습니다.
+    """
+    post_id = str(post.get("id", ""))
+    return len(post_id), post_id
+
+
+def _cache_key(*parts: str) -> str:
+    """캐시 키 (요약 입력을 식별하는 SHA-1)"""
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _split_by_content(items: List[T], size: int, key: Callable[[T], str]) -> List[List[T]]:
+    """
+    내용 기준 분할
+
+    고정 개수로 자르면 항목 하나가 끼어들 때 뒤쪽 경계가 모두 밀려 캐시 키가 전부 바뀝니다.
+    대신 항목 키의 해시로 경계를 정하므로(평균 size개) 항목이 추가/삭제되어도 그 항목이
+    속한 묶음만 바뀌고 나머지 묶음은 같은 캐시 키를 유지합니다. 경계 없이 size의 2배에
+    이르면 강제로 나눕니다.
+
+    Args:
+        items: 나눌 항목 (정렬된 상태)
+        size: 평균 묶음 크기
+        key: 항목 -> 경계 판단용 키 함수
+
+    Returns:
+        묶음 리스트 (입력 순서 유지)
+    """
+    size = max(1, size)
+    groups: List[List[T]] = []
+    current: List[T] = []
+    for item in items:
+        current.append(item)
+        digest = int(hashlib.sha1(key(item).encode("utf-8")).hexdigest()[:8], 16)
+        if digest % size == 0 or len(current) >= 2 * size:
+            groups.append(current)
+            current = []
+    if current:
+        groups.append(current)
+    return groups
+
+
+class InsightSummarizer:
+    """
+    계층적 map-reduce 인사이트 요약기
+
+    게시물을 평균 chunk_size개씩 나누어 청크마다 요약(map)을 병렬로 만들고,
+    부분 요약을 평균 reduce_fanout개씩 묶어 하나가 남을 때까지 합칩니다(reduce).
+    청크/중간 요약은 입력 게시물 ID와 모델로 만든 키로 DB에 캐시됩니다. 경계를 내용
+    기준으로 정하므로 다시 요약할 때는 게시물이 추가/삭제된 청크와 그 위의 합치기 단계만
+    LLM을 호출합니다.
+    """
+
+    def __init__(
+        self,
+        analyzer,
+        cache=None,
+        comments_loader: Optional[CommentsLoader] = None,
+        chunk_size: Optional[int] = None,
+        reduce_fanout: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
+        """
+        요약기 초기화
+
+        Args:
+            analyzer: LLM 호출에 사용할 ContentAnalyzer
+            cache: 요약 캐시로 쓸 Database (None이면 캐시 안 함)
+            comments_loader: 게시물 댓글 조회 함수 (None이면 댓글 제외)
+            chunk_size: 청크당 게시물 수 (None이면 config에서 가져옴)
+            reduce_fanout: 한 번에 합칠 부분 요약 수 (None이면 config에서 가져옴)
+            workers: 병렬 요약 스레드 수 (None이면 config에서 가져옴)
+        """
+        self.analyzer = analyzer
+        self.cache = cache
+        self.comments_loader = comments_loader
+        self.chunk_size = chunk_size or INSIGHTS_CONFIG["chunk_size"]
+        self.reduce_fanout = max(2, reduce_fanout or INSIGHTS_CONFIG["reduce_fanout"])
+        self.workers = workers or INSIGHTS_CONFIG["workers"]
+
+    def summarize(self, posts: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        게시물 전체 요약
+
+        Args:
+            posts: 요약할 게시물 리스트
+
+        Returns:
+            summary/trends/topics 인사이트 (모든 요약이 실패하면 None)
+        """
+        ordered = sorted(posts, key=_post_order)
+        chunks = _split_by_content(ordered, self.chunk_size, lambda p: str(p.get("id", "")))
+        prefix = (
+            self.analyzer.model,
+            SUMMARY_PROMPT_VERSION,
+            "comments" if self.comments_loader else "posts",
+        )
+
+        # map: 청크별 요약
+        level = [
+            (_cache_key(*prefix, "map", *(str(p.get("id", "")) for p in chunk)), chunk)
+            for chunk in chunks
+        ]
+        nodes = self._run_level(level, self._summarize_chunk, prepare=self._with_comments)
+
+        # reduce: 부분 요약이 하나 남을 때까지 묶어서 합치기
+        while len(nodes) > 1:
+            groups = _split_by_content(nodes, self.reduce_fanout, lambda node: node[0])
+            if len(groups) == len(nodes):
+                # 모든 노드가 경계이면 줄어들지 않으므로 고정 개수로 묶음
+                groups = [
+                    nodes[i : i + self.reduce_fanout]
+                    for i in range(0, len(nodes), self.reduce_fanout)
+                ]
+            level = [
+                (_cache_key(*prefix, "reduce", *(key for key, _ in group)), group)
+                for group in groups
+            ]
+            nodes = self._run_level(level, self._reduce_group)
+
+        return nodes[0][1] if nodes else None
+
+    def _run_level(
+        self,
+        level: List[Tuple[str, Any]],
+        summarize_fn: Callable[[Any], Optional[Dict[str, Any]]],
+        prepare: Optional[Callable[[Any], Any]] = None,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        한 단계의 요약을 캐시 조회 후 누락분만 병렬 실행
+
+        Args:
+            level: (캐시 키, 요약 입력) 리스트
+            summarize_fn: 요약 입력 -> 인사이트 함수
+            prepare: 누락분 입력을 스레드 풀 시작 전에 호출 스레드에서 변환하는 함수
+
+        Returns:
+            성공한 (캐시 키, 인사이트) 리스트 (입력 순서 유지, 실패한 항목은 제외)
+        """
+        cached = self.cache.get_cached_summaries([k for k, _ in level]) if self.cache else {}
+        missing = [(key, item) for key, item in level if key not in cached]
+
+        fresh: Dict[str, Dict[str, Any]] = {}
+        if missing:
+            if prepare:
+                missing = [(key, prepare(item)) for key, item in missing]
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = executor.map(lambda entry: summarize_fn(entry[1]), missing)
+                for (key, _), result in zip(missing, results):
+                    if result is not None:
+                        fresh[key] = result
+
+            if self.cache and fresh:
+                self.cache.save_cached_summaries(fresh)
+
+        logger.info(
+            "요약 %d개 중 캐시 %d개, 새로 요약 %d개, 실패 %d개",
+            len(level),
+            len(level) - len(missing),
+            len(fresh),
+            len(missing) - len(fresh),
+        )
+
+        summaries = {**cached, **fresh}
+        return [(key, summaries[key]) for key, _ in level if key in summaries]
+
+    def _with_comments(
+        self, chunk: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """
+        청크 게시물의 댓글 조회
+
+        PRAW는 스레드 안전하지 않으므로 요약 스레드 풀을 시작하기 전에 호출 스레드에서
+        순서대로 가져옵니다. 캐시된 청크의 댓글은 가져오지 않습니다.
+
+        Returns:
+            (청크, 게시물 ID -> 댓글 리스트)
+        """
+        if not self.comments_loader:
+            return chunk, {}
+        return chunk, {post["id"]: self.comments_loader(post["id"]) for post in chunk}
+
+    def _summarize_chunk(
+        self, entry: Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """게시물 청크 하나 요약 (map, 입력은 _with_comments 결과)"""
+        chunk, comments_by_post = entry
+        max_chars = INSIGHTS_CONFIG["max_text_chars"]
+        lines = []
+        for i, post in enumerate(chunk, 1):
+            line = f"{i}. [{post.get('score', 0)}점] {post['title']}"
+            text = (post.get("text") or "").strip().replace("\n", " ")
+            if text:
+                line += f" - {text[:max_chars]}"
+            lines.append(line)
+
+            comments = comments_by_post.get(post["id"], [])
+            for comment in comments[: INSIGHTS_CONFIG["comments_per_post"]]:
+                body = comment["body"].strip().replace("\n", " ")
+                lines.append(f"   > {body[:max_chars]}")
+
+        prompt = f"""
+        Analyze these Reddit posts and extract key insights:
+
+        {chr(10).join(lines)}
+
+        Provide:
+        1. Main trends or patterns
+        2. Common topics discussed
+        3. Brief summary of community interest
+
+        Respond with JSON:
+        {{
+            "summary": "brief summary of community interest",
+            "trends": ["trend1", "trend2"],
+            "topics": ["topic1", "topic2"]
+        }}
+        """
+        return self.analyzer.generate_json(prompt, INSIGHTS_SCHEMA, validate_insights)
+
+    def _reduce_group(
+        self, group: List[Tuple[str, Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """부분 요약 묶음을 하나로 합치기 (reduce)"""
+        if len(group) == 1:
+            return group[0][1]
+
+        parts = []
+        for i, (_, insights) in enumerate(group, 1):
+            parts.append(
+                f"{i}. Summary: {insights['summary']}\n"
+                f"   Trends: {', '.join(insights['trends'])}\n"
+                f"   Topics: {', '.join(insights['topics'])}"
+            )
+
+        prompt = f"""
+        These are summaries of different groups of Reddit posts from the same search.
+        Merge them into one overall analysis:
+
+        {chr(10).join(parts)}
+
+        Combine duplicate trends and topics, keep the most significant ones,
+        and write one summary of overall community interest.
+
+        Respond with JSON:
+        {{
+            "summary": "overall summary of community interest",
+            "trends": ["trend1", "trend2"],
+            "topics": ["topic1", "topic2"]
+        }}
+        """
+        return self.analyzer.generate_json(prompt, INSIGHTS_SCHEMA, validate_insights)
+
+
+def comments_loader_for(reddit_client) -> Optional[CommentsLoader]:
+    """
+    설정에 따라 요약에 댓글을 포함할 조회 함수 생성
+
+    Args:
+        reddit_client: 댓글을 가져올 RedditClient
+
+    Returns:
+        댓글 조회 함수 (INSIGHTS_INCLUDE_COMMENTS가 꺼져 있으면 None)
+    """
+    if not INSIGHTS_CONFIG["include_comments"]:
+        return None
+    limit = INSIGHTS_CONFIG["comments_per_post"]
+    return lambda post_id: reddit_client.get_post_comments(post_id, limit=limit)
@@ -0,0 +1,257 @@
+"""
+LLM JSON 파서 - 잘리거나 앞뒤에 잡문이 붙은 LLM 출력에서 JSON 객체 복구
+"""
+
+import json
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+# 관련성 평가 응답 스키마 (Ollama format 파라미터로 전달)
+RELEVANCE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "relevance_score": {"type": "number", "minimum": 0, "maximum": 1},
+        "quality_score": {"type": "number", "minimum": 0, "maximum": 1},
+        "reason": {"type": "string"},
+        "key_insights": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["relevance_score", "quality_score", "reason"],
+}
+
+# 인사이트 응답 스키마
+INSIGHTS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "trends": {"type": "array", "items": {"type": "string"}},
+        "topics": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["summary", "trends", "topics"],
+}
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class TolerantJSONParser:
+    """
+    점진적(스트리밍) JSON 객체 파서
+
+    feed()로 받은 텍스트를 한 번만 훑으면서 첫 '{'부터 대응하는 '}'까지를 모으고,
+    괄호 깊이/문자열 상태와 마지막으로 완결된 값의 위치를 기록합니다.
+    출력이 중간에 잘렸으면 열린 문자열과 괄호를 닫고, 그래도 안 되면 마지막으로
+    완결된 값까지 잘라내어 복구합니다. 끝에 남은 쉼표와 객체 뒤의 잡문은 무시하고,
+    문자열 안에 이스케이프되지 않은 줄바꿈/탭이 있어도 그대로 받아들입니다.
+    """
+
+    def __init__(self):
+        """파서 초기화"""
+        self._buf: List[str] = []
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self.complete = False  # 최상위 객체가 닫혔는지 여부
+        # 잘라낼 수 있는 위치 (버퍼 길이, 그 시점의 괄호 스택)
+        self._cut_points: List[Tuple[int, Tuple[str, ...]]] = []
+
+    def feed(self, chunk: str) -> bool:
+        """
+        텍스트 조각 처리
+
+        Args:
+            chunk: LLM 출력 조각
+
+        Returns:
+            최상위 객체가 완성되었으면 True (이후 입력은 무시)
+        """
+        for ch in chunk:
+            if self.complete:
+                break
+
+            if not self._started:
+                if ch == "{":
+                    self._started = True
+                    self._open(ch)
+                continue
+
+            if self._in_string:
+                self._buf.append(ch)
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._buf.append(ch)
+            elif ch in _CLOSERS:
+                self._open(ch)
+            elif ch in "}]":
+                self._close()
+            elif ch == ",":
+                # 쉼표 앞까지는 완결된 값
+                self._strip_trailing_comma()
+                self._cut_points.append((len(self._buf), tuple(self._stack)))
+                self._buf.append(ch)
+            elif ch in "\r\n\t":
+                self._buf.append(" ")
+            else:
+                self._buf.append(ch)
+
+        return self.complete
+
+    def _open(self, ch: str) -> None:
+        """괄호 열기 (빈 컨테이너도 완결된 값이므로 잘라낼 위치로 기록)"""
+        self._buf.append(ch)
+        self._stack.append(ch)
+        self._cut_points.append((len(self._buf), tuple(self._stack)))
+
+    def _close(self) -> None:
+        """가장 안쪽 괄호 닫기 (짝이 맞지 않는 닫는 괄호도 열린 괄호에 맞춤)"""
+        self._strip_trailing_comma()
+        opener = self._stack.pop()
+        self._buf.append(_CLOSERS[opener])
+        if not self._stack:
+            self.complete = True
+        else:
+            self._cut_points.append((len(self._buf), tuple(self._stack)))
+
+    def _strip_trailing_comma(self) -> None:
+        """'[1, 2, ]'처럼 닫는 괄호/쉼표 앞에 남은 쉼표 제거"""
+        i = len(self._buf) - 1
+        while i >= 0 and self._buf[i] == " ":
+            i -= 1
+        if i >= 0 and self._buf[i] == ",":
+            del self._buf[i:]
+
+    @property
+    def repaired(self) -> bool:
+        """결과가 복구(잘린 출력 보정)를 거쳤는지 여부"""
+        return self._started and not self.complete
+
+    def result(self) -> Optional[Dict[str, Any]]:
+        """
+        지금까지 받은 텍스트로 만든 JSON 객체
+
+        Returns:
+            파싱된 객체 (JSON 객체를 찾지 못했으면 None)
+        """
+        if not self._started:
+            return None
+
+        text = "".join(self._buf)
+        if self.complete:
+            candidates = [text]
+        else:
+            # 1) 열린 문자열/괄호만 닫기 2) 마지막으로 완결된 값까지 잘라내기
+            tail = '"' if self._in_string and not self._escape else ""
+            candidates = [text + tail + _closing(self._stack)]
+            candidates += [
+                text[:pos] + _closing(stack) for pos, stack in reversed(self._cut_points)
+            ]
+
+        for candidate in candidates:
+            try:
+                # 문자열 안의 줄바꿈/탭 원문 허용 (여러 줄 reason 등)
+                value = json.loads(candidate, strict=False)
+            except ValueError:
+                continue
+            if isinstance(value, dict):
+                return value
+        return None
+
+
+def _closing(stack) -> str:
+    """열린 괄호들을 닫는 문자열"""
+    return "".join(_CLOSERS[ch] for ch in reversed(stack))
+
+
+def parse_llm_json(text: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """
+    LLM 출력에서 JSON 객체 추출
+
+    Args:
+        text: LLM 원본 출력
+
+    Returns:
+        (파싱된 객체 또는 None, 잘린 출력을 복구했는지 여부)
+    """
+    parser = TolerantJSONParser()
+    parser.feed(text)
+    return parser.result(), parser.repaired
+
+
+def _unit_float(value: Any) -> Optional[float]:
+    """0-1 범위로 자른 점수 (숫자로 해석할 수 없으면 None)"""
+    if isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(number):
+        return None
+    return min(max(number, 0.0), 1.0)
+
+
+def _string_list(value: Any) -> List[str]:
+    """문자열 리스트로 정규화"""
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    return [str(item).strip() for item in value if str(item).strip()]
+
+
+def validate_relevance(data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    관련성 평가 응답 검증 및 정규화
+
+    Args:
+        data: 파싱된 응답
+
+    Returns:
+        점수를 0-1로 자른 응답 (relevance_score가 없거나 숫자가 아니면 None)
+    """
+    if not data:
+        return None
+
+    relevance = _unit_float(data.get("relevance_score"))
+    if relevance is None:
+        return None
+    quality = _unit_float(data.get("quality_score"))
+
+    reason = data.get("reason")
+    return {
+        "relevance_score": relevance,
+        "quality_score": relevance if quality is None else quality,
+        "reason": reason.strip() if isinstance(reason, str) and reason.strip() else "분석 완료",
+        "key_insights": _string_list(data.get("key_insights")),
+    }
+
+
+def validate_insights(data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    인사이트 응답 검증 및 정규화
+
+    Args:
+        data: 파싱된 응답
+
+    Returns:
+        summary/trends/topics를 갖춘 응답 (요약이 없으면 None)
+    """
+    if not data:
+        return None
+
+    summary = data.get("summary")
+    if not isinstance(summary, str) or not summary.strip():
+        return None
+
+    return {
+        "summary": summary.strip(),
+        "trends": _string_list(data.get("trends")),
+        "topics": _string_list(data.get("topics")),
+    }
@@ -0,0 +1,260 @@
+"""
+LLM 라우터 - 여러 Ollama 호스트에 요청을 분산
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from config import OLLAMA_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class _Endpoint:
+    """Ollama 호스트 하나의 상태"""
+
+    def __init__(self, url: str, max_concurrency: int):
+        self.url = url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.outstanding = 0
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.total_latency = 0.0
+        self.ewma_latency: Optional[float] = None
+        self.healthy = True
+        self.retry_at = 0.0  # 비정상 호스트를 다시 시도할 시각
+        self.probing = False  # 복구 확인 요청 진행 중
+
+    def load(self) -> float:
+        """선택 우선순위 (낮을수록 우선): 진행 중 요청 수 x 최근 지연 시간"""
+        return (self.outstanding + 1) * (self.ewma_latency or 1.0)
+
+
+class OllamaRouter:
+    """
+    여러 Ollama 엔드포인트에 대한 부하 분산 라우터
+
+    진행 중 요청이 가장 적은 호스트를 고르되 최근 지연 시간(EWMA)으로 가중하여
+    느려진 호스트의 부하를 줄입니다. 연속 오류가 난 호스트는 잠시 제외했다가
+    요청 하나를 보내 복구 여부를 확인합니다. 호스트별 동시 요청 수를 제한합니다.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        session: requests.Session,
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        라우터 초기화
+
+        Args:
+            urls: Ollama 엔드포인트 URL 리스트
+            session: 연결 풀 HTTP 세션
+            max_concurrency: 호스트당 최대 동시 요청 수 (None이면 config에서 가져옴)
+        """
+        if not urls:
+            raise ValueError("Ollama 엔드포인트가 하나 이상 필요합니다")
+
+        limit = max_concurrency or OLLAMA_CONFIG["max_concurrency_per_host"]
+        self.endpoints = [_Endpoint(url, limit) for url in dict.fromkeys(urls)]
+        self.session = session
+        self._cond = threading.Condition()
+
+    @property
+    def primary_url(self) -> str:
+        """첫 번째 엔드포인트 URL"""
+        return self.endpoints[0].url
+
+    def post(self, path: str, json: Dict[str, Any], timeout: float) -> requests.Response:
+        """
+        선택한 호스트로 POST 요청 (연결 실패 시 다른 호스트로 한 번 재시도)
+
+        Args:
+            path: API 경로 (예: /api/generate)
+            json: 요청 본문
+            timeout: 요청 타임아웃 (초)
+
+        Returns:
+            응답 객체
+
+        Raises:
+            requests.RequestException: 모든 시도가 실패한 경우
+        """
+        tried: List[_Endpoint] = []
+        last_error: Optional[Exception] = None
+
+        for _ in range(min(2, len(self.endpoints))):
+            endpoint, probe = self._acquire(exclude=tried)
+            tried.append(endpoint)
+            started = time.perf_counter()
+            try:
+                response = self.session.post(
+                    f"{endpoint.url}{path}", json=json, timeout=timeout
+                )
+                ok = response.status_code < 500
+                self.release(endpoint, time.perf_counter() - started, ok, probe)
+                if ok or len(tried) == len(self.endpoints):
+                    return response
+                last_error = requests.HTTPError(f"{endpoint.url} 응답 {response.status_code}")
+            except requests.RequestException as e:
+                self.release(endpoint, time.perf_counter() - started, False, probe)
+                last_error = e
+                logger.warning("Ollama 호스트 %s 요청 실패: %s", endpoint.url, e)
+
+        raise last_error
+
+    def _acquire(self, exclude: List[_Endpoint]) -> Tuple[_Endpoint, bool]:
+        """사용 가능한 호스트 선택 (모두 동시 요청 한도에 도달하면 대기)"""
+        with self._cond:
+            while True:
+                selected = self._select(exclude)
+                if selected is not None:
+                    return selected
+                self._cond.wait(timeout=0.5)
+
+    def try_acquire(
+        self, exclude: Optional[List[_Endpoint]] = None
+    ) -> Optional[Tuple[_Endpoint, bool]]:
+        """
+        대기 없이 호스트 선택 (비동기 호출자용)
+
+        Args:
+            exclude: 이번 요청에서 이미 시도한 호스트
+
+        Returns:
+            (선택된 호스트, 복구 확인 요청 여부) (모두 동시 요청 한도에 도달했으면 None).
+            요청이 끝나면 같은 값으로 release()를 호출해야 합니다.
+        """
+        with self._cond:
+            return self._select(exclude or [])
+
+    def _select(self, exclude: List[_Endpoint]) -> Optional[Tuple[_Endpoint, bool]]:
+        """
+        호스트 선택 및 진행 중 요청 수 증가 (잠금을 보유한 상태에서 호출)
+
+        Returns:
+            (선택된 호스트, 복구 확인 요청 여부) 또는 None
+        """
+        now = time.monotonic()
+        candidates = []
+        for ep in self.endpoints:
+            if ep in exclude or ep.outstanding >= ep.max_concurrency:
+                continue
+            if ep.healthy:
+                candidates.append(ep)
+            elif now >= ep.retry_at and not ep.probing:
+                # 제외 기간이 지난 호스트에 복구 확인 요청 하나만 허용
+                candidates.append(ep)
+
+        if not candidates and exclude:
+            # 재시도할 다른 호스트가 없으면 제외 목록 무시
+            return self._select([])
+
+        if not candidates and all(not ep.healthy for ep in self.endpoints):
+            # 전부 비정상이면 가장 먼저 복구 확인할 호스트로 바로 시도
+            ep = min(self.endpoints, key=lambda e: e.retry_at)
+            if ep.outstanding < ep.max_concurrency:
+                candidates.append(ep)
+
+        if not candidates:
+            return None
+
+        endpoint = min(candidates, key=lambda e: e.load())
+        # 비정상 호스트로 가는 요청 중 하나만 복구 확인 요청으로 표시
+        probe = not endpoint.healthy and not endpoint.probing
+        if probe:
+            endpoint.probing = True
+        endpoint.outstanding += 1
+        return endpoint, probe
+
+    def release(
+        self, endpoint: _Endpoint, latency: float, ok: bool, probe: bool = False
+    ) -> None:
+        """
+        요청 종료 처리 및 상태/지표 갱신
+
+        Args:
+            endpoint: 요청을 보낸 호스트
+            latency: 응답 시간 (초)
+            ok: 성공 여부
+            probe: 선택 시 받은 복구 확인 요청 여부 (이 요청이 끝날 때만 확인 상태 해제)
+        """
+        alpha = OLLAMA_CONFIG["latency_ewma_alpha"]
+        with self._cond:
+            endpoint.outstanding -= 1
+            endpoint.requests += 1
+            endpoint.total_latency += latency
+            if probe:
+                endpoint.probing = False
+
+            if ok:
+                endpoint.ewma_latency = (
+                    latency
+                    if endpoint.ewma_latency is None
+                    else alpha * latency + (1 - alpha) * endpoint.ewma_latency
+                )
+                endpoint.consecutive_errors = 0
+                if not endpoint.healthy:
+                    logger.info("Ollama 호스트 %s 복구됨", endpoint.url)
+                endpoint.healthy = True
+            else:
+                endpoint.errors += 1
+                endpoint.consecutive_errors += 1
+                if endpoint.consecutive_errors >= OLLAMA_CONFIG["host_failure_threshold"]:
+                    if endpoint.healthy:
+                        logger.warning("Ollama 호스트 %s 제외", endpoint.url)
+                    endpoint.healthy = False
+                    endpoint.retry_at = time.monotonic() + OLLAMA_CONFIG["host_retry_interval"]
+
+            self._cond.notify_all()
+
+    def check_health(self, timeout: float = 2.0) -> Dict[str, bool]:
+        """
+        모든 호스트에 /api/tags 요청으로 상태 확인
+
+        Returns:
+            URL -> 정상 여부
+        """
+        status = {}
+        for endpoint in self.endpoints:
+            try:
+                ok = self.session.get(f"{endpoint.url}/api/tags", timeout=timeout).ok
+            except requests.RequestException:
+                ok = False
+            with self._cond:
+                endpoint.healthy = ok
+                if ok:
+                    endpoint.consecutive_errors = 0
+                else:
+                    logger.warning("Ollama 호스트 %s 응답 없음 - 제외", endpoint.url)
+                    endpoint.retry_at = time.monotonic() + OLLAMA_CONFIG["host_retry_interval"]
+                self._cond.notify_all()
+            status[endpoint.url] = ok
+        return status
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """
+        호스트별 지표
+
+        Returns:
+            URL, 요청 수, 오류 수, 진행 중 요청 수, 평균/EWMA 지연 시간(초), 정상 여부
+        """
+        with self._cond:
+            return [
+                {
+                    "url": ep.url,
+                    "requests": ep.requests,
+                    "errors": ep.errors,
+                    "outstanding": ep.outstanding,
+                    "avg_latency": ep.total_latency / ep.requests if ep.requests else 0.0,
+                    "ewma_latency": ep.ewma_latency or 0.0,
+                    "healthy": ep.healthy,
+                }
+                for ep in self.endpoints
+            ]
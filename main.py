@@ -4,13 +4,24 @@ Reddit 콘텐츠 스크래퍼 - 키워드 기반 스마트 필터링 도구
 """
 
 import argparse
+import asyncio
+import atexit
 import uuid
 import logging
-from reddit_client import RedditClient
-from content_analyzer import ContentAnalyzer
+import traffic_archive
+from async_engine import search_and_score_async
+from batch_runner import load_batch_specs, run_batch
+from client_registry import get_registry
 from database import Database
-from terminal_ui import TerminalUI
-from config import SEARCH_CONFIG
+from reddit_client import DEEP_MAX_LIMIT
+from terminal_ui import LiveResults, TerminalUI, list_page_fetcher
+from config import FILTER_CRITERIA, RESCORE_CONFIG, SEARCH_CONFIG, UI_CONFIG
+from exporter import EXPORT_FORMATS, EXPORT_TABLES, export_table
+from insight_summarizer import comments_loader_for
+from profiler import StageProfiler, report_dir
+from rescorer import Rescorer, background_paused, start_background_rescorer
+from retention import run_retention, run_scheduled_retention
+from work_queue import TASK_KINDS, run_worker, submit_search
 
 
 def main():
@@ -36,16 +47,120 @@ def main():
     )
     parser.add_argument("--limit", "-l", type=int, help=f"가져올 게시물 수 (기본: {SEARCH_CONFIG['default_limit']}, 최대: {SEARCH_CONFIG['max_limit']})", default=SEARCH_CONFIG['default_limit'])
     parser.add_argument("--interactive", "-i", action="store_true", help="대화형 모드")
+    parser.add_argument("--deep", action="store_true", help=f"심층 검색: 정렬/기간별 창을 병합해 서브레딧마다 최대 {DEEP_MAX_LIMIT}개까지 수집 (-l은 일반 검색과 같이 서브레딧별 개수)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="비동기 엔진으로 수집/분석 (asyncpraw, httpx 필요). 요청 병합 캐시, HTTP 디스크 캐시, --record/--replay를 거치지 않음")
+    parser.add_argument("--batch", "-b", metavar="FILE", help="JSONL 파일의 검색 스펙을 일괄 실행")
+    parser.add_argument("--enqueue", action="store_true", help="검색을 직접 실행하지 않고 작업 큐에 등록")
+    parser.add_argument("--worker", action="store_true", help="작업 큐 워커로 실행")
+    parser.add_argument("--worker-kinds", nargs="+", choices=TASK_KINDS, help="워커가 처리할 작업 종류 (기본: 전체)")
+    parser.add_argument("--exit-when-idle", action="store_true", help="워커: 큐가 비면 종료")
+    archive_group = parser.add_mutually_exclusive_group()
+    archive_group.add_argument("--record", metavar="FILE", help="Reddit/Ollama 응답을 원래 응답 시간과 함께 파일(.jsonl.gz)에 녹화")
+    archive_group.add_argument("--replay", metavar="FILE", help="녹화 파일의 응답으로 네트워크 없이 실행")
+    parser.add_argument("--replay-scale", type=float, default=1.0, help="재생 시 원래 응답 시간에 곱할 배율 (0이면 대기 없음, 기본: 1.0)")
+    parser.add_argument("--profile", action="store_true", help="검색 단계별 cProfile 보고서 저장 (DB 옆 profiles/)")
+    parser.add_argument("--trace-memory", action="store_true", help="검색 단계별 tracemalloc 메모리 보고서 저장 (DB 옆 profiles/)")
+
+    # 내보내기 서브커맨드
+    subparsers = parser.add_subparsers(dest="command")
+    export_parser = subparsers.add_parser("export", help="저장된 데이터를 파일로 내보내기")
+    export_parser.add_argument("--format", "-f", choices=EXPORT_FORMATS, default="parquet", help="출력 형식 (기본: parquet)")
+    export_parser.add_argument("--output", "-o", required=True, help="출력 파일 경로")
+    export_parser.add_argument("--table", "-t", choices=list(EXPORT_TABLES), default="posts", help="내보낼 테이블 (기본: posts)")
+    export_parser.add_argument("--search-id", help="특정 검색 ID(접두사)의 행만 내보내기")
+    export_parser.add_argument("--chunk-size", type=int, default=10000, help="청크당 행 수 (기본: 10000)")
+    maintain_parser = subparsers.add_parser("maintain", help="보존 정책 실행 (오래된 기록 보관 및 DB 압축)")
+    maintain_parser.add_argument("--dry-run", action="store_true", help="옮길 대상 수만 표시")
+    rescore_parser = subparsers.add_parser("rescore", help="규칙 기반/이전 버전으로 평가된 게시물 재평가")
+    rescore_parser.add_argument("--limit", type=int, help="재평가할 최대 게시물 수 (기본: 전체)")
 
     args = parser.parse_args()
 
+    # 녹화/재생 (클라이언트가 만들어지기 전에 시작)
+    if args.record or args.replay:
+        if args.use_async:
+            ui.display_error("--record/--replay는 --async와 함께 사용할 수 없습니다.")
+            return
+        try:
+            if args.record:
+                traffic_archive.start(args.record, "record")
+            else:
+                traffic_archive.start(args.replay, "replay", args.replay_scale)
+        except (OSError, EOFError, ValueError) as e:
+            ui.display_error(f"아카이브 열기 실패: {e}")
+            return
+        atexit.register(traffic_archive.stop)
+
+    # 내보내기
+    if args.command == "export":
+        try:
+            count = export_table(
+                db, args.table, args.format, args.output, args.chunk_size, args.search_id
+            )
+        except (ImportError, OSError, ValueError) as e:
+            ui.display_error(f"내보내기 실패: {e}")
+            return
+        ui.display_success(f"{count}개 행을 {args.output}로 내보냈습니다.")
+        return
+
+    # 보존 정책 수동 실행
+    if args.command == "maintain":
+        counts = run_retention(db, dry_run=args.dry_run)
+        action = "보관 대상" if args.dry_run else "보관 완료"
+        ui.display_success(
+            f"{action}: 게시물 {counts['posts']}개, 검색 기록 {counts['searches']}개"
+        )
+        return
+
+    # 재평가 수동 실행
+    if args.command == "rescore":
+        rescorer = Rescorer(db, get_registry().get_analyzer())
+        ui.display_success(f"재평가 대상: {rescorer.count_candidates()}개")
+        count = rescorer.run(limit=args.limit)
+        ui.display_success(f"{count}개 게시물 재평가 완료")
+        get_registry().close()
+        return
+
+    # 보존 정책 자동 실행 (설정된 간격마다)
+    run_scheduled_retention(db)
+
     # 게시물 수 검증
-    if args.limit < SEARCH_CONFIG['min_limit'] or args.limit > SEARCH_CONFIG['max_limit']:
-        ui.display_error(f"게시물 수는 {SEARCH_CONFIG['min_limit']}개 이상 {SEARCH_CONFIG['max_limit']}개 이하여야 합니다.")
+    max_limit = DEEP_MAX_LIMIT if args.deep else SEARCH_CONFIG['max_limit']
+    if args.limit < SEARCH_CONFIG['min_limit'] or args.limit > max_limit:
+        ui.display_error(f"게시물 수는 {SEARCH_CONFIG['min_limit']}개 이상 {max_limit}개 이하여야 합니다.")
         return
 
+    # 워커 모드
+    if args.worker:
+        processed = run_worker(db, args.worker_kinds, exit_when_idle=args.exit_when_idle)
+        ui.display_success(f"워커 종료: {processed}개 작업 처리")
+
+    # 큐 등록 모드
+    elif args.enqueue and args.keywords:
+        search_id = submit_search(
+            db, args.keywords, args.subreddits, args.limit, deep=args.deep
+        )
+        ui.display_success(f"작업 큐에 등록됨 (검색 ID: {search_id[:8]})")
+
+    # 배치 모드
+    elif args.batch:
+        try:
+            specs = load_batch_specs(args.batch)
+        except (OSError, ValueError) as e:
+            ui.display_error(f"배치 파일 읽기 실패: {e}")
+            return
+        summary = run_batch(ui, db, specs)
+        ui.display_batch_summary(summary)
+        cascade = get_registry().get_analyzer().cascade_metrics()
+        if cascade["enabled"] and cascade["screened"]:
+            ui.display_cascade_metrics(cascade)
+
     # 대화형 모드
-    if args.interactive or not args.keywords:
+    elif args.interactive or not args.keywords:
+        # 유휴 시간에 저신뢰 평가를 백그라운드로 재평가 (검색 중에는 일시 정지)
+        if RESCORE_CONFIG["background"]:
+            start_background_rescorer(db, get_registry().get_analyzer())
+
         while True:
             choice = ui.prompt_menu()
 
@@ -55,115 +170,231 @@ def main():
                 limit = ui.prompt_limit()
 
                 # 검색 수행
-                search_and_analyze(ui, db, keywords, subreddits, limit)
+                search_and_analyze(
+                    ui,
+                    db,
+                    keywords,
+                    subreddits,
+                    limit,
+                    use_async=args.use_async,
+                    profile=args.profile,
+                    trace_memory=args.trace_memory,
+                )
 
             elif choice == "2":  # 검색 기록
                 searches = db.get_recent_searches()
                 ui.display_search_history(searches)
 
                 if searches and ui.confirm_action("특정 검색 결과를 보시겠습니까?"):
-                    search_id = input("검색 ID (처음 8자리): ")
-                    posts = db.get_posts_by_search(search_id)
-                    ui.display_posts(posts, f"검색 ID: {search_id}")
+                    search_id = input("검색 ID (처음 8자리): ").strip()
+                    if not search_id:
+                        # 빈 접두사는 모든 검색과 일치하므로 받지 않음
+                        ui.display_error("검색 ID를 입력하세요.")
+                    else:
+                        ui.browse_posts(
+                            lambda after, size: db.get_posts_page(
+                                search_id=search_id, after=after, page_size=size
+                            ),
+                            f"검색 ID: {search_id}",
+                        )
 
             elif choice == "3":  # 상위 게시물
-                days = int(input("며칠간의 데이터? (기본: 7): ") or "7")
-                posts = db.get_top_posts(days=days)
-                ui.display_posts(posts, f"최근 {days}일 상위 게시물")
-
-            elif choice == "4":  # 설정
+                days = ui.prompt_days(7)
+                ui.browse_posts(
+                    lambda after, size: db.get_posts_page(
+                        days=days, after=after, page_size=size
+                    ),
+                    f"최근 {days}일 상위 게시물",
+                )
+
+            elif choice == "4":  # 트렌드 (집계 테이블만 조회)
+                days = ui.prompt_days(30)
+                ui.display_trends(
+                    db.get_trends(days=days, limit=UI_CONFIG["max_posts_display"]), days
+                )
+
+            elif choice == "5":  # 설정
                 ui.display_error("설정 기능은 아직 구현되지 않았습니다.")
 
-            elif choice == "5":  # 종료
+            elif choice == "6":  # 종료
                 ui.display_success("프로그램을 종료합니다.")
                 break
 
     else:
         # CLI 모드로 단일 검색 수행
-        search_and_analyze(ui, db, args.keywords, args.subreddits, args.limit)
+        search_and_analyze(
+            ui,
+            db,
+            args.keywords,
+            args.subreddits,
+            args.limit,
+            deep=args.deep,
+            use_async=args.use_async,
+            profile=args.profile,
+            trace_memory=args.trace_memory,
+        )
 
+    get_registry().close()
+
+
+def search_and_analyze(
+    ui,
+    db,
+    keywords,
+    subreddits,
+    limit,
+    deep=False,
+    use_async=False,
+    profile=False,
+    trace_memory=False,
+):
+    """
+    검색 및 분석 수행 (deep이면 목록 상한을 넘는 심층 검색, use_async면 비동기 엔진 사용)
+
+    profile/trace_memory가 켜지면 단계(fetch, analyze, insights, save, render)별
+    cProfile/tracemalloc 보고서를 검색 ID 이름으로 DB 옆 profiles/에 저장합니다.
+    """
+    # 검색 ID 생성
+    search_id = str(uuid.uuid4())
+    profiler = StageProfiler(
+        search_id, report_dir(db), profile=profile, trace_memory=trace_memory
+    )
 
-def search_and_analyze(ui, db, keywords, subreddits, limit):
-    """검색 및 분석 수행"""
     try:
-        # 검색 ID 생성
-        search_id = str(uuid.uuid4())
-
         # 파라미터 표시
         ui.display_search_params(keywords, subreddits, limit)
 
-        # Reddit 클라이언트 초기화
+        # Reddit 클라이언트 / 콘텐츠 분석기 (프로세스 내에서 재사용)
         ui.display_success("Reddit API 연결 중...")
-        reddit_client = RedditClient()
-
-        # 콘텐츠 분석기 초기화
-        analyzer = ContentAnalyzer()
-
-        # 진행 상황 표시
-        with ui.show_progress("Reddit 검색 중...") as progress:
-            task = progress.add_task("검색 중...", total=100)
-
+        registry = get_registry()
+        reddit_client = registry.get_reddit_client()
+        analyzer = registry.get_analyzer()
+        analyzer.reset_metrics()
+
+        # 실시간 결과 표시 (검색 중에는 백그라운드 재평가 일시 정지)
+        # 평가가 끝나는 대로 상위 게시물과 처리량을 갱신
+        threshold = FILTER_CRITERIA["min_relevance_score"]
+        live = LiveResults(
+            UI_CONFIG["live_top_k"], threshold, latency_fn=analyzer.average_latency
+        )
+        with background_paused(), ui.show_live_results(live):
             # Reddit에서 게시물 가져오기
-            progress.update(task, advance=20, description="게시물 수집 중...")
-            posts = reddit_client.search_posts(keywords, subreddits, limit)
-
-            # AI 분석 수행
-            progress.update(task, advance=30, description="AI 분석 중...")
-            filtered_posts = []
-
-            for post in posts:
-                relevance_score, reason = analyzer.analyze_relevance(post, keywords)
-                post["relevance_score"] = relevance_score
-                post["analysis_reason"] = reason
-
-                # 관련성 점수가 0.5 이상인 게시물만 필터링
-                if relevance_score >= 0.5:
-                    filtered_posts.append(post)
-
-                # 진행률 업데이트
-                progress.update(task, advance=40 / len(posts) if posts else 0)
+            live.set_stage("게시물 수집 중...")
+            if use_async:
+                # 비동기 엔진: 수집과 평가 요청을 한 이벤트 루프에서 동시에 처리
+                def _on_progress(stage, done, total):
+                    if stage == "fetch":
+                        live.set_stage("AI 분석 중...", total=total)
+
+                with profiler.stage("fetch_analyze"):
+                    posts, filtered_posts = asyncio.run(
+                        search_and_score_async(
+                            analyzer,
+                            keywords,
+                            subreddits,
+                            limit,
+                            deep,
+                            progress=_on_progress,
+                            on_result=live.add,
+                        )
+                    )
+            else:
+                with profiler.stage("fetch"):
+                    if deep:
+                        posts = reddit_client.search_posts_deep(keywords, subreddits, limit)
+                    else:
+                        posts = reddit_client.search_posts(keywords, subreddits, limit)
+
+                # AI 분석 수행
+                live.set_stage("AI 분석 중...", total=len(posts))
+                filtered_posts = []
+
+                with profiler.stage("analyze"):
+                    for post in posts:
+                        relevance_score, reason = analyzer.analyze_relevance(post, keywords)
+                        post["relevance_score"] = relevance_score
+                        post["analysis_reason"] = reason
+
+                        # 관련성 점수가 임계값(기본 0.5) 이상인 게시물만 필터링
+                        if relevance_score >= threshold:
+                            filtered_posts.append(post)
+
+                        live.add(post)
 
             # 인사이트 추출
-            progress.update(task, advance=10, description="인사이트 추출 중...")
-            insights = analyzer.extract_insights(filtered_posts)
+            live.set_stage("인사이트 추출 중...")
+            with profiler.stage("insights"):
+                insights = analyzer.extract_insights(
+                    filtered_posts,
+                    cache=db,
+                    comments_loader=comments_loader_for(reddit_client),
+                )
 
             # 데이터베이스 저장
-            progress.update(task, description="데이터 저장 중...")
-            db.save_search(
-                search_id,
-                keywords,
-                subreddits,
-                len(posts),
-                len(filtered_posts),
-                insights,
-            )
-            db.save_posts(search_id, filtered_posts)
-
-            progress.update(task, advance=100, description="완료!")
+            live.set_stage("데이터 저장 중...")
+            with profiler.stage("save"):
+                heuristic_ids = [p["id"] for p in posts if p.get("scored_by") == "heuristic"]
+                db.save_search(
+                    search_id,
+                    keywords,
+                    subreddits,
+                    len(posts),
+                    len(filtered_posts),
+                    insights,
+                    heuristic_post_ids=heuristic_ids,
+                )
+                db.save_posts(search_id, filtered_posts)
 
         # 결과 표시
-        ui.console.print()
-        ui.display_success(
-            f"총 {len(posts)}개 중 {len(filtered_posts)}개 게시물 필터링됨"
-        )
-
-        # 필터링된 게시물 표시
-        ui.display_posts(filtered_posts, "필터링된 게시물")
-
-        # 인사이트 표시
-        ui.console.print()
-        ui.display_insights(insights)
+        with profiler.stage("render"):
+            ui.console.print()
+            ui.display_success(
+                f"총 {len(posts)}개 중 {len(filtered_posts)}개 게시물 필터링됨"
+            )
+            parse_stats = analyzer.parse_metrics()
+            if heuristic_ids:
+                ui.display_error(
+                    f"Ollama 응답이 없거나 해석할 수 없어 {len(heuristic_ids)}개 게시물은 키워드 규칙으로 평가되었습니다."
+                )
+            if parse_stats["failed"] or parse_stats["repaired"]:
+                ui.console.print(
+                    f"[dim]LLM 응답 {parse_stats['total']}개 중 복구 {parse_stats['repaired']}개, "
+                    f"파싱 실패 {parse_stats['failed']}개 ({parse_stats['failure_rate']:.0%})[/dim]"
+                )
+
+            # 인사이트 표시
+            ui.display_insights(insights)
+            ui.console.print()
+
+            # 여러 Ollama 호스트를 쓰는 경우 호스트별 지표 표시
+            if len(analyzer.router.endpoints) > 1:
+                ui.display_llm_metrics(analyzer.router.metrics())
+                ui.console.print()
+
+            # 2단계 평가를 쓰는 경우 재확인 비율과 단계별 지연 시간 표시
+            cascade = analyzer.cascade_metrics()
+            if cascade["enabled"] and cascade["screened"]:
+                ui.display_cascade_metrics(cascade)
+                ui.console.print()
+
+        # 프로파일 보고서 저장 (페이지 탐색은 사용자 입력 대기이므로 측정하지 않음)
+        report_paths = profiler.write_reports()
+        if report_paths:
+            ui.display_success(
+                f"프로파일 보고서 {len(report_paths)}개 저장: {profiler.output_dir}"
+            )
 
-        # 상세 보기 옵션
-        if filtered_posts and ui.confirm_action(
-            "\n특정 게시물의 상세 정보를 보시겠습니까?"
-        ):
-            post_num = int(input("게시물 번호 (1-20): ")) - 1
-            if 0 <= post_num < len(filtered_posts):
-                ui.display_post_detail(filtered_posts[post_num])
+        # 필터링된 게시물 페이지 탐색 (번호 입력 시 상세 보기)
+        ui.browse_posts(
+            list_page_fetcher(filtered_posts, key=lambda p: p["relevance_score"]),
+            "필터링된 게시물 (관련성 순)",
+        )
 
     except Exception as e:
         ui.display_error(f"검색 중 오류 발생: {str(e)}")
+    finally:
+        # 단계 도중 실패해도 측정한 단계까지 보고서를 남기고 tracemalloc 추적 종료
+        profiler.close()
 
 
 if __name__ == "__main__":
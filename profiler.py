@@ -0,0 +1,225 @@
+"""
+단계별 프로파일러 - 검색 파이프라인 단계마다 cProfile/tracemalloc 측정 후 보고서 저장
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List
+
+from config import PROFILE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 측정을 끈 경우 모든 단계가 공유하는 빈 컨텍스트
+_DISABLED = nullcontext()
+
+# 메모리 비교에서 제외할 측정 도구 자체/임포트 시스템 할당
+_MEMORY_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, cProfile.__file__),
+    tracemalloc.Filter(False, pstats.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def report_dir(db) -> str:
+    """
+    보고서 저장 디렉터리
+
+    PROFILE_DIR이 지정되지 않으면 SQLite DB 파일 옆(서버형 DB면 현재 디렉터리)의 profiles/
+
+    Args:
+        db: Database
+
+    Returns:
+        디렉터리 경로
+    """
+    if PROFILE_CONFIG["dir"]:
+        return PROFILE_CONFIG["dir"]
+    url = db.engine.url
+    base = "."
+    if url.get_backend_name() == "sqlite" and url.database and url.database != ":memory:":
+        base = os.path.dirname(os.path.abspath(url.database))
+    return os.path.join(base, "profiles")
+
+
+def _mib(size: int) -> str:
+    """바이트를 MiB 문자열로"""
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+class StageProfiler:
+    """
+    검색 한 번의 단계별 프로파일러
+
+    stage(name)으로 감싼 구간마다 cProfile 통계와 tracemalloc 스냅샷 차이를 모으고,
+    write_reports()에서 search_id를 붙인 파일로 저장합니다. 둘 다 꺼져 있으면 stage()는
+    공유된 빈 컨텍스트를 반환하므로 측정 비용이 없습니다.
+
+    cProfile은 stage()를 호출한 스레드만 측정합니다 (작업 스레드 풀 내부는 제외).
+    """
+
+    def __init__(
+        self,
+        search_id: str,
+        output_dir: str,
+        profile: bool = False,
+        trace_memory: bool = False,
+    ):
+        """
+        프로파일러 초기화
+
+        Args:
+            search_id: 보고서 파일 이름에 붙일 검색 ID
+            output_dir: 보고서 저장 디렉터리
+            profile: cProfile 측정 여부
+            trace_memory: tracemalloc 측정 여부
+        """
+        self.search_id = search_id
+        self.output_dir = output_dir
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.stages: List[Dict[str, Any]] = []
+        self._started_tracing = False
+        self._reported = False
+
+    @property
+    def enabled(self) -> bool:
+        """측정 여부"""
+        return self.profile or self.trace_memory
+
+    def stage(self, name: str):
+        """
+        단계 측정 컨텍스트
+
+        Args:
+            name: 단계 이름 (fetch, analyze, insights, save, render)
+
+        Returns:
+            with 문으로 사용하는 컨텍스트 (측정을 끄면 빈 컨텍스트)
+        """
+        if not self.enabled:
+            return _DISABLED
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str):
+        """단계 하나의 실제 측정"""
+        record: Dict[str, Any] = {"name": name}
+
+        before = None
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(PROFILE_CONFIG["memory_frames"])
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            before = tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+            record["memory_start"] = tracemalloc.get_traced_memory()[0]
+
+        profiler = cProfile.Profile() if self.profile else None
+        started = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+            record["elapsed"] = time.perf_counter() - started
+
+            if profiler:
+                record["stats"] = pstats.Stats(profiler)
+            if before is not None:
+                current, peak = tracemalloc.get_traced_memory()
+                after = tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+                record["memory_end"] = current
+                record["memory_peak"] = peak
+                record["allocations"] = after.compare_to(before, "lineno")[
+                    : PROFILE_CONFIG["top_n"]
+                ]
+            self.stages.append(record)
+
+    def write_reports(self) -> List[str]:
+        """
+        측정 결과를 파일로 저장
+
+        cProfile: 단계별 {search_id}_{단계}.pstats와 요약 {search_id}_profile.txt
+        tracemalloc: 단계별 피크/증가량과 상위 할당 위치 {search_id}_memory.txt
+
+        Returns:
+            저장한 파일 경로 리스트 (측정을 껐으면 빈 리스트)
+        """
+        if not self.enabled or not self.stages:
+            return []
+        self._reported = True
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        prefix = os.path.join(self.output_dir, self.search_id)
+        paths = []
+
+        if self.profile:
+            summary = io.StringIO()
+            summary.write(f"search_id: {self.search_id}\n")
+            for record in self.stages:
+                stats = record["stats"]
+                path = f"{prefix}_{record['name']}.pstats"
+                stats.dump_stats(path)
+                paths.append(path)
+
+                summary.write(f"\n[{record['name']}] {record['elapsed']:.3f}초\n")
+                stats.stream = summary
+                stats.sort_stats("cumulative").print_stats(PROFILE_CONFIG["top_n"])
+
+            path = f"{prefix}_profile.txt"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(summary.getvalue())
+            paths.append(path)
+
+        if self.trace_memory:
+            lines = [f"search_id: {self.search_id}"]
+            for record in self.stages:
+                growth = record["memory_end"] - record["memory_start"]
+                lines.append("")
+                lines.append(
+                    f"[{record['name']}] {record['elapsed']:.3f}초, "
+                    f"피크 {_mib(record['memory_peak'])}, "
+                    f"증가 {'+' if growth >= 0 else '-'}{_mib(abs(growth))}"
+                )
+                for stat in record["allocations"]:
+                    lines.append(f"  {stat}")
+
+            path = f"{prefix}_memory.txt"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            paths.append(path)
+
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+        logger.info("프로파일 보고서 %d개 저장: %s", len(paths), self.output_dir)
+        return paths
+
+    def close(self) -> List[str]:
+        """
+        측정 종료
+
+        단계 도중 예외가 나 write_reports()가 호출되지 않았으면 그때까지 측정한 단계의
+        보고서를 저장하고, 직접 시작한 tracemalloc 추적을 멈춥니다.
+
+        Returns:
+            이번에 저장한 파일 경로 리스트
+        """
+        paths = [] if self._reported else self.write_reports()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return paths
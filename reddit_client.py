@@ -3,15 +3,48 @@ Reddit API 클라이언트 - PRAW를 사용한 Reddit 데이터 수집
 """
 
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 
 import praw
+import requests
 
-from config import REDDIT_CONFIG
+from config import REDDIT_CONFIG, SEARCH_CONFIG
+from http_cache import CachingSession, create_http_cache
+from request_cache import SingleFlightCache
+import traffic_archive
 
 logger = logging.getLogger(__name__)
 
+# Reddit 목록 API가 한 번에 반환하는 최대 게시물 수
+LISTING_CEILING = 1000
+
+# 심층 검색에 사용하는 (정렬, 기간) 조합 - 각 조합이 서로 다른 1000개 창을 반환
+DEEP_SEARCH_SLICES = [
+    ("relevance", "all"),
+    ("new", "all"),
+    ("top", "all"),
+    ("comments", "all"),
+    ("hot", "all"),
+    ("top", "year"),
+    ("relevance", "year"),
+    ("comments", "year"),
+    ("top", "month"),
+    ("relevance", "month"),
+    ("comments", "month"),
+    ("top", "week"),
+    ("relevance", "week"),
+    ("top", "day"),
+    ("relevance", "day"),
+    ("top", "hour"),
+]
+
+# 심층 검색으로 서브레딧마다 모을 수 있는 최대 게시물 수 (조합마다 LISTING_CEILING개)
+DEEP_MAX_LIMIT = len(DEEP_SEARCH_SLICES) * LISTING_CEILING
+
 
 class RedditClient:
     """Reddit API 클라이언트"""
@@ -30,14 +63,64 @@ class RedditClient:
             client_secret: Reddit API 클라이언트 시크릿
             user_agent: User Agent 문자열
         """
-        self.reddit = praw.Reddit(
-            client_id=client_id or REDDIT_CONFIG["client_id"],
-            client_secret=client_secret or REDDIT_CONFIG["client_secret"],
-            user_agent=user_agent or REDDIT_CONFIG["user_agent"],
+        self._credentials = {
+            "client_id": client_id or REDDIT_CONFIG["client_id"],
+            "client_secret": client_secret or REDDIT_CONFIG["client_secret"],
+            "user_agent": user_agent or REDDIT_CONFIG["user_agent"],
+        }
+        # 목록/댓글 응답 디스크 캐시 (HTTP_CACHE=false면 None, 모든 PRAW 인스턴스가 공유)
+        # 녹화/재생 중에는 모든 요청이 아카이브를 거치도록 디스크 캐시를 쓰지 않음
+        self._http_cache = (
+            create_http_cache() if traffic_archive.active_archive() is None else None
+        )
+        self.reddit = self._create_reddit()
+        # 심층 검색 작업 스레드용 PRAW 인스턴스 (PRAW는 스레드 안전하지 않으므로 스레드마다 따로 사용)
+        self._worker_clients: "queue.Queue[praw.Reddit]" = queue.Queue()
+        # 동일 목록/댓글 요청 병합 및 짧은 TTL 캐시
+        self._cache = SingleFlightCache(ttl=REDDIT_CONFIG["listing_cache_ttl"])
+
+    def _create_reddit(self) -> praw.Reddit:
+        """PRAW 인스턴스 생성 (인스턴스마다 별도 세션과 속도 제한기 사용)"""
+        if traffic_archive.active_archive() is not None:
+            session = traffic_archive.mount(requests.Session())
+        elif self._http_cache is not None:
+            session = CachingSession(self._http_cache)
+        else:
+            session = None
+        return praw.Reddit(
+            **self._credentials,
+            requestor_kwargs={"session": session} if session else None,
         )
 
+    @contextmanager
+    def _worker_reddit(self) -> Iterator[praw.Reddit]:
+        """
+        작업 스레드용 PRAW 인스턴스 대여
+
+        쉬고 있는 인스턴스가 없으면 새로 만들고, 사용이 끝나면 반납해 다음 심층 검색에서도
+        재사용합니다 (토큰 재발급 최소화). 한 인스턴스는 한 번에 한 스레드만 사용합니다.
+        """
+        try:
+            reddit = self._worker_clients.get_nowait()
+        except queue.Empty:
+            reddit = self._create_reddit()
+        try:
+            yield reddit
+        finally:
+            self._worker_clients.put(reddit)
+
+    def close(self) -> None:
+        """HTTP 디스크 캐시 연결 닫기"""
+        if self._http_cache is not None:
+            self._http_cache.close()
+            self._http_cache = None
+
     def search_posts(
-        self, keywords: List[str], subreddits: List[str], limit: int = 50
+        self,
+        keywords: List[str],
+        subreddits: List[str],
+        limit: int = 50,
+        progress: Optional[Callable[[], Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
         키워드로 Reddit 게시물 검색
@@ -46,49 +129,212 @@ class RedditClient:
             keywords: 검색할 키워드 리스트
             subreddits: 검색할 서브레딧 리스트
             limit: 가져올 게시물 수
+            progress: 서브레딧 하나를 가져올 때마다 호출할 함수 (예: 작업 임대 연장)
 
         Returns:
             게시물 정보 딕셔너리 리스트
         """
         posts = []
         query = " OR ".join(keywords)
+        # OR 검색은 순서와 대소문자에 무관하므로 정규화된 키로 병합
+        query_key = tuple(sorted({kw.lower() for kw in keywords}))
 
         for subreddit_name in subreddits:
             try:
-                if subreddit_name.lower() == "all":
-                    subreddit = self.reddit.subreddit("all")
-                else:
-                    subreddit = self.reddit.subreddit(subreddit_name)
-
-                # 검색 수행
-                for submission in subreddit.search(query, limit=limit):
-                    post_data = {
-                        "id": submission.id,
-                        "title": submission.title,
-                        "author": (
-                            str(submission.author) if submission.author else "[deleted]"
-                        ),
-                        "subreddit": submission.subreddit.display_name,
-                        "text": submission.selftext,
-                        "url": submission.url,
-                        "score": submission.score,
-                        "num_comments": submission.num_comments,
-                        "created_utc": datetime.fromtimestamp(submission.created_utc),
-                        "permalink": f"https://reddit.com{submission.permalink}",
-                        "keywords_matched": [
-                            kw
-                            for kw in keywords
-                            if kw.lower() in submission.title.lower()
-                            or kw.lower() in submission.selftext.lower()
-                        ],
-                    }
-                    posts.append(post_data)
+                listing = self._cached_search(subreddit_name, query, query_key, limit)
+                posts.extend(self._with_matches(listing, keywords))
 
             except Exception as e:
                 logger.error(f"서브레딧 {subreddit_name} 검색 중 오류: {e}")
 
+            if progress:
+                progress()
+
+        return posts
+
+    def search_posts_deep(
+        self,
+        keywords: List[str],
+        subreddits: List[str],
+        limit: int,
+        workers: Optional[int] = None,
+        progress: Optional[Callable[[], Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        목록 상한(1000개)을 넘는 심층 검색
+
+        여러 (정렬, 기간) 조합으로 검색 창을 나누어 병렬로 가져온 뒤
+        게시물 ID 기준으로 병합합니다. 병합 순서는 DEEP_SEARCH_SLICES 순서를
+        따르므로 같은 응답에 대해 항상 같은 결과가 나옵니다. 작업 스레드마다
+        별도의 PRAW 인스턴스를 사용합니다.
+
+        Args:
+            keywords: 검색할 키워드 리스트
+            subreddits: 검색할 서브레딧 리스트
+            limit: 서브레딧별 최대 고유 게시물 수 (search_posts와 같이 서브레딧마다 적용)
+            workers: 동시 요청 수 (None이면 config에서 가져옴)
+            progress: 검색 창 하나를 가져올 때마다 호출할 함수 (호출 스레드에서 실행)
+
+        Returns:
+            중복 제거된 게시물 정보 딕셔너리 리스트
+        """
+        if limit <= LISTING_CEILING:
+            return self.search_posts(keywords, subreddits, limit, progress=progress)
+
+        query = " OR ".join(keywords)
+        query_key = tuple(sorted({kw.lower() for kw in keywords}))
+        window = min(limit, LISTING_CEILING)
+        slices = [
+            (name, sort, time_filter)
+            for name in subreddits
+            for sort, time_filter in DEEP_SEARCH_SLICES
+        ]
+
+        def _fetch_slice(slice_spec) -> List[Dict[str, Any]]:
+            name, sort, time_filter = slice_spec
+            try:
+                with self._worker_reddit() as reddit:
+                    return self._cached_search(
+                        name, query, query_key, window, sort, time_filter, reddit=reddit
+                    )
+            except Exception as e:
+                logger.error(
+                    f"서브레딧 {name} 심층 검색({sort}/{time_filter}) 중 오류: {e}"
+                )
+                return []
+
+        with ThreadPoolExecutor(
+            max_workers=workers or SEARCH_CONFIG["deep_workers"]
+        ) as executor:
+            # map은 입력 순서대로 결과를 돌려주므로 병합 순서가 안정적
+            listings = []
+            for listing in executor.map(_fetch_slice, slices):
+                listings.append(listing)
+                if progress:
+                    progress()
+
+        merged = self._merge_slices(slices, listings, limit)
+        logger.info(
+            "심층 검색: 창 %d개에서 고유 게시물 %d개 수집", len(slices), len(merged)
+        )
+        return self._with_matches(merged, keywords)
+
+    @staticmethod
+    def _merge_slices(
+        slices: List[Tuple[str, str, str]],
+        listings: List[List[Dict[str, Any]]],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        심층 검색 창 결과를 게시물 ID 기준으로 병합
+
+        Args:
+            slices: (서브레딧, 정렬, 기간) 리스트
+            listings: 창별 게시물 리스트 (slices와 같은 순서)
+            limit: 서브레딧별 최대 고유 게시물 수
+
+        Returns:
+            입력 순서대로 병합된 고유 게시물 리스트
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+        taken: Dict[str, int] = {}
+        for (name, _, _), listing in zip(slices, listings):
+            for item in listing:
+                if taken.get(name, 0) >= limit:
+                    break
+                if item["id"] not in merged:
+                    merged[item["id"]] = item
+                    taken[name] = taken.get(name, 0) + 1
+        return list(merged.values())
+
+    def _cached_search(
+        self,
+        subreddit_name: str,
+        query: str,
+        query_key: tuple,
+        limit: int,
+        sort: str = "relevance",
+        time_filter: str = "all",
+        reddit: Optional[praw.Reddit] = None,
+    ) -> List[Dict[str, Any]]:
+        """검색 목록 조회 (동일 요청 병합 및 TTL 캐시 적용)"""
+        return self._cache.get(
+            ("search", subreddit_name.lower(), query_key, limit, sort, time_filter),
+            lambda: self._fetch_search(
+                subreddit_name, query, limit, sort, time_filter, reddit=reddit
+            ),
+        )
+
+    @staticmethod
+    def _with_matches(
+        listing: List[Dict[str, Any]], keywords: List[str]
+    ) -> List[Dict[str, Any]]:
+        """공유 목록을 복사하며 호출자 키워드 기준 keywords_matched 추가"""
+        posts = []
+        for item in listing:
+            post_data = dict(item)
+            post_data["keywords_matched"] = [
+                kw
+                for kw in keywords
+                if kw.lower() in item["title"].lower()
+                or kw.lower() in item["text"].lower()
+            ]
+            posts.append(post_data)
         return posts
 
+    def _fetch_search(
+        self,
+        subreddit_name: str,
+        query: str,
+        limit: int,
+        sort: str = "relevance",
+        time_filter: str = "all",
+        reddit: Optional[praw.Reddit] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        서브레딧 검색 목록 실제 요청
+
+        Args:
+            subreddit_name: 서브레딧 이름
+            query: 검색 쿼리
+            limit: 가져올 게시물 수
+            sort: 정렬 기준 (relevance, hot, top, new, comments)
+            time_filter: 기간 (all, year, month, week, day, hour)
+            reddit: 사용할 PRAW 인스턴스 (None이면 기본 인스턴스)
+
+        Returns:
+            게시물 정보 딕셔너리 리스트 (keywords_matched 제외)
+        """
+        reddit = reddit or self.reddit
+        if subreddit_name.lower() == "all":
+            subreddit = reddit.subreddit("all")
+        else:
+            subreddit = reddit.subreddit(subreddit_name)
+
+        # 검색 수행
+        return [
+            self._submission_to_dict(submission)
+            for submission in subreddit.search(
+                query, sort=sort, time_filter=time_filter, limit=limit
+            )
+        ]
+
+    @staticmethod
+    def _submission_to_dict(submission) -> Dict[str, Any]:
+        """PRAW Submission을 게시물 딕셔너리로 변환"""
+        return {
+            "id": submission.id,
+            "title": submission.title,
+            "author": str(submission.author) if submission.author else "[deleted]",
+            "subreddit": submission.subreddit.display_name,
+            "text": submission.selftext,
+            "url": submission.url,
+            "score": submission.score,
+            "num_comments": submission.num_comments,
+            "created_utc": datetime.fromtimestamp(submission.created_utc),
+            "permalink": f"https://reddit.com{submission.permalink}",
+        }
+
     def get_post_comments(self, post_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         게시물의 댓글 가져오기
@@ -100,23 +346,39 @@ class RedditClient:
         Returns:
             댓글 정보 딕셔너리 리스트
         """
-        comments = []
-
         try:
-            submission = self.reddit.submission(id=post_id)
-            submission.comments.replace_more(limit=0)  # 더보기 제거
-
-            for comment in submission.comments.list()[:limit]:
-                comment_data = {
-                    "id": comment.id,
-                    "author": str(comment.author) if comment.author else "[deleted]",
-                    "body": comment.body,
-                    "score": comment.score,
-                    "created_utc": datetime.fromtimestamp(comment.created_utc),
-                }
-                comments.append(comment_data)
+            comments = self._cache.get(
+                ("comments", post_id, limit),
+                lambda: self._fetch_comments(post_id, limit),
+            )
+            return [dict(comment) for comment in comments]
 
         except Exception as e:
             logger.error(f"댓글 가져오기 오류: {e}")
 
-        return comments
+        return []
+
+    def _fetch_comments(self, post_id: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        게시물 댓글 실제 요청
+
+        Args:
+            post_id: Reddit 게시물 ID
+            limit: 가져올 댓글 수
+
+        Returns:
+            댓글 정보 딕셔너리 리스트
+        """
+        submission = self.reddit.submission(id=post_id)
+        submission.comments.replace_more(limit=0)  # 더보기 제거
+
+        return [
+            {
+                "id": comment.id,
+                "author": str(comment.author) if comment.author else "[deleted]",
+                "body": comment.body,
+                "score": comment.score,
+                "created_utc": datetime.fromtimestamp(comment.created_utc),
+            }
+            for comment in submission.comments.list()[:limit]
+        ]
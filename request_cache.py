@@ -0,0 +1,94 @@
+"""
+요청 캐시 - 중복 요청 병합(single-flight)과 짧은 TTL 응답 캐시
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlightCache:
+    """
+    동일 키 요청을 하나로 합치고 완료된 결과를 잠시 보관하는 캐시
+
+    같은 키로 진행 중인 요청이 있으면 새로 실행하지 않고 그 결과를 기다리며,
+    완료된 결과는 TTL 동안 그대로 재사용합니다. 실패한 요청은 캐시하지 않습니다.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256):
+        """
+        캐시 초기화
+
+        Args:
+            ttl: 완료된 결과 보관 시간 (초, 0이면 진행 중 병합만 수행)
+            max_entries: 보관할 최대 결과 수
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._results: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, Future] = {}
+        self.stats = {"hits": 0, "coalesced": 0, "misses": 0}
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        키에 해당하는 결과 조회 (없으면 loader 실행)
+
+        Args:
+            key: 요청 식별 키 (URL과 파라미터 조합)
+            loader: 실제 요청을 수행하는 함수
+
+        Returns:
+            loader 결과 (다른 호출자와 공유되므로 수정하지 말 것)
+        """
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.stats["hits"] += 1
+                return entry[1]
+
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = Future()
+                self._inflight[key] = call
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            return call.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            call.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._inflight[key]
+            if self.ttl > 0:
+                self._store(key, value)
+        call.set_result(value)
+        return value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """결과 저장 (용량 초과 시 만료/오래된 항목 제거, 잠금 보유 상태에서 호출)"""
+        now = time.monotonic()
+        if len(self._results) >= self.max_entries:
+            for k in [k for k, (exp, _) in self._results.items() if exp <= now]:
+                del self._results[k]
+            while len(self._results) >= self.max_entries:
+                del self._results[next(iter(self._results))]
+        self._results[key] = (now + self.ttl, value)
+
+    def clear(self) -> None:
+        """보관 중인 결과 모두 제거"""
+        with self._lock:
+            self._results.clear()
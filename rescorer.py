@@ -0,0 +1,254 @@
+"""
+재평가 작업 - 규칙 기반/오래된 평가를 받은 게시물을 LLM으로 다시 평가
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import and_, or_
+
+from config import RESCORE_CONFIG
+from content_analyzer import ContentAnalyzer, PROMPT_VERSION
+from database import Database, PostRecord, SearchRecord
+
+logger = logging.getLogger(__name__)
+
+# LLM을 쓰지 못했을 때 남는 분석 이유
+FALLBACK_REASONS = ["JSON 파싱 실패", "JSON 파싱 오류"]
+FALLBACK_REASON_PATTERN = "키워드 %개 일치"
+
+
+class Rescorer:
+    """
+    저신뢰 평가 게시물 재평가기
+
+    규칙 기반으로 평가되었거나 JSON 파싱에 실패한 게시물, 현재와 다른 모델/
+    프롬프트 버전으로 평가된 게시물을 ID 순으로 조금씩 가져와 다시 평가하고
+    점수를 일괄 갱신합니다. 시도한 게시물은 시각을 기록해 retry_hours 동안 제외하므로
+    재평가 후에도 대상으로 남는 게시물을 매 주기 반복해서 보내지 않습니다.
+    백그라운드 실행 중에는 pause()로 잠시 멈출 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        analyzer: ContentAnalyzer,
+        batch_size: Optional[int] = None,
+    ):
+        """
+        재평가기 초기화
+
+        Args:
+            db: 데이터베이스
+            analyzer: 콘텐츠 분석기
+            batch_size: 한 번에 재평가할 게시물 수 (None이면 config에서 가져옴)
+        """
+        self.db = db
+        self.analyzer = analyzer
+        self.batch_size = batch_size or RESCORE_CONFIG["batch_size"]
+        self._last_id = 0
+        self._resume = threading.Event()
+        self._resume.set()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.rescored = 0
+
+    def _stale_filter(self):
+        """재평가 대상 조건"""
+        conditions = [
+            PostRecord.scored_by == "heuristic",
+            PostRecord.analysis_reason.like(FALLBACK_REASON_PATTERN),
+            PostRecord.analysis_reason.in_(FALLBACK_REASONS),
+            and_(
+                PostRecord.scored_by == "llm",
+                or_(
+                    PostRecord.scored_model.notin_(self.analyzer.models),
+                    PostRecord.prompt_version != PROMPT_VERSION,
+                ),
+            ),
+        ]
+        if RESCORE_CONFIG["include_unversioned"]:
+            conditions.append(PostRecord.prompt_version.is_(None))
+        # 최근에 시도한 게시물은 대기 시간이 지날 때까지 제외
+        retry_before = datetime.utcnow() - timedelta(hours=RESCORE_CONFIG["retry_hours"])
+        return and_(
+            or_(*conditions),
+            or_(
+                PostRecord.rescore_attempted_at.is_(None),
+                PostRecord.rescore_attempted_at < retry_before,
+            ),
+        )
+
+    def count_candidates(self) -> int:
+        """남은 재평가 대상 수"""
+        with self.db.session_local() as session:
+            return session.query(PostRecord.id).filter(self._stale_filter()).count()
+
+    def _next_batch(self) -> List[Dict[str, Any]]:
+        """마지막으로 처리한 ID 이후의 재평가 대상 한 묶음 조회"""
+        with self.db.session_local() as session:
+            rows = (
+                session.query(
+                    PostRecord.id,
+                    PostRecord.reddit_id,
+                    PostRecord.title,
+                    PostRecord.content,
+                    PostRecord.score,
+                    PostRecord.num_comments,
+                    PostRecord.subreddit,
+                    PostRecord.created_utc,
+                    PostRecord.relevance_score,
+                    PostRecord.keywords_matched,
+                    SearchRecord.keywords,
+                )
+                .outerjoin(SearchRecord, SearchRecord.search_id == PostRecord.search_id)
+                .filter(PostRecord.id > self._last_id, self._stale_filter())
+                .order_by(PostRecord.id)
+                .limit(self.batch_size)
+                .all()
+            )
+        return [row._asdict() for row in rows]
+
+    def run_once(self) -> int:
+        """
+        재평가 한 묶음 처리
+
+        Returns:
+            시도한 게시물 수 (대상이 없거나 Ollama가 차단 중이면 0)
+        """
+        if self.analyzer.breaker.is_open:
+            return 0
+
+        rows = self._next_batch()
+        if not rows:
+            self._last_id = 0  # 다음 주기에는 처음부터 다시 확인
+            return 0
+
+        attempted = []
+        updates = []
+        for row in rows:
+            # 일시 정지 요청 시 남은 게시물은 다음 묶음으로 미룸
+            if not self._resume.is_set():
+                break
+
+            post = {
+                "id": row["reddit_id"],
+                "title": row["title"],
+                "text": row["content"] or "",
+                "score": row["score"],
+                "num_comments": row["num_comments"],
+                "keywords_matched": row["keywords_matched"] or [],
+            }
+            keywords = row["keywords"] or post["keywords_matched"]
+            relevance_score, reason = self.analyzer.analyze_relevance(post, keywords)
+
+            # Ollama가 차단되었으면 이 게시물부터 다음 주기로 미룸
+            if post["scored_by"] != "llm" and self.analyzer.breaker.is_open:
+                break
+
+            self._last_id = row["id"]
+            attempted.append(row["id"])
+
+            # 응답을 해석하지 못한 게시물은 기존 점수를 유지하고 시도만 기록해 건너뜀
+            if post["scored_by"] != "llm":
+                continue
+
+            updates.append(
+                {
+                    "id": row["id"],
+                    "relevance_score": relevance_score,
+                    "analysis_reason": reason,
+                    "scored_by": post["scored_by"],
+                    "scored_model": post["scored_model"],
+                    "prompt_version": post["prompt_version"],
+                    "old_relevance_score": row["relevance_score"],
+                    "created_utc": row["created_utc"],
+                    "subreddit": row["subreddit"],
+                    "keywords_matched": row["keywords_matched"],
+                }
+            )
+
+        self.db.update_scores(updates)
+        self.db.mark_rescore_attempted(attempted)
+        self.rescored += len(updates)
+        if updates:
+            logger.info("게시물 %d개 재평가 완료 (누적 %d개)", len(updates), self.rescored)
+        return len(attempted)
+
+    def run(self, limit: Optional[int] = None) -> int:
+        """
+        대상이 없어질 때까지 (또는 limit개를 시도할 때까지) 재평가
+
+        Returns:
+            LLM으로 재평가한 게시물 수
+        """
+        rescored = self.rescored
+        attempted = 0
+        while limit is None or attempted < limit:
+            processed = self.run_once()
+            if not processed:
+                break
+            attempted += processed
+        return self.rescored - rescored
+
+    def start_background(self) -> None:
+        """백그라운드 스레드에서 주기적으로 재평가"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._loop, name="rescorer", daemon=True
+        )
+        self._thread.start()
+
+    def _loop(self) -> None:
+        """백그라운드 루프 (일시 정지 중이면 대기)"""
+        while not self._stop.is_set():
+            self._resume.wait()
+            try:
+                processed = self.run_once()
+            except Exception as e:
+                logger.error("재평가 실패: %s", e)
+                processed = 0
+            delay = RESCORE_CONFIG["batch_delay"] if processed else RESCORE_CONFIG["idle_delay"]
+            self._stop.wait(delay)
+
+    def pause(self) -> None:
+        """진행 중인 게시물 평가가 끝나는 대로 재평가 일시 정지"""
+        self._resume.clear()
+
+    def resume(self) -> None:
+        """재평가 재개"""
+        self._resume.set()
+
+    def stop(self) -> None:
+        """백그라운드 재평가 종료"""
+        self._stop.set()
+        self._resume.set()
+
+
+_background: Optional[Rescorer] = None
+
+
+def start_background_rescorer(db: Database, analyzer: ContentAnalyzer) -> Rescorer:
+    """프로세스 전역 백그라운드 재평가기 시작"""
+    global _background
+    if _background is None:
+        _background = Rescorer(db, analyzer)
+        _background.start_background()
+    return _background
+
+
+@contextmanager
+def background_paused() -> Iterator[None]:
+    """대화형 검색 동안 백그라운드 재평가를 멈추는 컨텍스트"""
+    if _background is None:
+        yield
+        return
+    _background.pause()
+    try:
+        yield
+    finally:
+        _background.resume()
@@ -0,0 +1,371 @@
+"""
+보존 정책 - 오래된 기록을 압축 아카이브 DB로 옮기고 핫 DB를 압축
+"""
+
+import json
+import logging
+import zlib
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import (
+    create_engine,
+    Column,
+    Integer,
+    String,
+    Float,
+    DateTime,
+    LargeBinary,
+    JSON,
+    or_,
+)
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+
+from config import RETENTION_CONFIG
+from database import (
+    Database,
+    MaintenanceRun,
+    PostRecord,
+    SearchRecord,
+    SummaryCache,
+    add_missing_columns,
+)
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 - 없으면 zlib 사용
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ArchiveBase = declarative_base()
+
+
+class ArchivedSearch(ArchiveBase):
+    """보관된 검색 기록 (인사이트 압축 저장)"""
+
+    __tablename__ = "archived_searches"
+
+    id = Column(Integer, primary_key=True)
+    search_id = Column(String(50), unique=True)
+    keywords = Column(JSON)
+    subreddits = Column(JSON)
+    created_at = Column(DateTime)
+    post_count = Column(Integer)
+    filtered_count = Column(Integer)
+    insights = Column(LargeBinary)  # 압축된 JSON
+    codec = Column(String(10))
+    heuristic_post_ids = Column(JSON)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ArchivedPost(ArchiveBase):
+    """보관된 게시물 기록 (본문 압축 저장)"""
+
+    __tablename__ = "archived_posts"
+
+    id = Column(Integer, primary_key=True)
+    search_id = Column(String(50))
+    reddit_id = Column(String(20), unique=True)
+    title = Column(String)
+    author = Column(String(100))
+    subreddit = Column(String(100))
+    content = Column(LargeBinary)  # 압축된 본문
+    codec = Column(String(10))
+    url = Column(String)
+    score = Column(Integer)
+    num_comments = Column(Integer)
+    created_utc = Column(DateTime)
+    permalink = Column(String)
+    relevance_score = Column(Float)
+    analysis_reason = Column(String)
+    scored_by = Column(String(20))
+    scored_model = Column(String(100))
+    prompt_version = Column(String(20))
+    rescore_attempted_at = Column(DateTime)
+    keywords_matched = Column(JSON)
+    saved_at = Column(DateTime)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+
+def compress_text(text: Optional[str]) -> Tuple[bytes, str]:
+    """
+    텍스트 압축 (zstandard가 있으면 zstd, 없으면 zlib)
+
+    Returns:
+        (압축 데이터, 코덱 이름)
+    """
+    data = (text or "").encode("utf-8")
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(data), "zstd"
+    return zlib.compress(data, 9), "zlib"
+
+
+def decompress_text(data: bytes, codec: str) -> str:
+    """compress_text로 압축한 텍스트 복원"""
+    if codec == "zstd":
+        if zstandard is None:
+            raise ImportError("zstd로 압축된 기록입니다: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    return zlib.decompress(data).decode("utf-8")
+
+
+def open_archive(path: Optional[str] = None) -> sessionmaker:
+    """아카이브 DB 열기 (없으면 생성, 이전 아카이브에는 새 컬럼 추가)"""
+    engine = create_engine(f"sqlite:///{path or RETENTION_CONFIG['archive_path']}")
+    ArchiveBase.metadata.create_all(engine)
+    add_missing_columns(engine, ArchiveBase.metadata)
+    return sessionmaker(bind=engine)
+
+
+def archive_old_records(
+    db: Database,
+    archive_path: Optional[str] = None,
+    max_age_days: Optional[int] = None,
+    keep_min_relevance: Optional[float] = None,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """
+    보존 기간이 지난 기록을 아카이브 DB로 이동
+
+    저장 후 max_age_days가 지났고 관련성 점수가 keep_min_relevance 미만인
+    게시물을 옮기고, 남은 게시물이 없는 오래된 검색 기록도 옮깁니다.
+    아카이브에 먼저 커밋한 뒤 핫 DB에서 삭제하므로 중단되어도 유실되지 않습니다.
+    트렌드 집계 테이블은 그대로 유지됩니다.
+
+    Args:
+        db: 핫 데이터베이스
+        archive_path: 아카이브 DB 경로 (None이면 config에서 가져옴)
+        max_age_days: 보존 기간 (일)
+        keep_min_relevance: 기간과 무관하게 유지할 최소 관련성 점수
+        dry_run: True면 옮길 대상 수만 계산
+
+    Returns:
+        {"posts": 보관한 게시물 수, "searches": 보관한 검색 기록 수}
+    """
+    if max_age_days is None:
+        max_age_days = RETENTION_CONFIG["max_age_days"]
+    if keep_min_relevance is None:
+        keep_min_relevance = RETENTION_CONFIG["keep_min_relevance"]
+    chunk_size = RETENTION_CONFIG["chunk_size"]
+    cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+
+    post_filter = (
+        PostRecord.saved_at < cutoff,
+        or_(
+            PostRecord.relevance_score.is_(None),
+            PostRecord.relevance_score < keep_min_relevance,
+        ),
+    )
+    search_filter = (
+        SearchRecord.created_at < cutoff,
+        ~PostRecord.__table__.select()
+        .where(PostRecord.search_id == SearchRecord.search_id)
+        .exists(),
+    )
+
+    if dry_run:
+        with db.session_local() as session:
+            return {
+                "posts": session.query(PostRecord).filter(*post_filter).count(),
+                "searches": session.query(SearchRecord).filter(*search_filter).count(),
+            }
+
+    archive_session = open_archive(archive_path)
+    counts = {"posts": 0, "searches": 0}
+
+    while True:
+        with db.session_local() as session:
+            posts = (
+                session.query(PostRecord)
+                .filter(*post_filter)
+                .order_by(PostRecord.id)
+                .limit(chunk_size)
+                .all()
+            )
+            if not posts:
+                break
+
+            with archive_session() as archive:
+                existing = _archived_ids(
+                    archive, ArchivedPost.reddit_id, [p.reddit_id for p in posts]
+                )
+                archive.add_all(
+                    _to_archived_post(p) for p in posts if p.reddit_id not in existing
+                )
+                archive.commit()
+
+            session.query(PostRecord).filter(
+                PostRecord.id.in_([p.id for p in posts])
+            ).delete(synchronize_session=False)
+            session.commit()
+            counts["posts"] += len(posts)
+
+    while True:
+        with db.session_local() as session:
+            searches = (
+                session.query(SearchRecord)
+                .filter(*search_filter)
+                .order_by(SearchRecord.id)
+                .limit(chunk_size)
+                .all()
+            )
+            if not searches:
+                break
+
+            with archive_session() as archive:
+                existing = _archived_ids(
+                    archive, ArchivedSearch.search_id, [s.search_id for s in searches]
+                )
+                archive.add_all(
+                    _to_archived_search(s)
+                    for s in searches
+                    if s.search_id not in existing
+                )
+                archive.commit()
+
+            session.query(SearchRecord).filter(
+                SearchRecord.id.in_([s.id for s in searches])
+            ).delete(synchronize_session=False)
+            session.commit()
+            counts["searches"] += len(searches)
+
+    logger.info(
+        "보존 정책: 게시물 %d개, 검색 기록 %d개 아카이브로 이동",
+        counts["posts"],
+        counts["searches"],
+    )
+    return counts
+
+
+def _archived_ids(archive, column, ids: List[str]) -> set:
+    """아카이브에 이미 있는 ID 조회 (재실행 시 중복 방지)"""
+    return {row[0] for row in archive.query(column).filter(column.in_(ids))}
+
+
+def _to_archived_post(post: PostRecord) -> ArchivedPost:
+    """게시물 기록을 압축된 아카이브 기록으로 변환"""
+    content, codec = compress_text(post.content)
+    return ArchivedPost(
+        search_id=post.search_id,
+        reddit_id=post.reddit_id,
+        title=post.title,
+        author=post.author,
+        subreddit=post.subreddit,
+        content=content,
+        codec=codec,
+        url=post.url,
+        score=post.score,
+        num_comments=post.num_comments,
+        created_utc=post.created_utc,
+        permalink=post.permalink,
+        relevance_score=post.relevance_score,
+        analysis_reason=post.analysis_reason,
+        scored_by=post.scored_by,
+        scored_model=post.scored_model,
+        prompt_version=post.prompt_version,
+        rescore_attempted_at=post.rescore_attempted_at,
+        keywords_matched=post.keywords_matched,
+        saved_at=post.saved_at,
+    )
+
+
+def _to_archived_search(search: SearchRecord) -> ArchivedSearch:
+    """검색 기록을 인사이트가 압축된 아카이브 기록으로 변환"""
+    insights, codec = compress_text(json.dumps(search.insights, ensure_ascii=False))
+    return ArchivedSearch(
+        search_id=search.search_id,
+        keywords=search.keywords,
+        subreddits=search.subreddits,
+        created_at=search.created_at,
+        post_count=search.post_count,
+        filtered_count=search.filtered_count,
+        insights=insights,
+        codec=codec,
+        heuristic_post_ids=search.heuristic_post_ids,
+    )
+
+
+def compact(db: Database, pages: Optional[int] = None) -> None:
+    """
+    핫 DB 증분 VACUUM 및 통계 갱신 (SQLite 전용)
+
+    처음 실행 시 auto_vacuum을 INCREMENTAL로 전환하기 위해 전체 VACUUM을
+    한 번 수행하고, 이후에는 지정한 페이지 수만큼만 빈 공간을 반환합니다.
+
+    Args:
+        db: 핫 데이터베이스
+        pages: 1회에 반환할 최대 페이지 수 (None이면 config에서 가져옴)
+    """
+    if db.engine.dialect.name != "sqlite":
+        return
+
+    pages = pages or RETENTION_CONFIG["vacuum_pages"]
+    # VACUUM은 트랜잭션 밖에서만 실행 가능
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        mode = conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+        if mode != 2:  # 2 = INCREMENTAL
+            conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.exec_driver_sql("VACUUM")
+            logger.info("auto_vacuum을 INCREMENTAL로 전환 (전체 VACUUM 1회)")
+        else:
+            conn.exec_driver_sql(f"PRAGMA incremental_vacuum({int(pages)})")
+        conn.exec_driver_sql("ANALYZE")
+
+
+def run_retention(db: Database, dry_run: bool = False) -> Dict[str, int]:
+    """
+    보존 정책 전체 실행 (아카이브 이동 -> 압축 -> 실행 기록)
+
+    Args:
+        db: 핫 데이터베이스
+        dry_run: True면 옮길 대상 수만 계산
+
+    Returns:
+        {"posts": 보관한 게시물 수, "searches": 보관한 검색 기록 수}
+    """
+    counts = archive_old_records(db, dry_run=dry_run)
+    if dry_run:
+        return counts
+
+    # 오래된 인사이트 요약 캐시는 보관하지 않고 삭제 (필요하면 다시 요약됨)
+    cutoff = datetime.utcnow() - timedelta(days=RETENTION_CONFIG["max_age_days"])
+    with db.session_local() as session:
+        session.query(SummaryCache).filter(SummaryCache.created_at < cutoff).delete(
+            synchronize_session=False
+        )
+        session.commit()
+
+    compact(db)
+    with db.session_local() as session:
+        session.add(
+            MaintenanceRun(
+                archived_posts=counts["posts"], archived_searches=counts["searches"]
+            )
+        )
+        session.commit()
+    return counts
+
+
+def run_scheduled_retention(db: Database) -> Optional[Dict[str, Any]]:
+    """
+    자동 실행이 켜져 있고 실행 간격이 지났으면 보존 정책 실행
+
+    Returns:
+        실행한 경우 결과, 실행하지 않은 경우 None
+    """
+    if not RETENTION_CONFIG["enabled"]:
+        return None
+
+    with db.session_local() as session:
+        last = (
+            session.query(MaintenanceRun.ran_at)
+            .order_by(MaintenanceRun.ran_at.desc())
+            .first()
+        )
+    due = datetime.utcnow() - timedelta(hours=RETENTION_CONFIG["interval_hours"])
+    if last is not None and last.ran_at > due:
+        return None
+
+    return run_retention(db)
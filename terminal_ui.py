@@ -2,15 +2,169 @@
 터미널 UI - Rich를 사용한 아름다운 터미널 인터페이스
 """
 
-from rich.console import Console
+import threading
+import time
+
+from rich.console import Console, Group
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.text import Text
 from rich import box
-from typing import List, Dict, Any
-from config import SEARCH_CONFIG
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from config import SEARCH_CONFIG, UI_CONFIG
+from top_k import TopK
+
+# 페이지 조회 함수: (커서, 페이지 크기) -> (게시물 리스트, 다음 커서)
+PageFetcher = Callable[[Any, int], Tuple[List[Dict[str, Any]], Any]]
+
+
+def list_page_fetcher(
+    posts: List[Dict[str, Any]], key: Optional[Callable[[Dict[str, Any]], Any]] = None
+) -> PageFetcher:
+    """
+    메모리 내 게시물 리스트를 페이지 단위로 넘겨주는 조회 함수 생성
+
+    생성할 때 한 번만 정렬하고, 페이지마다 위치 커서로 잘라서 돌려줍니다.
+
+    Args:
+        posts: 게시물 리스트
+        key: 페이지 정렬 키 (주어지면 큰 순서로 표시, None이면 리스트 순서)
+
+    Returns:
+        페이지 조회 함수
+    """
+    ranked = sorted(posts, key=key, reverse=True) if key else posts
+
+    def fetch(offset: Optional[int], page_size: int):
+        start = offset or 0
+        end = start + page_size
+        return ranked[start:end], (end if end < len(ranked) else None)
+
+    return fetch
+
+
+def _posts_table(
+    posts: List[Dict[str, Any]], title: str, start: int = 1
+) -> Table:
+    """게시물 표 생성 (start: 첫 행 번호)"""
+    table = Table(title=title, box=box.ROUNDED, show_lines=True)
+    table.add_column("#", style="dim", width=6)
+    table.add_column("제목", style="cyan", width=50)
+    table.add_column("서브레딧", style="magenta", width=15)
+    table.add_column("점수", justify="right", style="yellow", width=6)
+    table.add_column("관련성", justify="right", style="green", width=8)
+
+    for idx, post in enumerate(posts, start):
+        relevance = post.get("relevance_score", 0)
+        relevance_color = (
+            "green" if relevance > 0.7 else "yellow" if relevance > 0.4 else "red"
+        )
+
+        table.add_row(
+            str(idx),
+            Text(
+                post["title"][:50] + "..."
+                if len(post["title"]) > 50
+                else post["title"]
+            ),
+            f"r/{post['subreddit']}",
+            str(post["score"]),
+            f"[{relevance_color}]{relevance:.2f}[/{relevance_color}]",
+        )
+
+    return table
+
+
+class LiveResults:
+    """
+    검색 중 실시간 결과 (Rich Live 렌더러블)
+
+    평가가 끝난 게시물을 add()로 받아 관련성 상위 top_k개만 최소 힙에 유지합니다.
+    화면 갱신은 힙의 top_k개만 정렬하므로 게시물 수와 관계없이 비용이 일정합니다.
+    """
+
+    def __init__(
+        self,
+        top_k: int,
+        threshold: float,
+        latency_fn: Optional[Callable[[], float]] = None,
+    ):
+        """
+        실시간 결과 초기화
+
+        Args:
+            top_k: 표에 유지할 상위 게시물 수 (0이면 진행 상태만 표시)
+            threshold: 표에 올릴 최소 관련성 점수
+            latency_fn: 현재 평균 LLM 지연 시간(초)을 돌려주는 함수
+        """
+        self.threshold = threshold
+        self.latency_fn = latency_fn
+        self.stage = "준비 중..."
+        self.total = 0
+        self.done = 0
+        self.matched = 0
+        self._top = TopK(top_k, key=lambda post: post.get("relevance_score", 0))
+        self._started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def set_stage(self, stage: str, total: Optional[int] = None) -> None:
+        """
+        현재 단계 변경
+
+        Args:
+            stage: 단계 설명
+            total: 평가할 게시물 수 (지정하면 처리량 측정 시작)
+        """
+        with self._lock:
+            self.stage = stage
+            if total is not None:
+                self.total = total
+                self._started = time.perf_counter()
+
+    def add(self, post: Dict[str, Any]) -> None:
+        """평가가 끝난 게시물 추가 (상위 top_k개 밖이면 개수만 집계)"""
+        relevance = post.get("relevance_score", 0)
+        with self._lock:
+            self.done += 1
+            if relevance < self.threshold:
+                return
+            self.matched += 1
+            self._top.push(post)
+
+    def top(self) -> List[Dict[str, Any]]:
+        """현재 상위 게시물 (관련성 내림차순)"""
+        with self._lock:
+            return self._top.items()
+
+    def _status(self) -> Text:
+        """진행/처리량 상태 줄"""
+        with self._lock:
+            stage, done, total, matched = self.stage, self.done, self.total, self.matched
+            started = self._started
+
+        parts = [f"[bold cyan]{stage}[/bold cyan]"]
+        if total:
+            parts.append(f"평가 {done}/{total}")
+            parts.append(f"필터링 {matched}개")
+            elapsed = time.perf_counter() - started if started else 0.0
+            if done and elapsed > 0:
+                parts.append(f"{done / elapsed:.1f}개/초")
+            latency = self.latency_fn() if self.latency_fn else 0.0
+            if latency:
+                parts.append(f"LLM 평균 {latency:.2f}초")
+        return Text.from_markup(" | ".join(parts))
+
+    def __rich__(self) -> Group:
+        """Live 갱신마다 호출되는 렌더링"""
+        posts = self.top()
+        if not posts:
+            return Group(self._status())
+        title = f"실시간 상위 {len(posts)}개 (관련성 순)"
+        return Group(self._status(), _posts_table(posts, title))
 
 
 class TerminalUI:
@@ -47,46 +201,83 @@ class TerminalUI:
         self.console.print()
 
     def display_posts(
-        self, posts: List[Dict[str, Any]], title: str = "검색 결과"
+        self, posts: List[Dict[str, Any]], title: str = "검색 결과", start: int = 1
     ) -> None:
-        """게시물 목록 표시"""
+        """게시물 목록 표시 (start: 첫 행 번호)"""
         if not posts:
             self.console.print("[yellow]검색 결과가 없습니다.[/yellow]")
             return
 
-        table = Table(title=title, box=box.ROUNDED, show_lines=True)
-        table.add_column("#", style="dim", width=3)
-        table.add_column("제목", style="cyan", width=50)
-        table.add_column("서브레딧", style="magenta", width=15)
-        table.add_column("점수", justify="right", style="yellow", width=6)
-        table.add_column("관련성", justify="right", style="green", width=8)
-
-        for idx, post in enumerate(posts[:20], 1):  # 상위 20개만 표시
-            relevance = post.get("relevance_score", 0)
-            relevance_color = (
-                "green" if relevance > 0.7 else "yellow" if relevance > 0.4 else "red"
-            )
+        max_rows = UI_CONFIG["max_posts_display"]
+        # 한 화면 분량만 표시
+        table = _posts_table(posts[:max_rows], title, start)
+        self.console.print(table)
 
-            table.add_row(
-                str(idx),
-                Text(
-                    post["title"][:50] + "..."
-                    if len(post["title"]) > 50
-                    else post["title"]
-                ),
-                f"r/{post['subreddit']}",
-                str(post["score"]),
-                f"[{relevance_color}]{relevance:.2f}[/{relevance_color}]",
-            )
+    def browse_posts(
+        self, fetch_page: PageFetcher, title: str = "검색 결과"
+    ) -> None:
+        """
+        게시물 페이지 탐색기
 
-        self.console.print(table)
+        현재 페이지만 메모리에 두고, 이동할 때마다 fetch_page로 해당 페이지를
+        조회해 바로 렌더링합니다. 이전 페이지 이동용으로 커서만 보관합니다.
+
+        Args:
+            fetch_page: 페이지 조회 함수
+            title: 표 제목
+        """
+        page_size = UI_CONFIG["max_posts_display"]
+        cursors: List[Any] = [None]  # 각 페이지의 시작 커서
+        page_no = 0
+
+        while True:
+            posts, next_cursor = fetch_page(cursors[page_no], page_size)
+            if not posts and page_no == 0:
+                self.console.print("[yellow]검색 결과가 없습니다.[/yellow]")
+                return
+
+            start = page_no * page_size + 1
+            self.display_posts(posts, f"{title} (페이지 {page_no + 1})", start=start)
+
+            options = []
+            if next_cursor is not None:
+                options.append("n: 다음")
+            if page_no > 0:
+                options.append("p: 이전")
+            options.extend([f"{start}-{start + len(posts) - 1}: 상세", "q: 종료"])
+            answer = Prompt.ask(f"[cyan]{' | '.join(options)}[/cyan]", default="q")
+            answer = answer.strip().lower()
+
+            if answer == "n" and next_cursor is not None:
+                if len(cursors) == page_no + 1:
+                    cursors.append(next_cursor)
+                page_no += 1
+            elif answer == "p" and page_no > 0:
+                page_no -= 1
+            elif answer.isdigit() and 0 <= int(answer) - start < len(posts):
+                self.display_post_detail(posts[int(answer) - start])
+            elif answer == "q":
+                return
 
     def display_insights(self, insights: Dict[str, Any]) -> None:
         """AI 인사이트 표시"""
-        insights_panel = Panel(
+        body = (
             f"[bold]요약:[/bold] {insights.get('summary', 'N/A')}\n\n"
             f"[bold]트렌드:[/bold] {', '.join(insights.get('trends', []))}\n\n"
-            f"[bold]주요 토픽:[/bold] {', '.join(insights.get('topics', []))}",
+            f"[bold]주요 토픽:[/bold] {', '.join(insights.get('topics', []))}"
+        )
+        clusters = insights.get("clusters")
+        if clusters:
+            body += "\n\n[bold]주제 클러스터:[/bold]"
+            for cluster in clusters:
+                example = cluster["titles"][0] if cluster["titles"] else ""
+                body += (
+                    f"\n  • [cyan]{', '.join(cluster['terms'])}[/cyan] "
+                    f"({cluster['size']}개) [dim]{example[:60]}[/dim]"
+                )
+
+        insights_panel = Panel(
+            body,
             title="[bold magenta]AI 인사이트[/bold magenta]",
             box=box.ROUNDED,
         )
@@ -130,6 +321,117 @@ class TerminalUI:
 
         self.console.print(history_table)
 
+    def display_trends(self, trends: List[Dict[str, Any]], days: int) -> None:
+        """(서브레딧, 키워드)별 트렌드 표시"""
+        if not trends:
+            self.console.print("[yellow]트렌드 데이터가 없습니다.[/yellow]")
+            return
+
+        # 일별 게시물 수를 막대 문자로 표시 (오래된 날 -> 최근)
+        bars = "▁▂▃▄▅▆▇█"
+        today = datetime.utcnow().date()
+        day_keys = [
+            (today - timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range(days - 1, -1, -1)
+        ]
+
+        table = Table(title=f"최근 {days}일 트렌드", box=box.ROUNDED)
+        table.add_column("서브레딧", style="magenta", max_width=15)
+        table.add_column("키워드", style="cyan", max_width=15)
+        table.add_column("게시물", justify="right", style="green")
+        table.add_column("관련성", justify="right", style="yellow")
+        table.add_column("점수", justify="right")
+        table.add_column("댓글", justify="right")
+        table.add_column("일별 추이", style="blue", no_wrap=True, min_width=min(days, 30))
+
+        for trend in trends[: UI_CONFIG["max_posts_display"]]:
+            counts = [trend["daily_counts"].get(day, 0) for day in day_keys]
+            peak = max(counts) or 1
+            sparkline = "".join(
+                bars[count * (len(bars) - 1) // peak] if count else " "
+                for count in counts
+            )
+            table.add_row(
+                f"r/{trend['subreddit']}",
+                trend["keyword"] or "(없음)",
+                str(trend["post_count"]),
+                f"{trend['avg_relevance']:.2f}",
+                f"{trend['avg_score']:.1f}",
+                f"{trend['avg_comments']:.1f}",
+                sparkline,
+            )
+
+        self.console.print(table)
+
+    def display_llm_metrics(self, metrics: List[Dict[str, Any]]) -> None:
+        """Ollama 호스트별 지표 표시"""
+        table = Table(title="Ollama 호스트 상태", box=box.ROUNDED)
+        table.add_column("호스트", style="cyan")
+        table.add_column("요청", justify="right")
+        table.add_column("오류", justify="right", style="red")
+        table.add_column("평균 지연", justify="right", style="yellow")
+        table.add_column("최근 지연", justify="right", style="yellow")
+        table.add_column("상태")
+
+        for m in metrics:
+            table.add_row(
+                m["url"],
+                str(m["requests"]),
+                str(m["errors"]),
+                f"{m['avg_latency']:.2f}s",
+                f"{m['ewma_latency']:.2f}s",
+                "[green]정상[/green]" if m["healthy"] else "[red]제외[/red]",
+            )
+
+        self.console.print(table)
+
+    def display_cascade_metrics(self, metrics: Dict[str, Any]) -> None:
+        """2단계 모델 평가 지표 표시 (재확인 비율, 단계별 지연 시간)"""
+        table = Table(title="2단계 평가", box=box.ROUNDED)
+        table.add_column("단계", style="cyan")
+        table.add_column("모델", style="magenta")
+        table.add_column("호출", justify="right")
+        table.add_column("평균 지연", justify="right", style="yellow")
+
+        labels = {"screen": "1차 평가", "confirm": "재확인"}
+        for tier in metrics["tiers"]:
+            table.add_row(
+                labels[tier["tier"]],
+                tier["model"],
+                str(tier["calls"]),
+                f"{tier['avg_latency']:.2f}s",
+            )
+
+        self.console.print(table)
+        self.console.print(
+            f"[dim]재확인 비율: {metrics['escalation_rate']:.0%} "
+            f"({metrics['escalated']}/{metrics['screened']})[/dim]"
+        )
+
+    def display_batch_summary(self, summary: Dict[str, Any]) -> None:
+        """배치 실행 결과 요약 표시"""
+        queries = summary["queries"]
+        table = Table(title="배치 실행 결과", box=box.ROUNDED)
+        table.add_column("ID", style="dim", width=10)
+        table.add_column("키워드", style="cyan", width=30)
+        table.add_column("서브레딧", style="magenta", width=20)
+        table.add_column("결과", justify="right", style="green", width=10)
+
+        for query in queries:
+            table.add_row(
+                query["search_id"][:8],
+                ", ".join(query["keywords"]),
+                ", ".join(query["subreddits"]),
+                f"{query['filtered_count']}/{query['post_count']}",
+            )
+
+        self.console.print(table)
+        self.display_success(
+            f"쿼리 {len(queries)}개 | 수집 {summary['fetched']}개 | "
+            f"고유 게시물 {summary['unique']}개 분석 | "
+            f"필터링 {sum(q['filtered_count'] for q in queries)}개"
+        )
+
     def show_progress(self, description: str = "Processing...") -> Progress:
         """진행 상황 표시"""
         return Progress(
@@ -140,16 +442,34 @@ class TerminalUI:
             console=self.console,
         )
 
+    def show_live_results(self, results: LiveResults) -> Live:
+        """
+        검색 중 실시간 결과 표시
+
+        Args:
+            results: 화면에 그릴 실시간 결과
+
+        Returns:
+            with 문으로 사용하는 Live (종료 시 화면에서 지움)
+        """
+        return Live(
+            results,
+            console=self.console,
+            refresh_per_second=UI_CONFIG["live_refresh_per_second"],
+            transient=True,
+        )
+
     def prompt_menu(self) -> str:
         """메인 메뉴 표시"""
         self.console.print("\n[bold cyan]메뉴:[/bold cyan]")
         self.console.print("1. 새로운 검색")
         self.console.print("2. 검색 기록 보기")
         self.console.print("3. 상위 게시물 보기")
-        self.console.print("4. 설정")
-        self.console.print("5. 종료")
+        self.console.print("4. 트렌드 보기")
+        self.console.print("5. 설정")
+        self.console.print("6. 종료")
 
-        choice = Prompt.ask("\n선택", choices=["1", "2", "3", "4", "5"])
+        choice = Prompt.ask("\n선택", choices=["1", "2", "3", "4", "5", "6"])
         return choice
 
     def prompt_keywords(self) -> List[str]:
@@ -184,6 +504,18 @@ class TerminalUI:
         
         return limit
 
+    def prompt_days(self, default: int) -> int:
+        """조회 기간(일) 입력 받기 (숫자가 아니면 다시 묻고, 1 미만이면 다시 입력)"""
+        days = IntPrompt.ask(
+            "[cyan]며칠간의 데이터?[/cyan]", default=default, show_default=True
+        )
+
+        if days < 1:
+            self.display_error("기간은 1일 이상이어야 합니다.")
+            return self.prompt_days(default)
+
+        return days
+
     def confirm_action(self, message: str) -> bool:
         """확인 프롬프트"""
         return Confirm.ask(message)
@@ -0,0 +1,58 @@
+"""
+테스트 공통 설정 - 저장소 최상위 모듈을 import 경로에 추가하고 표식과 스텁 서버 fixture 등록
+"""
+
+import functools
+import os
+import sys
+
+import praw
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import content_analyzer  # noqa: E402
+import reddit_client  # noqa: E402
+from config import HTTP_CACHE_CONFIG, OLLAMA_CONFIG, REDDIT_CONFIG  # noqa: E402
+from stub_servers import STUB_MODEL, ollama_server, reddit_server  # noqa: E402
+
+
+def pytest_configure(config):
+    """사용자 정의 표식 등록"""
+    config.addinivalue_line(
+        "markers", "postgres: TEST_DATABASE_URL의 PostgreSQL이 필요한 테스트 (없으면 건너뜀)"
+    )
+
+
+@pytest.fixture
+def reddit_stub(monkeypatch):
+    """
+    스텁 Reddit 서버 (PRAW와 asyncpraw가 이 서버로 요청하도록 설정)
+
+    HTTP 디스크 캐시는 끄고 config의 자격 증명은 가짜 값으로 채웁니다.
+    """
+    server = reddit_server()
+    monkeypatch.setitem(HTTP_CACHE_CONFIG, "enabled", False)
+    for key, value in (("client_id", "id"), ("client_secret", "secret"), ("user_agent", "ua")):
+        monkeypatch.setitem(REDDIT_CONFIG, key, value)
+    urls = {"oauth_url": server.url, "reddit_url": server.url, "check_for_updates": False}
+    monkeypatch.setattr(reddit_client.praw, "Reddit", functools.partial(praw.Reddit, **urls))
+    try:
+        import asyncpraw
+    except ImportError:
+        pass
+    else:
+        monkeypatch.setattr(asyncpraw, "Reddit", functools.partial(asyncpraw.Reddit, **urls))
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def ollama_stub(monkeypatch):
+    """스텁 Ollama 서버 (설치된 모델 목록은 STUB_MODEL 하나로 고정)"""
+    server = ollama_server()
+    monkeypatch.setattr(content_analyzer, "_installed_models", None)
+    monkeypatch.setattr(content_analyzer, "_query_installed_models", lambda: [STUB_MODEL])
+    monkeypatch.setitem(OLLAMA_CONFIG, "escalation_model", "")
+    yield server
+    server.stop()
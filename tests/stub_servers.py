@@ -0,0 +1,235 @@
+"""
+테스트용 스텁 서버 - 로컬 포트에서 Reddit API와 Ollama API를 흉내내는 HTTP 서버
+"""
+
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Any, Callable, Dict
+from urllib.parse import parse_qs, urlsplit
+
+# 스텁 Reddit이 발급하는 토큰 (녹화 파일에 남으면 안 됨)
+STUB_ACCESS_TOKEN = "stub-secret-token"
+STUB_COOKIE = "session=stub-secret-cookie"
+# 스텁 Ollama에 설치된 것으로 보이는 모델
+STUB_MODEL = "stub:1b"
+
+
+class StubServer:
+    """백그라운드 스레드에서 도는 로컬 HTTP 서버 (with 문으로 사용)"""
+
+    def __init__(self, handler: type, state: SimpleNamespace):
+        """
+        서버 시작
+
+        Args:
+            handler: 요청 처리 클래스 (state 속성으로 서버 상태에 접근)
+            state: 응답 설정과 받은 요청 기록
+        """
+        self.state = state
+        handler.state = state
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        """서버 주소 (예: http://127.0.0.1:54321)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def stop(self) -> None:
+        """서버 종료 (이후 요청은 연결 거부)"""
+        if self._thread.is_alive():
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+
+    def __enter__(self) -> "StubServer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    """JSON 응답 공통 처리"""
+
+    state: SimpleNamespace
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _send_json(self, status: int, body: Any, headers: Dict[str, str] = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def stub_post(subreddit: str, index: int) -> Dict[str, Any]:
+    """스텁 Reddit 게시물 (서브레딧과 순번으로 결정)"""
+    return {
+        "id": f"{subreddit[:3]}{index}",
+        "name": f"t3_{subreddit[:3]}{index}",
+        "title": f"python tip {index} about async memory in {subreddit}",
+        "author": f"user{index % 3}",
+        "subreddit": subreddit,
+        "selftext": "python body " * (index % 4),
+        "url": f"https://example.com/{subreddit}/{index}",
+        "score": index * 7 % 50,
+        "num_comments": index % 5,
+        "created_utc": 1700000000 + index * 3600,
+        "permalink": f"/r/{subreddit}/comments/{subreddit[:3]}{index}/",
+    }
+
+
+class _RedditHandler(_JSONHandler):
+    """OAuth 토큰 발급과 서브레딧 검색 (/r/<이름>/search)"""
+
+    def do_POST(self) -> None:
+        self._read_body()
+        self.state.token_requests += 1
+        self._send_json(
+            200,
+            {
+                "access_token": STUB_ACCESS_TOKEN,
+                "expires_in": 3600,
+                "scope": "*",
+                "token_type": "bearer",
+            },
+            headers={"Set-Cookie": STUB_COOKIE},
+        )
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        segments = parts.path.strip("/").split("/")
+        if len(segments) < 3 or segments[0] != "r" or segments[2] != "search":
+            self._send_json(404, {"error": 404})
+            return
+        subreddit = segments[1]
+        params = parse_qs(parts.query)
+        limit = int(params.get("limit", ["25"])[0])
+        with self.state.lock:
+            self.state.searches.append((subreddit, params))
+        # 정렬/기간 조합마다 겹치지만 서로 다른 창을 돌려줌 (심층 검색 병합 확인용)
+        window = params.get("sort", ["relevance"])[0] + params.get("t", ["all"])[0]
+        offset = sum(map(ord, window)) % 6
+        children = [
+            {"kind": "t3", "data": stub_post(subreddit, offset + i)}
+            for i in range(min(limit, self.state.posts_per_subreddit))
+        ]
+        self._send_json(
+            200,
+            {"kind": "Listing", "data": {"children": children, "after": None}},
+            # 요청 간격을 두지 않도록 넉넉한 한도 (PRAW는 남은 한도에 맞춰 요청을 분산)
+            headers={
+                "x-ratelimit-remaining": "599",
+                "x-ratelimit-used": "1",
+                "x-ratelimit-reset": "1",
+            },
+        )
+
+
+def reddit_server(posts_per_subreddit: int = 12) -> StubServer:
+    """
+    스텁 Reddit 서버 시작
+
+    Args:
+        posts_per_subreddit: 서브레딧 검색 한 번에 돌려줄 게시물 수
+
+    Returns:
+        state.searches에 (서브레딧, 쿼리 파라미터)를 기록하는 서버
+    """
+    state = SimpleNamespace(
+        posts_per_subreddit=posts_per_subreddit,
+        token_requests=0,
+        searches=[],
+        lock=threading.Lock(),
+    )
+    return StubServer(type("RedditHandler", (_RedditHandler,), {}), state)
+
+
+def stub_relevance(request: Dict[str, Any]) -> Dict[str, Any]:
+    """프롬프트 해시로 정해지는 관련성 응답 (같은 프롬프트에는 항상 같은 점수, 이유에 모델 이름)"""
+    digest = int(hashlib.md5(request["prompt"].encode("utf-8")).hexdigest(), 16)
+    return {
+        "response": json.dumps(
+            {
+                "relevance_score": digest % 100 / 100,
+                "quality_score": 0.5,
+                "reason": f"{request.get('model')} {digest % 7}",
+            }
+        )
+    }
+
+
+class _OllamaHandler(_JSONHandler):
+    """/api/generate, /api/tags (state.fail이면 500)"""
+
+    def do_GET(self) -> None:
+        with self.state.lock:
+            self.state.health_checks += 1
+        self._send_json(500 if self.state.fail else 200, {"models": []})
+
+    def do_POST(self) -> None:
+        request = json.loads(self._read_body() or b"{}")
+        state = self.state
+        with state.lock:
+            state.active += 1
+            state.max_active = max(state.max_active, state.active)
+        try:
+            time.sleep(state.delay)
+            if state.fail:
+                with state.lock:
+                    state.failed += 1
+                self._send_json(500, {"error": "stub failure"})
+                return
+            with state.lock:
+                state.served += 1
+            self._send_json(200, state.respond(request))
+        finally:
+            with state.lock:
+                state.active -= 1
+
+
+def ollama_server(
+    delay: float = 0.0,
+    fail: bool = False,
+    respond: Callable[[Dict[str, Any]], Dict[str, Any]] = stub_relevance,
+) -> StubServer:
+    """
+    스텁 Ollama 서버 시작
+
+    Args:
+        delay: /api/generate 응답 지연 (초)
+        fail: True이면 모든 요청에 500 응답 (실행 중 state.fail로 바꿀 수 있음)
+        respond: 요청 본문 -> 응답 본문
+
+    Returns:
+        state.served/failed/max_active/health_checks를 기록하는 서버
+    """
+    state = SimpleNamespace(
+        delay=delay,
+        fail=fail,
+        respond=respond,
+        active=0,
+        max_active=0,
+        served=0,
+        failed=0,
+        health_checks=0,
+        lock=threading.Lock(),
+    )
+    return StubServer(type("OllamaHandler", (_OllamaHandler,), {}), state)
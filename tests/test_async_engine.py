@@ -0,0 +1,116 @@
+"""
+비동기 엔진 테스트 - 같은 스텁 Reddit/Ollama 응답에 대해 동기 경로와 같은 결과를 내는지 확인
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("asyncpraw")
+pytest.importorskip("httpx")
+
+from async_engine import search_and_score_async  # noqa: E402
+from config import FILTER_CRITERIA  # noqa: E402
+from content_analyzer import ContentAnalyzer  # noqa: E402
+from reddit_client import LISTING_CEILING, RedditClient  # noqa: E402
+from stub_servers import STUB_MODEL  # noqa: E402
+
+KEYWORDS = ["python", "memory"]
+SUBREDDITS = ["python", "learnpython", "all"]
+# 결과 비교에 쓰는 필드 (수집 결과와 평가 결과)
+FIELDS = (
+    "id",
+    "title",
+    "subreddit",
+    "created_utc",
+    "keywords_matched",
+    "relevance_score",
+    "analysis_reason",
+)
+
+
+def _sync_search_and_score(analyzer: ContentAnalyzer, limit: int, deep: bool):
+    """main.search_and_analyze의 동기 경로와 같은 순서로 수집/평가"""
+    client = RedditClient()
+    try:
+        if deep:
+            posts = client.search_posts_deep(KEYWORDS, SUBREDDITS, limit)
+        else:
+            posts = client.search_posts(KEYWORDS, SUBREDDITS, limit)
+    finally:
+        client.close()
+
+    threshold = FILTER_CRITERIA["min_relevance_score"]
+    filtered = []
+    for post in posts:
+        post["relevance_score"], post["analysis_reason"] = analyzer.analyze_relevance(
+            post, KEYWORDS
+        )
+        if post["relevance_score"] >= threshold:
+            filtered.append(post)
+    return posts, filtered
+
+
+def _summary(posts):
+    return [tuple(post.get(field) for field in FIELDS) for post in posts]
+
+
+def _calls(analyzer: ContentAnalyzer):
+    """단계별 평가 호출 수 (지연 시간 제외)"""
+    metrics = analyzer.cascade_metrics()
+    return metrics["screened"], metrics["escalated"], [t["calls"] for t in metrics["tiers"]]
+
+
+@pytest.mark.parametrize(
+    "limit, deep, escalation",
+    [
+        (8, False, None),
+        (8, False, "stub:9b"),
+        (LISTING_CEILING + 1, True, None),
+    ],
+    ids=["search", "two-tier", "deep"],
+)
+def test_async_matches_sync(reddit_stub, ollama_stub, limit, deep, escalation):
+    def analyzer():
+        analyzer = ContentAnalyzer(STUB_MODEL, ollama_url=ollama_stub.url)
+        analyzer.escalation_model = escalation
+        return analyzer
+
+    sync_analyzer, async_analyzer = analyzer(), analyzer()
+    try:
+        sync_posts, sync_filtered = _sync_search_and_score(sync_analyzer, limit, deep)
+        results = []
+        async_posts, async_filtered = asyncio.run(
+            search_and_score_async(
+                async_analyzer, KEYWORDS, SUBREDDITS, limit, deep, on_result=results.append
+            )
+        )
+    finally:
+        sync_analyzer.close()
+        async_analyzer.close()
+
+    assert sync_posts
+    assert 0 < len(sync_filtered) < len(sync_posts)
+    assert _summary(async_posts) == _summary(sync_posts)
+    assert _summary(async_filtered) == _summary(sync_filtered)
+    assert sorted(p["id"] for p in results) == sorted(p["id"] for p in sync_posts)
+    assert _calls(async_analyzer) == _calls(sync_analyzer)
+    if escalation:
+        assert any(p["analysis_reason"].startswith(escalation) for p in async_posts)
+
+
+def test_async_falls_back_to_heuristic_like_sync(reddit_stub, ollama_stub):
+    ollama_stub.state.fail = True
+    sync_analyzer = ContentAnalyzer(STUB_MODEL, ollama_url=ollama_stub.url)
+    async_analyzer = ContentAnalyzer(STUB_MODEL, ollama_url=ollama_stub.url)
+    try:
+        sync_posts, _ = _sync_search_and_score(sync_analyzer, 4, False)
+        async_posts, _ = asyncio.run(
+            search_and_score_async(async_analyzer, KEYWORDS, SUBREDDITS, 4)
+        )
+    finally:
+        sync_analyzer.close()
+        async_analyzer.close()
+
+    assert _summary(async_posts) == _summary(sync_posts)
+    assert sync_analyzer.breaker.is_open and async_analyzer.breaker.is_open
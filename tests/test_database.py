@@ -0,0 +1,248 @@
+"""
+데이터베이스 테스트 - 게시물 업서트(ON CONFLICT ... RETURNING), 트렌드 집계 업서트, 키셋 페이지네이션
+
+기본으로 SQLite에서 실행하고, TEST_DATABASE_URL에 PostgreSQL 주소가 있으면 같은 테스트를
+PostgreSQL에서도 실행합니다 (예: postgresql+psycopg://user:pw@localhost/reddit_test).
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+import database
+from database import Base, Database
+
+# 게시물 작성 시각 (날짜 경계에 걸리지 않도록 어제 정오)
+CREATED = (datetime.utcnow() - timedelta(days=1)).replace(
+    hour=12, minute=0, second=0, microsecond=0
+)
+
+
+@pytest.fixture(
+    params=["sqlite", pytest.param("postgresql", marks=pytest.mark.postgres)]
+)
+def db(request, tmp_path):
+    """빈 데이터베이스 (PostgreSQL은 테스트 전후로 테이블 삭제)"""
+    if request.param == "sqlite":
+        db = Database(url=f"sqlite:///{tmp_path / 'test.db'}")
+        yield db
+        db.engine.dispose()
+        return
+
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL이 설정되지 않음")
+    pytest.importorskip("psycopg")
+    Base.metadata.drop_all(database.create_db_engine(url))
+    db = Database(url=url)
+    yield db
+    Base.metadata.drop_all(db.engine)
+    db.engine.dispose()
+
+
+def make_post(index: int, **overrides):
+    post = {
+        "id": f"p{index}",
+        "title": f"post {index}",
+        "author": "author",
+        "subreddit": "python",
+        "text": "body",
+        "url": f"https://example.com/{index}",
+        "score": 10,
+        "num_comments": 2,
+        "created_utc": CREATED,
+        "permalink": f"https://reddit.com/r/python/{index}",
+        "relevance_score": 0.5,
+        "analysis_reason": "reason",
+        "keywords_matched": ["python"],
+    }
+    post.update(overrides)
+    return post
+
+
+def _stored(db: Database):
+    with db.session_local() as session:
+        return {
+            r.reddit_id: (r.search_id, r.title)
+            for r in session.query(database.PostRecord)
+        }
+
+
+def _trend(db: Database, subreddit: str = "python", keyword: str = "python"):
+    trends = db.get_trends(days=7, subreddit=subreddit, keyword=keyword)
+    assert len(trends) == 1
+    return trends[0]
+
+
+def test_save_posts_skips_existing_rows(db):
+    db.save_posts("s1", [make_post(1), make_post(2)])
+    db.save_posts("s2", [make_post(2, title="changed"), make_post(3)])
+
+    assert _stored(db) == {
+        "p1": ("s1", "post 1"),
+        "p2": ("s1", "post 2"),
+        "p3": ("s2", "post 3"),
+    }
+
+
+def test_save_posts_keeps_first_duplicate_in_call(db):
+    db.save_posts("s1", [make_post(1, title="first"), make_post(2), make_post(1, title="second")])
+
+    assert _stored(db)["p1"] == ("s1", "first")
+    assert len(_stored(db)) == 2
+
+
+def test_save_posts_across_insert_chunks(db, monkeypatch):
+    # 게시물 INSERT는 행당 18개 변수 -> 문장당 2행
+    monkeypatch.setattr(database, "MAX_BIND_VARIABLES", 40)
+    db.save_posts("s1", [make_post(i) for i in range(10)])
+    db.save_posts("s2", [make_post(i) for i in range(5, 25)])
+
+    stored = _stored(db)
+    assert len(stored) == 25
+    assert {k for k, (search, _) in stored.items() if search == "s2"} == {
+        f"p{i}" for i in range(10, 25)
+    }
+    assert _trend(db)["post_count"] == 25
+
+
+def test_rollups_count_only_returned_rows(db):
+    db.save_posts("s1", [make_post(1, relevance_score=0.2), make_post(2, relevance_score=0.4)])
+    # 이미 있는 게시물은 RETURNING에 나오지 않으므로 집계에 다시 더해지지 않음
+    db.save_posts("s2", [make_post(1, relevance_score=0.9), make_post(3, relevance_score=0.6)])
+
+    trend = _trend(db)
+    assert trend["post_count"] == 3
+    assert trend["avg_relevance"] == pytest.approx((0.2 + 0.4 + 0.6) / 3)
+    assert trend["avg_score"] == pytest.approx(10)
+
+
+def test_rollups_upsert_per_day_subreddit_keyword(db):
+    day_before = CREATED - timedelta(days=1)
+    db.save_posts(
+        "s1",
+        [
+            make_post(1),
+            make_post(2, keywords_matched=["python", "async"]),
+            make_post(3, created_utc=day_before),
+            make_post(4, subreddit="learnpython", keywords_matched=[]),
+        ],
+    )
+    db.save_posts("s2", [make_post(5), make_post(6, created_utc=day_before)])
+
+    python = _trend(db)
+    assert python["post_count"] == 5
+    assert python["daily_counts"] == {
+        CREATED.strftime("%Y-%m-%d"): 3,
+        day_before.strftime("%Y-%m-%d"): 2,
+    }
+    assert _trend(db, keyword="async")["post_count"] == 1
+    assert _trend(db, subreddit="learnpython", keyword="")["post_count"] == 1
+
+
+def test_update_scores_adjusts_relevance_sum_only(db):
+    db.save_posts("s1", [make_post(1, relevance_score=0.2), make_post(2, relevance_score=0.4)])
+    page, _ = db.get_posts_page(page_size=10)
+    row = next(p for p in page if p["reddit_id"] == "p1")
+
+    db.update_scores(
+        [
+            {
+                "id": row["id"],
+                "relevance_score": 0.8,
+                "analysis_reason": "llm",
+                "scored_by": "llm",
+                "scored_model": "m",
+                "prompt_version": "v",
+                "old_relevance_score": 0.2,
+                "created_utc": CREATED,
+                "subreddit": "python",
+                "keywords_matched": ["python"],
+            }
+        ]
+    )
+
+    trend = _trend(db)
+    assert trend["post_count"] == 2
+    assert trend["avg_relevance"] == pytest.approx((0.8 + 0.4) / 2)
+
+
+def test_bulk_writes_fit_sqlite_variable_limit(tmp_path):
+    """SQLite 3.32 이전 빌드의 바인드 변수 한도(999)에서도 큰 일괄 쓰기가 동작"""
+    db = Database(url=f"sqlite:///{tmp_path / 'limited.db'}")
+    db.engine.dispose()
+
+    @event.listens_for(db.engine, "connect")
+    def _limit_variables(dbapi_conn, _record):
+        dbapi_conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+
+    try:
+        posts = [
+            make_post(i, subreddit=f"sub{i % 300}", keywords_matched=[f"k{i % 7}"])
+            for i in range(1200)
+        ]
+        db.save_posts("s1", posts)
+        summaries = {f"key{i}": {"summary": str(i)} for i in range(1500)}
+        db.save_cached_summaries(summaries)
+        ids = [p["id"] for page in _all_pages(db, page_size=500) for p in page]
+        db.mark_rescore_attempted(ids)
+
+        assert len(ids) == 1200
+        assert len(db.get_cached_summaries(list(summaries))) == 1500
+        assert sum(t["post_count"] for t in db.get_trends(days=7)) == 1200
+    finally:
+        db.engine.dispose()
+
+
+def test_cached_summaries_keep_first_value(db):
+    db.save_cached_summaries({"a": {"summary": "first"}, "b": {"summary": "b"}})
+    db.save_cached_summaries({"a": {"summary": "second"}, "c": {"summary": "c"}})
+
+    assert db.get_cached_summaries(["a", "b", "c", "missing"]) == {
+        "a": {"summary": "first"},
+        "b": {"summary": "b"},
+        "c": {"summary": "c"},
+    }
+
+
+def _all_pages(db: Database, page_size: int, **filters):
+    pages, cursor = [], None
+    while True:
+        page, cursor = db.get_posts_page(after=cursor, page_size=page_size, **filters)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+
+def test_keyset_pages_cover_every_row_once_in_order(db):
+    # 같은 점수가 여러 개 있어도 (점수, id) 커서로 빠짐없이 이어져야 함
+    db.save_posts("s1", [make_post(i, relevance_score=(i % 4) / 4) for i in range(23)])
+
+    pages = _all_pages(db, page_size=5)
+    rows = [p for page in pages for p in page]
+
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    assert len({p["reddit_id"] for p in rows}) == 23
+    keys = [(p["relevance_score"], p["id"]) for p in rows]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_keyset_exact_multiple_has_no_empty_last_page(db):
+    db.save_posts("s1", [make_post(i) for i in range(10)])
+
+    pages = _all_pages(db, page_size=5)
+
+    assert [len(page) for page in pages] == [5, 5]
+
+
+def test_keyset_filters_by_search_prefix(db):
+    db.save_posts("search-a-1", [make_post(i, relevance_score=0.9) for i in range(6)])
+    db.save_posts("search-b-1", [make_post(i, relevance_score=0.1) for i in range(6, 12)])
+
+    rows = [p for page in _all_pages(db, page_size=4, search_id="search-b") for p in page]
+
+    assert {p["reddit_id"] for p in rows} == {f"p{i}" for i in range(6, 12)}
+    assert db.get_posts_page(search_id="missing")[0] == []
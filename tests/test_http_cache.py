@@ -0,0 +1,177 @@
+"""
+HTTP 디스크 캐시 테스트 - 네트워크 대신 스텁 어댑터로 TTL, 304 재검증, URL 정규화 확인
+"""
+
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+import pytest
+import requests
+from prawcore.rate_limit import RateLimiter
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from client_registry import ClientRegistry
+from config import HTTP_CACHE_CONFIG
+from http_cache import CachingSession, HTTPCache, endpoint_type, normalize_url
+
+SEARCH_URL = "https://oauth.reddit.com/r/python/search"
+RATE_LIMIT = {"x-ratelimit-remaining": "500", "x-ratelimit-used": "100", "x-ratelimit-reset": "300"}
+
+
+class StubAdapter(HTTPAdapter):
+    """미리 넣어 둔 응답을 순서대로 돌려주고 받은 요청을 기록하는 어댑터"""
+
+    def __init__(self, responses: List[Dict]):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests: List[requests.PreparedRequest] = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        spec = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = spec.get("status", 200)
+        response.headers = CaseInsensitiveDict(spec.get("headers", {}))
+        response._content = spec.get("body", b"")
+        response.url = request.url
+        response.request = request
+        return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HTTPCache(
+        str(tmp_path / "http_cache.db"), {"search": 60, "comments": 60, "listing": 60}
+    )
+    yield cache
+    cache.close()
+
+
+def _session(cache: HTTPCache, responses: List[Dict]) -> CachingSession:
+    session = CachingSession(cache)
+    adapter = StubAdapter(responses)
+    session.mount("https://", adapter)
+    session.adapter = adapter
+    return session
+
+
+def _expire(cache: HTTPCache) -> None:
+    """저장된 항목을 TTL보다 오래된 것으로 만들기"""
+    cache._conn.execute("UPDATE http_cache SET stored_at = stored_at - 3600")
+    cache._conn.commit()
+
+
+def test_normalize_url_sorts_and_merges_query():
+    url = "https://OAUTH.reddit.com/r/Python/search/?q=rust&limit=5"
+    params = {"sort": "new", "t": None, "raw_json": 1}
+
+    assert normalize_url(url, params) == (
+        "https://oauth.reddit.com/r/python/search?limit=5&q=rust&raw_json=1&sort=new"
+    )
+    assert normalize_url(url, params) == normalize_url(
+        "https://oauth.reddit.com/r/python/search?sort=new&raw_json=1&limit=5&q=rust"
+    )
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://oauth.reddit.com/r/python/search", "search"),
+        ("https://oauth.reddit.com/comments/abc123", "comments"),
+        ("https://oauth.reddit.com/r/python/hot", "listing"),
+        ("https://www.reddit.com/api/v1/access_token", None),
+    ],
+)
+def test_endpoint_type(url: str, expected: Optional[str]):
+    assert endpoint_type(url) == expected
+
+
+def test_fresh_entry_is_served_without_request(cache):
+    session = _session(cache, [{"body": b'{"n": 1}', "headers": {"ETag": '"v1"'}}])
+
+    first = session.get(SEARCH_URL, params={"q": "rust"})
+    second = session.get(SEARCH_URL, params={"q": "rust"})
+
+    assert first.json() == second.json() == {"n": 1}
+    assert second.headers["X-Cache"] == "HIT"
+    assert len(session.adapter.requests) == 1
+    assert cache.stats == {"hits": 1, "revalidated": 0, "misses": 1}
+
+
+def test_expired_entry_is_revalidated_and_304_reuses_body(cache):
+    session = _session(
+        cache,
+        [
+            {"body": b'{"n": 1}', "headers": {"ETag": '"v1"', "Last-Modified": "Mon"}},
+            {"status": 304, "headers": dict(RATE_LIMIT)},
+        ],
+    )
+
+    session.get(SEARCH_URL, params={"q": "rust"})
+    _expire(cache)
+    response = session.get(SEARCH_URL, params={"q": "rust"})
+
+    conditional = session.adapter.requests[1]
+    assert conditional.headers["If-None-Match"] == '"v1"'
+    assert conditional.headers["If-Modified-Since"] == "Mon"
+    assert response.status_code == 200
+    assert response.json() == {"n": 1}
+    assert response.headers["X-Cache"] == "REVALIDATED"
+    assert response.headers["x-ratelimit-remaining"] == "500"
+    # 재검증 후에는 다시 TTL 동안 요청 없이 사용
+    assert session.get(SEARCH_URL, params={"q": "rust"}).headers["X-Cache"] == "HIT"
+    assert len(session.adapter.requests) == 2
+
+
+def test_expired_entry_is_replaced_when_changed(cache):
+    session = _session(
+        cache,
+        [
+            {"body": b'{"n": 1}', "headers": {"ETag": '"v1"'}},
+            {"body": b'{"n": 2}', "headers": {"ETag": '"v2"'}},
+        ],
+    )
+
+    session.get(SEARCH_URL, params={"q": "rust"})
+    _expire(cache)
+    assert session.get(SEARCH_URL, params={"q": "rust"}).json() == {"n": 2}
+    assert cache.get(normalize_url(SEARCH_URL, {"q": "rust"}))["etag"] == '"v2"'
+
+
+def test_uncached_endpoints_are_passed_through(cache):
+    token_url = "https://www.reddit.com/api/v1/access_token"
+    session = _session(cache, [{"body": b"a"}, {"body": b"b"}])
+
+    assert session.post(token_url).content == b"a"
+    assert session.post(token_url).content == b"b"
+    assert cache.stats == {"hits": 0, "revalidated": 0, "misses": 0}
+
+
+def test_cache_hit_does_not_consume_rate_limit(cache):
+    session = _session(cache, [{"body": b"{}", "headers": dict(RATE_LIMIT)}])
+    limiter = RateLimiter(window_size=600)
+
+    limiter.update(session.get(SEARCH_URL).headers)
+    assert limiter.remaining == 500
+
+    hit = session.get(SEARCH_URL)
+    limiter.update(hit.headers)
+
+    assert hit.headers["X-Cache"] == "HIT"
+    assert limiter.remaining == 500
+    assert limiter.next_request_timestamp <= time.time()
+
+
+def test_registry_close_closes_cache(tmp_path, monkeypatch):
+    monkeypatch.setitem(HTTP_CACHE_CONFIG, "enabled", True)
+    monkeypatch.setitem(HTTP_CACHE_CONFIG, "path", str(tmp_path / "http_cache.db"))
+    registry = ClientRegistry()
+    client = registry.get_reddit_client("id", "secret", "test-agent")
+    cache = client._http_cache
+
+    registry.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache.get("anything")
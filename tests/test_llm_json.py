@@ -0,0 +1,120 @@
+"""
+LLM JSON 파서 테스트 - 잘린 출력, 남은 쉼표, 코드 블록, 문자열 안의 제어 문자 복구
+"""
+
+import pytest
+
+from llm_json import TolerantJSONParser, parse_llm_json, validate_insights, validate_relevance
+
+
+def test_complete_object():
+    assert parse_llm_json('{"relevance_score": 0.8, "reason": "ok"}') == (
+        {"relevance_score": 0.8, "reason": "ok"},
+        False,
+    )
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"relevance_score": 0.8, "reason": "a\nb"}', "a\nb"),
+        ('{"relevance_score": 0.8, "reason": "a\tb\r\nc"}', "a\tb\r\nc"),
+        (
+            '{"relevance_score": 0.8, "reason": "escaped \\n and raw\nline"}',
+            "escaped \n and raw\nline",
+        ),
+    ],
+)
+def test_control_characters_inside_strings(text, expected):
+    data, repaired = parse_llm_json(text)
+    assert data == {"relevance_score": 0.8, "reason": expected}
+    assert repaired is False
+
+
+def test_truncated_string_with_newline_is_closed():
+    data, repaired = parse_llm_json('{"relevance_score": 0.6, "reason": "first line\nsecond')
+    assert data == {"relevance_score": 0.6, "reason": "first line\nsecond"}
+    assert repaired is True
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # 열린 괄호만 닫으면 되는 경우
+        (
+            '{"relevance_score": 0.7, "key_insights": ["a", "b"',
+            {"relevance_score": 0.7, "key_insights": ["a", "b"]},
+        ),
+        # 키만 있고 값이 없으면 마지막으로 완결된 값까지 잘라냄
+        ('{"relevance_score": 0.7, "quality_score":', {"relevance_score": 0.7}),
+        ('{"relevance_score": 0.7, "quality_score": 0.', {"relevance_score": 0.7}),
+        ('{"relevance_score": 0.7, "reason": "cut \\', {"relevance_score": 0.7}),
+        # 빈 컨테이너도 완결된 값
+        ('{"a": {"b": [1, {"c": ', {"a": {"b": [1, {}]}}),
+        ("{", {}),
+    ],
+)
+def test_truncated_objects(text, expected):
+    data, repaired = parse_llm_json(text)
+    assert data == expected
+    assert repaired is True
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"relevance_score": 0.5, "key_insights": ["a", "b", ], }',
+        '{"relevance_score": 0.5,\n  "key_insights": ["a", "b",\n],\n}',
+    ],
+)
+def test_trailing_commas(text):
+    assert parse_llm_json(text) == (
+        {"relevance_score": 0.5, "key_insights": ["a", "b"]},
+        False,
+    )
+
+
+def test_fenced_output_with_surrounding_text():
+    text = (
+        "Here is my evaluation:\n"
+        "```json\n"
+        '{\n  "relevance_score": 0.9,\n  "reason": "uses {braces} and \\"quotes\\""\n}\n'
+        "```\n"
+        'Extra: {"relevance_score": 0.1}'
+    )
+    data, repaired = parse_llm_json(text)
+    assert data == {"relevance_score": 0.9, "reason": 'uses {braces} and "quotes"'}
+    assert repaired is False
+
+
+@pytest.mark.parametrize("text", ["", "no json here", "```\n```", "[1, 2]"])
+def test_no_object(text):
+    assert parse_llm_json(text) == (None, False)
+
+
+def test_streaming_feed_stops_at_closing_brace():
+    parser = TolerantJSONParser()
+    chunks = ['noise {"relevance', '_score": 0.4, "reason": "x\n', 'y"}', ' trailing {"z": 1}']
+    done = [parser.feed(chunk) for chunk in chunks]
+    assert done == [False, False, True, True]
+    assert parser.result() == {"relevance_score": 0.4, "reason": "x\ny"}
+    assert parser.repaired is False
+
+
+def test_validate_relevance_after_repair():
+    data, _ = parse_llm_json(
+        '{"relevance_score": "1.7", "quality_score": -2, "reason": "multi\nline"'
+    )
+    assert validate_relevance(data) == {
+        "relevance_score": 1.0,
+        "quality_score": 0.0,
+        "reason": "multi\nline",
+        "key_insights": [],
+    }
+    assert validate_relevance({"reason": "no score"}) is None
+
+
+def test_validate_insights():
+    data, _ = parse_llm_json('{"summary": " s ", "trends": "one", "topics": ["a", " ", 3]}')
+    assert validate_insights(data) == {"summary": "s", "trends": ["one"], "topics": ["a", "3"]}
+    assert validate_insights({"summary": ""}) is None
@@ -0,0 +1,179 @@
+"""
+LLM 라우터 테스트 - 스텁 Ollama 서버로 호스트 분산, 호스트별 동시 요청 제한, 복구 확인 확인
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from client_registry import ClientRegistry
+from config import OLLAMA_CONFIG
+from content_analyzer import create_http_session
+from llm_router import OllamaRouter
+from stub_servers import STUB_MODEL, ollama_server
+
+REQUEST = {"model": STUB_MODEL, "prompt": "hello", "stream": False}
+
+
+@pytest.fixture
+def servers():
+    """스텁 Ollama 서버 두 개"""
+    first, second = ollama_server(), ollama_server()
+    yield first, second
+    first.stop()
+    second.stop()
+
+
+@pytest.fixture
+def dead_url():
+    """연결이 거부되는 주소 (서버를 띄웠다가 바로 종료)"""
+    server = ollama_server()
+    server.stop()
+    return server.url
+
+
+def _post_many(router: OllamaRouter, count: int, workers: int):
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(lambda _: router.post("/api/generate", json=REQUEST, timeout=5), range(count))
+        )
+
+
+def test_requests_are_spread_across_hosts(servers):
+    first, second = servers
+    first.state.delay = second.state.delay = 0.05
+    router = OllamaRouter([first.url, second.url], create_http_session(), max_concurrency=4)
+
+    responses = _post_many(router, 16, workers=8)
+
+    assert all(r.status_code == 200 for r in responses)
+    assert first.state.served > 0 and second.state.served > 0
+    assert first.state.served + second.state.served == 16
+    assert sum(m["requests"] for m in router.metrics()) == 16
+
+
+def test_slow_host_gets_less_traffic(servers):
+    fast, slow = servers
+    slow.state.delay = 0.2
+    router = OllamaRouter([slow.url, fast.url], create_http_session(), max_concurrency=4)
+
+    _post_many(router, 24, workers=4)
+
+    assert fast.state.served > slow.state.served
+
+
+def test_per_host_concurrency_limit(servers):
+    first, second = servers
+    first.state.delay = second.state.delay = 0.1
+    router = OllamaRouter([first.url, second.url], create_http_session(), max_concurrency=2)
+
+    responses = _post_many(router, 12, workers=12)
+
+    assert all(r.status_code == 200 for r in responses)
+    assert first.state.max_active <= 2
+    assert second.state.max_active <= 2
+    assert all(m["outstanding"] == 0 for m in router.metrics())
+
+
+def test_failed_request_retries_other_host(servers, dead_url):
+    live, _ = servers
+    router = OllamaRouter([dead_url, live.url], create_http_session(), max_concurrency=4)
+
+    for _ in range(4):
+        assert router.post("/api/generate", json=REQUEST, timeout=5).status_code == 200
+
+    dead, alive = router.metrics()
+    assert dead["errors"] >= 1
+    assert alive["requests"] == 4
+
+
+def test_failing_host_is_excluded_then_probed(servers, monkeypatch):
+    monkeypatch.setitem(OLLAMA_CONFIG, "host_failure_threshold", 1)
+    monkeypatch.setitem(OLLAMA_CONFIG, "host_retry_interval", 0.3)
+    flaky, healthy = servers
+    flaky.state.fail = True
+    router = OllamaRouter([flaky.url, healthy.url], create_http_session(), max_concurrency=1)
+
+    # 500 응답이면 제외되고 요청은 다른 호스트가 처리
+    assert router.post("/api/generate", json=REQUEST, timeout=5).status_code == 200
+    assert flaky.state.failed == 1
+    assert router.metrics()[0]["healthy"] is False
+
+    # 제외 기간 중에는 요청이 가지 않음
+    flaky.state.fail = False
+    router.post("/api/generate", json=REQUEST, timeout=5)
+    assert flaky.state.served == 0
+
+    # 제외 기간이 지나면 정상 호스트가 바쁠 때 요청 하나로 복구 확인 후 다시 사용
+    time.sleep(0.35)
+    healthy.state.delay = 0.2
+    responses = _post_many(router, 2, workers=2)
+    assert all(r.status_code == 200 for r in responses)
+    assert flaky.state.served == 1
+    assert router.metrics()[0]["healthy"] is True
+    assert router.endpoints[0].probing is False
+
+
+def test_release_of_other_request_keeps_probe_in_flight(servers):
+    first, second = servers
+    router = OllamaRouter([first.url, second.url], create_http_session(), max_concurrency=4)
+    endpoint, probe = router.try_acquire()
+    assert probe is False
+
+    # 요청이 진행 중인 사이에 호스트가 제외되고 복구 확인 시각이 됨
+    endpoint.healthy = False
+    endpoint.retry_at = 0.0
+    others = [ep for ep in router.endpoints if ep is not endpoint]
+    probed, probe = router.try_acquire(exclude=others)
+    assert probed is endpoint and probe is True
+
+    # 제외 전에 보낸 요청이 끝나도 복구 확인은 아직 진행 중
+    router.release(endpoint, 0.1, False)
+    assert endpoint.probing is True
+    assert router.try_acquire(exclude=others)[0] is not endpoint
+
+    # 복구 확인 요청이 끝나야 해제
+    router.release(endpoint, 0.1, True, probe)
+    assert endpoint.probing is False
+    assert endpoint.healthy is True
+
+
+def test_check_health_excludes_unreachable_host(servers, dead_url):
+    live, _ = servers
+    router = OllamaRouter([dead_url, live.url], create_http_session())
+
+    status = router.check_health(timeout=1)
+
+    assert status == {dead_url: False, live.url: True}
+    assert [m["healthy"] for m in router.metrics()] == [False, True]
+    assert router.try_acquire()[0].url == live.url
+
+
+def test_registry_checks_hosts_before_first_request(servers, dead_url, ollama_stub, monkeypatch):
+    live, _ = servers
+    monkeypatch.setitem(OLLAMA_CONFIG, "urls", [dead_url, live.url])
+    registry = ClientRegistry()
+    try:
+        analyzer = registry.get_analyzer(STUB_MODEL)
+        assert live.state.health_checks == 1
+        assert [m["healthy"] for m in analyzer.router.metrics()] == [False, True]
+    finally:
+        registry.close()
+
+
+def test_single_host_is_not_health_checked(ollama_stub, monkeypatch):
+    monkeypatch.setitem(OLLAMA_CONFIG, "urls", [ollama_stub.url])
+    registry = ClientRegistry()
+    try:
+        registry.get_analyzer(STUB_MODEL)
+        assert ollama_stub.state.health_checks == 0
+    finally:
+        registry.close()
+
+
+def test_all_hosts_down_raises(dead_url):
+    router = OllamaRouter([dead_url], create_http_session())
+    with pytest.raises(requests.ConnectionError):
+        router.post("/api/generate", json=REQUEST, timeout=1)
@@ -0,0 +1,103 @@
+"""
+보존 정책 테스트 - 아카이브로 옮긴 기록이 평가 방식과 재평가 정보를 유지하는지 확인
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from database import Database, PostRecord, SearchRecord
+from retention import (
+    ArchivedPost,
+    ArchivedSearch,
+    archive_old_records,
+    decompress_text,
+    open_archive,
+)
+
+OLD = datetime.utcnow() - timedelta(days=400)
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(url=f"sqlite:///{tmp_path / 'hot.db'}")
+    yield db
+    db.engine.dispose()
+
+
+def _add_old_records(db: Database) -> None:
+    with db.session_local() as session:
+        session.add(
+            SearchRecord(
+                search_id="old-search",
+                keywords=["python"],
+                subreddits=["python"],
+                created_at=OLD,
+                post_count=1,
+                filtered_count=0,
+                insights={"summary": "요약"},
+                heuristic_post_ids=["p1"],
+            )
+        )
+        session.add(
+            PostRecord(
+                search_id="old-search",
+                reddit_id="p1",
+                title="title",
+                author="author",
+                subreddit="python",
+                content="본문",
+                score=3,
+                num_comments=1,
+                created_utc=OLD,
+                permalink="/r/python/p1",
+                relevance_score=0.1,
+                analysis_reason="키워드 규칙",
+                scored_by="heuristic",
+                scored_model=None,
+                prompt_version="2",
+                rescore_attempted_at=OLD + timedelta(days=1),
+                keywords_matched=["python"],
+                saved_at=OLD,
+            )
+        )
+        session.commit()
+
+
+def test_archive_keeps_scoring_fields(db, tmp_path):
+    _add_old_records(db)
+    archive_path = str(tmp_path / "archive.db")
+
+    counts = archive_old_records(db, archive_path, max_age_days=30, keep_min_relevance=0.9)
+
+    assert counts == {"posts": 1, "searches": 1}
+    with open_archive(archive_path)() as archive:
+        post = archive.query(ArchivedPost).one()
+        search = archive.query(ArchivedSearch).one()
+    assert (post.scored_by, post.scored_model, post.prompt_version) == ("heuristic", None, "2")
+    assert post.rescore_attempted_at == OLD + timedelta(days=1)
+    assert decompress_text(post.content, post.codec) == "본문"
+    assert search.heuristic_post_ids == ["p1"]
+
+
+def test_open_archive_adds_new_columns_to_old_archive(tmp_path):
+    path = tmp_path / "archive.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE archived_posts (id INTEGER PRIMARY KEY, reddit_id VARCHAR(20) UNIQUE)"
+    )
+    conn.execute(
+        "CREATE TABLE archived_searches (id INTEGER PRIMARY KEY, search_id VARCHAR(50) UNIQUE)"
+    )
+    conn.commit()
+    conn.close()
+
+    open_archive(str(path))
+
+    conn = sqlite3.connect(path)
+    post_columns = {row[1] for row in conn.execute("PRAGMA table_info(archived_posts)")}
+    search_columns = {row[1] for row in conn.execute("PRAGMA table_info(archived_searches)")}
+    conn.close()
+    assert {"scored_by", "scored_model", "prompt_version", "rescore_attempted_at"} <= post_columns
+    assert "heuristic_post_ids" in search_columns
@@ -0,0 +1,121 @@
+"""
+트래픽 녹화/재생 테스트 - 스텁 Reddit/Ollama 서버로 녹화한 뒤 서버 없이 재생해 같은 결과 확인
+"""
+
+import gzip
+import json
+
+import pytest
+
+import content_analyzer
+import traffic_archive
+from content_analyzer import ContentAnalyzer
+from reddit_client import RedditClient
+from stub_servers import STUB_ACCESS_TOKEN, STUB_COOKIE, STUB_MODEL
+
+KEYWORDS = ["python", "async"]
+SUBREDDITS = ["python", "learnpython"]
+
+
+def _search_and_score(ollama_url: str):
+    """검색 후 모든 게시물 평가 (main의 기본 검색 흐름)"""
+    client = RedditClient("id", "secret", "ua")
+    analyzer = ContentAnalyzer(STUB_MODEL, ollama_url=ollama_url)
+    try:
+        posts = client.search_posts(KEYWORDS, SUBREDDITS, limit=5)
+        return [
+            (post["id"], post["title"], *analyzer.analyze_relevance(post, KEYWORDS))
+            for post in posts
+        ]
+    finally:
+        analyzer.close()
+        client.close()
+
+
+@pytest.fixture
+def recording(tmp_path, reddit_stub, ollama_stub):
+    """스텁 서버로 녹화한 아카이브 경로와 녹화 중 결과 (녹화 후 서버는 종료)"""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    traffic_archive.start(path, "record")
+    try:
+        results = _search_and_score(ollama_stub.url)
+    finally:
+        traffic_archive.stop()
+    reddit_stub.stop()
+    ollama_stub.stop()
+    return path, results, ollama_stub.url
+
+
+def _replay(path: str, ollama_url: str):
+    archive = traffic_archive.start(path, "replay", 0)
+    try:
+        return _search_and_score(ollama_url), dict(archive.stats)
+    finally:
+        traffic_archive.stop()
+
+
+def test_replay_matches_recording_without_servers(recording, monkeypatch):
+    path, recorded, ollama_url = recording
+    assert len(recorded) == 10
+    assert any(reason.startswith("stub") for *_, reason in recorded)
+
+    # 재생 시 모델 목록도 아카이브에서 읽어야 함
+    monkeypatch.setattr(content_analyzer, "_installed_models", None)
+    monkeypatch.setattr(content_analyzer, "_query_installed_models", lambda: [])
+
+    replayed, stats = _replay(path, ollama_url)
+    assert replayed == recorded
+    assert stats["missing"] == 0
+    assert stats["replayed"] > 0
+    assert content_analyzer._installed_models == [STUB_MODEL]
+
+
+def test_recording_redacts_token_and_cookie(recording):
+    path, _, _ = recording
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        text = f.read()
+        f.seek(0)
+        entries = [json.loads(line) for line in f]
+
+    assert STUB_ACCESS_TOKEN not in text
+    assert STUB_COOKIE not in text
+    token_entries = [
+        e for e in entries if e["type"] == "http" and e["url"].endswith("/api/v1/access_token")
+    ]
+    assert token_entries
+    assert json.loads(token_entries[0]["body"])["access_token"] == "REDACTED"
+
+
+def test_truncated_archive_loads_prefix(recording, tmp_path):
+    path, _, _ = recording
+    with open(path, "rb") as f:
+        data = f.read()
+    with gzip.open(path, "rb") as f:
+        lines = f.read().splitlines(keepends=True)
+
+    # 압축 스트림이 중간에 끊긴 경우 (녹화 중 프로세스 종료)
+    truncated = tmp_path / "truncated.jsonl.gz"
+    truncated.write_bytes(data[: len(data) // 2])
+    archive = traffic_archive.TrafficArchive(str(truncated), "replay", 0)
+    full = traffic_archive.TrafficArchive(path, "replay", 0)
+    assert sum(map(len, archive._responses.values())) < sum(
+        map(len, full._responses.values())
+    )
+
+    # 마지막 줄이 중간에 잘린 경우
+    partial = tmp_path / "partial.jsonl.gz"
+    with gzip.open(partial, "wb") as f:
+        f.writelines(lines[:3])
+        f.write(lines[3][: len(lines[3]) // 2])
+    archive = traffic_archive.TrafficArchive(str(partial), "replay", 0)
+    entries = [json.loads(line) for line in lines[:3]]
+    assert sum(map(len, archive._responses.values())) == sum(
+        e["type"] == "http" for e in entries
+    )
+
+
+def test_archive_without_header_is_rejected(tmp_path):
+    path = tmp_path / "empty.jsonl.gz"
+    path.write_bytes(gzip.compress(b"")[:5])
+    with pytest.raises(ValueError):
+        traffic_archive.TrafficArchive(str(path), "replay", 0)
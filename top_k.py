@@ -0,0 +1,57 @@
+"""
+상위 K개 선택 - 전체를 정렬하지 않고 크기 K인 힙으로 상위 항목만 유지
+"""
+
+import heapq
+from itertools import count
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TopK(Generic[T]):
+    """
+    스트리밍 상위 K개 유지기
+
+    항목을 하나씩 push()하면 최소 힙에 상위 k개만 남기고 나머지는 버립니다.
+    push는 O(log k), items()는 O(k log k)이므로 입력 수와 관계없이 비용이 일정합니다.
+    """
+
+    def __init__(self, k: int, key: Optional[Callable[[T], Any]] = None):
+        """
+        유지기 초기화
+
+        Args:
+            k: 유지할 개수 (0이면 아무것도 유지하지 않음)
+            key: 정렬 키 함수 (None이면 항목 자체)
+        """
+        self.k = max(0, k)
+        self.key = key or (lambda item: item)
+        self._heap: List[Tuple[Any, int, T]] = []
+        # 값이 같을 때 먼저 들어온 항목 우선 (항목 자체는 비교하지 않음)
+        self._seq = count(0, -1)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, item: T) -> bool:
+        """
+        항목 추가
+
+        Returns:
+            상위 k개에 들었으면 True
+        """
+        if not self.k:
+            return False
+        entry = (self.key(item), next(self._seq), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def items(self) -> List[T]:
+        """현재 상위 항목 (내림차순)"""
+        return [item for _, _, item in sorted(self._heap, reverse=True)]
@@ -0,0 +1,308 @@
+"""
+토픽 클러스터링 - TF-IDF 희소 행렬과 미니배치 k-평균으로 LLM 없이 게시물 주제 묶기
+"""
+
+import logging
+import math
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import TOPIC_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 영문/숫자 단어 (c++, c#, node.js 같은 기술 용어 포함)와 한글 어절
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9+#]*(?:\.[a-z0-9]+)*|[가-힣]+")
+
+# 한글 어절 끝의 조사/어미 (긴 것부터 검사)
+_KOREAN_SUFFIXES = sorted(
+    [
+        "었습니다", "습니다", "에서는", "으로는", "이라는", "라는", "에서", "으로", "에게", "까지", "부터",
+        "처럼", "보다", "하고", "이고", "이다", "입니다", "합니다", "했다", "하는",
+        "하다", "에는", "과는", "와는", "은", "는", "이", "가", "을", "를", "에",
+        "의", "로", "와", "과", "도", "만", "고",
+    ],
+    key=len,
+    reverse=True,
+)
+
+_STOPWORDS = {
+    # 영어
+    "the", "and", "for", "are", "but", "not", "you", "all", "any", "can", "had",
+    "her", "was", "one", "our", "out", "has", "him", "his", "how", "its", "may",
+    "new", "now", "see", "way", "who", "did", "get", "got", "let", "use", "this",
+    "that", "with", "have", "from", "they", "will", "would", "there", "their",
+    "what", "about", "which", "when", "make", "like", "just", "than", "them",
+    "been", "into", "some", "could", "only", "other", "then", "also", "more",
+    "very", "your", "does", "should", "these", "those", "being", "here", "where",
+    "why", "were", "any", "anyone", "much", "really", "want", "need", "know",
+    "think", "using", "used", "something", "thing", "things", "even", "still",
+    "http", "https", "www", "com", "amp", "i'm", "it's", "don't",
+    # 한국어
+    "그리고", "그런데", "하지만", "그래서", "이런", "저런", "그런", "있는", "없는",
+    "있습니다", "없습니다", "있어요", "합니다", "했습니다", "하는", "대한", "관련",
+    "에서", "정말", "진짜", "그냥", "너무", "많이", "어떻게", "무엇", "이거", "저거", "그거",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    토픽 추출용 토큰화 (영어/한국어)
+
+    영어는 소문자 단어, 한국어는 어절 끝의 흔한 조사/어미를 떼어낸 어간을 사용합니다.
+    두 글자 미만 토큰과 불용어는 제외합니다.
+
+    Args:
+        text: 원문
+
+    Returns:
+        토큰 리스트
+    """
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if "가" <= token[0] <= "힣":
+            for suffix in _KOREAN_SUFFIXES:
+                if len(token) - len(suffix) >= 2 and token.endswith(suffix):
+                    token = token[: -len(suffix)]
+                    break
+        if len(token) >= 2 and token not in _STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def build_tfidf(
+    documents: List[List[str]], max_features: int, min_df: int
+) -> Tuple[Any, List[str]]:
+    """
+    토큰화된 문서로 L2 정규화된 TF-IDF 희소 행렬 생성
+
+    Args:
+        documents: 문서별 토큰 리스트
+        max_features: 문서 빈도 상위 몇 개 단어만 사용할지
+        min_df: 최소 문서 빈도
+
+    Returns:
+        (CSR 행렬 [문서 x 단어], 단어 리스트)
+    """
+    import numpy as np
+    from scipy import sparse
+
+    n_docs = len(documents)
+
+    # 문서 빈도 계산 후 너무 드물거나 흔한 단어 제외
+    df: Dict[str, int] = {}
+    for tokens in documents:
+        for term in set(tokens):
+            df[term] = df.get(term, 0) + 1
+    max_df = max(min_df, int(n_docs * TOPIC_CONFIG["max_df"]))
+    candidates = [t for t, c in df.items() if min_df <= c <= max_df]
+    candidates.sort(key=lambda t: (-df[t], t))
+    vocabulary = candidates[:max_features]
+    index = {term: i for i, term in enumerate(vocabulary)}
+
+    # CSR 구성 (문서별 단어 빈도)
+    indptr = [0]
+    indices: List[int] = []
+    counts: List[int] = []
+    for tokens in documents:
+        row: Dict[int, int] = {}
+        for term in tokens:
+            col = index.get(term)
+            if col is not None:
+                row[col] = row.get(col, 0) + 1
+        indices.extend(row.keys())
+        counts.extend(row.values())
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(counts, dtype=np.float64), indices, indptr),
+        shape=(n_docs, len(vocabulary)),
+    )
+
+    # 로그 TF x 평활 IDF, 행 단위 L2 정규화
+    matrix.data = 1.0 + np.log(matrix.data)
+    idf = np.log((1.0 + n_docs) / (1.0 + np.array([df[t] for t in vocabulary]))) + 1.0
+    matrix = matrix @ sparse.diags(idf)
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    matrix = sparse.diags(1.0 / norms) @ matrix
+    return matrix.tocsr(), vocabulary
+
+
+def minibatch_kmeans(
+    matrix, k: int, batch_size: int, iterations: int, seed: int = 0
+):
+    """
+    코사인 거리 미니배치 k-평균 (Sculley, 2010)
+
+    Args:
+        matrix: L2 정규화된 CSR 행렬
+        k: 클러스터 수
+        batch_size: 반복당 샘플 수
+        iterations: 반복 횟수
+        seed: 난수 시드 (결과 재현용)
+
+    Returns:
+        (문서별 클러스터 번호 배열, 중심 행렬 [k x 단어])
+    """
+    import numpy as np
+    from scipy import sparse
+
+    rng = np.random.default_rng(seed)
+    n_docs = matrix.shape[0]
+
+    # k-means++ 초기화
+    centers = np.empty((k, matrix.shape[1]))
+    first = rng.integers(n_docs)
+    centers[0] = matrix[first].toarray().ravel()
+    closest = 1.0 - matrix @ centers[0]
+    for c in range(1, k):
+        weights = np.clip(closest, 0.0, None) ** 2
+        total = weights.sum()
+        pick = rng.choice(n_docs, p=weights / total) if total > 0 else rng.integers(n_docs)
+        centers[c] = matrix[pick].toarray().ravel()
+        closest = np.minimum(closest, 1.0 - matrix @ centers[c])
+
+    # 미니배치 갱신 (중심별 학습률 1/할당 횟수)
+    seen = np.zeros(k)
+    batch_size = min(batch_size, n_docs)
+    for _ in range(iterations):
+        batch = matrix[rng.choice(n_docs, size=batch_size, replace=False)]
+        labels = np.asarray((batch @ centers.T).argmax(axis=1)).ravel()
+
+        # 할당 지시 행렬 [k x 배치]로 중심별 합계를 한 번에 계산
+        assign = sparse.csr_matrix(
+            (np.ones(batch_size), (labels, np.arange(batch_size))), shape=(k, batch_size)
+        )
+        counts = np.bincount(labels, minlength=k).astype(np.float64)
+        sums = np.asarray((assign @ batch).todense())
+        seen += counts
+        hit = counts > 0
+        rate = (counts[hit] / seen[hit])[:, None]
+        centers[hit] = (1.0 - rate) * centers[hit] + rate * (sums[hit] / counts[hit][:, None])
+        norms = np.linalg.norm(centers, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        centers /= norms
+
+    labels = np.asarray((matrix @ centers.T).argmax(axis=1)).ravel()
+    return labels, centers
+
+
+def merge_similar_clusters(matrix, labels, centers, threshold: float):
+    """
+    중심 코사인 유사도가 threshold 이상인 클러스터 병합
+
+    클러스터 수를 넉넉히 잡아 한 주제가 여러 클러스터로 쪼개진 경우를 합칩니다.
+
+    Returns:
+        (병합 후 클러스터 번호 배열, 병합 후 중심 행렬)
+    """
+    import numpy as np
+    from scipy import sparse
+
+    k = centers.shape[0]
+    similarity = centers @ centers.T
+    parent = list(range(k))
+    for i in range(k):
+        for j in range(i + 1, k):
+            if parent[j] == j and similarity[i, j] >= threshold:
+                parent[j] = parent[i]
+
+    if parent == list(range(k)):
+        return labels, centers
+
+    _, labels = np.unique(np.asarray(parent)[labels], return_inverse=True)
+    merged = labels.max() + 1
+    assign = sparse.csr_matrix(
+        (np.ones(len(labels)), (labels, np.arange(len(labels)))),
+        shape=(merged, len(labels)),
+    )
+    centers = np.asarray((assign @ matrix).todense())
+    norms = np.linalg.norm(centers, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return labels, centers / norms
+
+
+def _top_indices(values, k: int):
+    """
+    값이 큰 순서대로 상위 k개의 인덱스
+
+    argpartition으로 상위 k개를 O(n)에 고른 뒤 그 k개만 정렬합니다.
+    k가 0 이하이면 빈 배열을 반환합니다.
+    """
+    import numpy as np
+
+    if k <= 0:
+        return np.array([], dtype=np.intp)
+    if k >= len(values):
+        return np.argsort(values)[::-1]
+    top = np.argpartition(values, -k)[-k:]
+    return top[np.argsort(values[top])[::-1]]
+
+
+def cluster_topics(posts: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """
+    게시물 제목+본문을 주제별로 클러스터링
+
+    Args:
+        posts: 게시물 리스트 (id, title, text 사용)
+
+    Returns:
+        큰 순서대로 정렬된 클러스터 리스트. 각 클러스터는 terms(상위 단어),
+        size(게시물 수), post_ids/titles(중심에 가까운 대표 게시물)를 포함.
+        게시물이 너무 적거나 NumPy/SciPy가 없으면 None
+    """
+    if len(posts) < TOPIC_CONFIG["min_posts"]:
+        return None
+
+    try:
+        import numpy as np
+        import scipy.sparse  # noqa: F401
+    except ImportError:
+        logger.info("토픽 클러스터링에는 numpy와 scipy가 필요합니다: pip install numpy scipy")
+        return None
+
+    documents = [
+        tokenize(f"{post.get('title', '')} {post.get('text') or ''}") for post in posts
+    ]
+    matrix, vocabulary = build_tfidf(
+        documents, TOPIC_CONFIG["max_features"], TOPIC_CONFIG["min_df"]
+    )
+
+    # 단어가 하나도 없는 문서는 클러스터링에서 제외
+    nonempty = np.flatnonzero(np.diff(matrix.indptr))
+    if len(vocabulary) < 2 or len(nonempty) < TOPIC_CONFIG["min_posts"]:
+        return None
+    matrix = matrix[nonempty]
+
+    k = min(TOPIC_CONFIG["max_clusters"], max(2, round(math.sqrt(len(nonempty) / 2))))
+    labels, centers = minibatch_kmeans(
+        matrix, k, TOPIC_CONFIG["batch_size"], TOPIC_CONFIG["iterations"]
+    )
+    labels, centers = merge_similar_clusters(
+        matrix, labels, centers, TOPIC_CONFIG["merge_similarity"]
+    )
+    k = centers.shape[0]
+    similarity = np.asarray((matrix @ centers.T)[np.arange(len(labels)), labels]).ravel()
+
+    clusters = []
+    for c in range(k):
+        members = np.flatnonzero(labels == c)
+        if len(members) == 0:
+            continue
+        top_terms = _top_indices(centers[c], TOPIC_CONFIG["top_terms"])
+        representatives = members[
+            _top_indices(similarity[members], TOPIC_CONFIG["representatives"])
+        ]
+        rep_posts = [posts[nonempty[i]] for i in representatives]
+        clusters.append(
+            {
+                "terms": [vocabulary[t] for t in top_terms if centers[c][t] > 0],
+                "size": int(len(members)),
+                "post_ids": [p.get("id") for p in rep_posts],
+                "titles": [p.get("title", "") for p in rep_posts],
+            }
+        )
+
+    clusters.sort(key=lambda cluster: cluster["size"], reverse=True)
+    return clusters
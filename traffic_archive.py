@@ -0,0 +1,339 @@
+"""
+트래픽 아카이브 - Reddit/Ollama HTTP 응답을 녹화하고 그대로 재생해 실행을 재현
+
+녹화(--record)하면 모든 HTTP 요청의 응답과 원래 걸린 시간을 gzip JSONL 파일에 기록합니다.
+재생(--replay)하면 네트워크 없이 같은 요청에 녹화된 응답을 돌려주고, 원래 시간에
+배율을 곱한 만큼 기다립니다. 성능 비교/회귀 테스트를 같은 입력으로 반복할 수 있습니다.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from http_cache import normalize_url
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_VERSION = 1
+
+# 녹화할 때 응답 본문에서 가리는 토큰 필드 (OAuth 토큰 발급 응답)
+_SECRET_FIELDS = ("access_token", "refresh_token")
+_TOKEN_PATH = "/api/v1/access_token"
+# 녹화하지 않는 응답 헤더
+_SECRET_HEADERS = ("set-cookie",)
+
+
+def _request_key(request: requests.PreparedRequest) -> str:
+    """요청 식별 키 (메서드, 정규화된 URL, 본문 SHA-1)"""
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha1(body).hexdigest()
+    return f"{request.method} {normalize_url(request.url)} {digest}"
+
+
+def _redact_body(url: str, body: str) -> str:
+    """OAuth 토큰 발급 응답이면 토큰 값을 가린 본문 (재생 시 가짜 토큰으로 동작)"""
+    if not urlsplit(url).path.rstrip("/").endswith(_TOKEN_PATH):
+        return body
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    if not isinstance(data, dict):
+        return body
+    for field in _SECRET_FIELDS:
+        if field in data:
+            data[field] = "REDACTED"
+    return json.dumps(data)
+
+
+class TrafficArchive:
+    """
+    HTTP 응답 녹화/재생 저장소
+
+    mode가 "record"면 응답을 파일에 덧붙이고, "replay"면 파일 전체를 읽어
+    요청 키별 응답 큐로 보관합니다. 같은 요청이 여러 번 녹화되었으면 녹화 순서대로
+    돌려주고, 다 쓰면 마지막 응답을 계속 사용합니다.
+    """
+
+    def __init__(self, path: str, mode: str, time_scale: float = 1.0):
+        """
+        아카이브 열기
+
+        Args:
+            path: 아카이브 파일 경로 (.jsonl.gz)
+            mode: "record" 또는 "replay"
+            time_scale: 재생 시 원래 응답 시간에 곱할 배율 (0이면 기다리지 않음)
+
+        Raises:
+            ValueError: mode가 잘못되었거나 아카이브 버전이 맞지 않는 경우
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"알 수 없는 모드: {mode}")
+
+        self.path = path
+        self.mode = mode
+        self.time_scale = max(0.0, time_scale)
+        self._lock = threading.Lock()
+        self._responses: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._last: Dict[str, Dict[str, Any]] = {}
+        self._values: Dict[str, Any] = {}
+        self.stats = {"recorded": 0, "replayed": 0, "missing": 0}
+
+        if mode == "record":
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+            self._write(
+                {
+                    "type": "header",
+                    "version": ARCHIVE_VERSION,
+                    "created_at": datetime.utcnow().isoformat(),
+                }
+            )
+        else:
+            self._file = None
+            self._load()
+
+    def _load(self) -> None:
+        """
+        재생용으로 아카이브 전체 읽기
+
+        녹화가 중간에 끊겨 파일 끝이 잘려 있으면 마지막 완전한 줄까지만 사용합니다.
+
+        Raises:
+            ValueError: 헤더가 없거나 버전이 맞지 않는 경우
+        """
+        has_header = False
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    if not line.endswith("\n"):
+                        raise EOFError("마지막 줄이 완전하지 않음")
+                    entry = json.loads(line)
+                    if entry["type"] == "header":
+                        if entry["version"] != ARCHIVE_VERSION:
+                            raise ValueError(
+                                f"지원하지 않는 아카이브 버전: {entry['version']}"
+                            )
+                        has_header = True
+                    elif entry["type"] == "value":
+                        self._values[entry["name"]] = entry["value"]
+                    elif entry["type"] == "http":
+                        self._responses.setdefault(entry["key"], deque()).append(entry)
+            except EOFError as e:
+                logger.warning("아카이브 %s 끝이 잘려 있어 앞부분만 사용합니다: %s", self.path, e)
+
+        if not has_header:
+            raise ValueError(f"아카이브 헤더가 없습니다: {self.path}")
+
+        logger.info(
+            "아카이브 %s: 요청 %d종, 응답 %d개",
+            self.path,
+            len(self._responses),
+            sum(len(q) for q in self._responses.values()),
+        )
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        """녹화 항목 한 줄 기록"""
+        with self._lock:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def record(
+        self, request: requests.PreparedRequest, response: requests.Response, elapsed: float
+    ) -> None:
+        """
+        응답 녹화 (OAuth 토큰과 쿠키는 기록하지 않음)
+
+        Args:
+            request: 보낸 요청
+            response: 받은 응답 (본문을 모두 읽은 상태)
+            elapsed: 요청부터 본문 수신까지 걸린 시간 (초)
+        """
+        entry = {
+            "type": "http",
+            "key": _request_key(request),
+            "method": request.method,
+            "url": request.url,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _SECRET_HEADERS
+            },
+            "elapsed": round(elapsed, 4),
+        }
+        try:
+            entry["body"] = _redact_body(request.url, response.content.decode("utf-8"))
+        except UnicodeDecodeError:
+            entry["body_b64"] = base64.b64encode(response.content).decode("ascii")
+        self._write(entry)
+        with self._lock:
+            self.stats["recorded"] += 1
+
+    def replay(self, request: requests.PreparedRequest) -> requests.Response:
+        """
+        녹화된 응답 재생 (원래 시간 x time_scale 만큼 대기)
+
+        Raises:
+            requests.ConnectionError: 녹화에 없는 요청인 경우
+        """
+        key = _request_key(request)
+        with self._lock:
+            queue = self._responses.get(key)
+            if queue:
+                entry = queue.popleft()
+                self._last[key] = entry
+            else:
+                entry = self._last.get(key)
+            self.stats["replayed" if entry else "missing"] += 1
+
+        if entry is None:
+            raise requests.ConnectionError(
+                f"녹화에 없는 요청입니다: {request.method} {request.url}"
+            )
+
+        if self.time_scale:
+            time.sleep(entry["elapsed"] * self.time_scale)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        # 저장된 본문은 이미 압축이 풀린 상태
+        response.headers.pop("Content-Encoding", None)
+        if "body_b64" in entry:
+            response._content = base64.b64decode(entry["body_b64"])
+        else:
+            response._content = entry["body"].encode("utf-8")
+        response.url = request.url
+        response.request = request
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def value(self, name: str, loader: Callable[[], Any]) -> Any:
+        """
+        HTTP 외의 환경 값 녹화/재생 (예: 설치된 Ollama 모델 목록)
+
+        Args:
+            name: 값 이름
+            loader: 녹화 시 실제 값을 구하는 함수
+
+        Returns:
+            녹화 시 loader 결과, 재생 시 녹화된 값 (없으면 loader 결과)
+        """
+        if self.mode == "replay":
+            with self._lock:
+                if name in self._values:
+                    return self._values[name]
+            return loader()
+
+        value = loader()
+        self._write({"type": "value", "name": name, "value": value})
+        return value
+
+    def close(self) -> None:
+        """아카이브 닫기 (녹화 파일 마무리)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        logger.info("아카이브 %s 닫음: %s", self.path, self.stats)
+
+
+class ArchiveAdapter(HTTPAdapter):
+    """녹화 모드에서는 실제 전송 후 응답을 기록하고, 재생 모드에서는 녹화된 응답을 반환하는 어댑터"""
+
+    def __init__(self, archive: TrafficArchive, **kwargs):
+        """
+        어댑터 초기화
+
+        Args:
+            archive: 사용할 아카이브
+            **kwargs: HTTPAdapter 인자 (연결 풀 크기 등)
+        """
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def send(self, request, **kwargs):
+        """요청 전송 (녹화/재생)"""
+        if self.archive.mode == "replay":
+            return self.archive.replay(request)
+
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        response.content  # 본문을 모두 받아야 녹화 가능 (이후 읽기는 메모리에서)
+        self.archive.record(request, response, time.perf_counter() - started)
+        return response
+
+
+# 프로세스 전체에서 사용하는 아카이브 (녹화/재생 중이 아니면 None)
+_archive: Optional[TrafficArchive] = None
+
+
+def start(path: str, mode: str, time_scale: float = 1.0) -> TrafficArchive:
+    """
+    녹화/재생 시작 (클라이언트 생성 전에 호출)
+
+    Args:
+        path: 아카이브 파일 경로
+        mode: "record" 또는 "replay"
+        time_scale: 재생 시간 배율
+
+    Returns:
+        활성화된 아카이브
+    """
+    global _archive
+    _archive = TrafficArchive(path, mode, time_scale)
+    return _archive
+
+
+def stop() -> None:
+    """녹화/재생 종료"""
+    global _archive
+    if _archive is not None:
+        _archive.close()
+        _archive = None
+
+
+def active_archive() -> Optional[TrafficArchive]:
+    """현재 녹화/재생 중인 아카이브 (없으면 None)"""
+    return _archive
+
+
+def mount(session: requests.Session) -> requests.Session:
+    """
+    녹화/재생 중이면 세션의 HTTP/HTTPS 어댑터를 아카이브 어댑터로 교체
+
+    기존 어댑터의 연결 풀 크기는 그대로 유지합니다.
+
+    Args:
+        session: 대상 세션
+
+    Returns:
+        같은 세션
+    """
+    if _archive is None:
+        return session
+
+    for prefix in ("https://", "http://"):
+        current = session.get_adapter(prefix)
+        adapter = ArchiveAdapter(
+            _archive,
+            pool_connections=getattr(current, "_pool_connections", 10),
+            pool_maxsize=getattr(current, "_pool_maxsize", 10),
+        )
+        session.mount(prefix, adapter)
+    return session
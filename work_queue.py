@@ -0,0 +1,447 @@
+"""
+분산 작업 큐 - 검색을 수집/분석 작업으로 나누어 여러 워커 프로세스가 처리
+"""
+
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, func, or_, update
+from sqlalchemy.exc import IntegrityError
+
+from client_registry import get_registry
+from config import FILTER_CRITERIA, INSIGHTS_CONFIG, QUEUE_CONFIG
+from database import Database, QueueTask
+from insight_summarizer import comments_loader_for
+
+logger = logging.getLogger(__name__)
+
+TASK_KINDS = ["fetch", "analyze", "finalize"]
+
+
+class WorkQueue:
+    """
+    데이터베이스 기반 작업 큐
+
+    작업은 임대(lease) 방식으로 가져가며, 임대 시간 안에 완료되지 않으면
+    다른 워커가 다시 가져갈 수 있습니다. 실패한 작업은 최대 시도 횟수까지
+    지수 백오프로 재시도됩니다. PostgreSQL을 공유하면 여러 호스트에서도 동작합니다.
+    """
+
+    def __init__(self, db: Database):
+        """
+        작업 큐 초기화
+
+        Args:
+            db: 큐 테이블이 있는 데이터베이스
+        """
+        self.db = db
+
+    def enqueue(
+        self,
+        kind: str,
+        search_id: str,
+        payload: Dict[str, Any],
+        dedupe_key: Optional[str] = None,
+    ) -> bool:
+        """
+        작업 등록
+
+        Args:
+            kind: 작업 종류 (fetch, analyze, finalize)
+            search_id: 검색 ID
+            payload: 작업 데이터
+            dedupe_key: 같은 키의 작업이 이미 있으면 등록하지 않음
+
+        Returns:
+            새로 등록했으면 True
+        """
+        with self.db.session_local() as session:
+            session.add(
+                QueueTask(
+                    kind=kind,
+                    search_id=search_id,
+                    dedupe_key=dedupe_key,
+                    payload=payload,
+                    status="pending",
+                    attempts=0,
+                    available_at=datetime.utcnow(),
+                )
+            )
+            try:
+                session.commit()
+            except IntegrityError:
+                session.rollback()
+                return False
+        return True
+
+    def lease(
+        self, worker_id: str, kinds: List[str], lease_seconds: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        처리할 작업 하나 임대
+
+        대기 중이거나 임대가 만료된 작업을 조건부 UPDATE로 선점하므로
+        여러 워커가 동시에 호출해도 한 작업은 한 워커만 가져갑니다.
+
+        Args:
+            worker_id: 워커 식별자
+            kinds: 처리할 작업 종류
+            lease_seconds: 임대 시간 (None이면 config에서 가져옴)
+
+        Returns:
+            작업 정보 딕셔너리 (없으면 None)
+        """
+        lease_seconds = lease_seconds or QUEUE_CONFIG["lease_seconds"]
+
+        while True:
+            now = datetime.utcnow()
+            claimable = and_(
+                QueueTask.kind.in_(kinds),
+                or_(
+                    and_(QueueTask.status == "pending", QueueTask.available_at <= now),
+                    and_(QueueTask.status == "leased", QueueTask.lease_expires_at < now),
+                ),
+            )
+
+            with self.db.session_local() as session:
+                candidates = [
+                    row.id
+                    for row in session.query(QueueTask.id)
+                    .filter(claimable)
+                    .order_by(QueueTask.id)
+                    .limit(5)
+                ]
+                if not candidates:
+                    return None
+
+                for task_id in candidates:
+                    claimed = session.execute(
+                        update(QueueTask)
+                        .where(QueueTask.id == task_id, claimable)
+                        .values(
+                            status="leased",
+                            lease_owner=worker_id,
+                            lease_expires_at=now + timedelta(seconds=lease_seconds),
+                            attempts=QueueTask.attempts + 1,
+                        )
+                    ).rowcount
+                    session.commit()
+                    if not claimed:
+                        continue  # 다른 워커가 먼저 가져감
+
+                    task = session.get(QueueTask, task_id)
+                    if task.attempts > QUEUE_CONFIG["max_attempts"]:
+                        # 임대 만료가 반복된 작업은 더 시도하지 않음
+                        task.status = "failed"
+                        task.error = task.error or "임대 만료 횟수 초과"
+                        session.commit()
+                        # 마지막 분석 작업이었으면 나머지 결과로 검색 마무리
+                        if task.kind == "analyze":
+                            _maybe_finalize(self, task.search_id)
+                        continue
+
+                    return {
+                        "id": task.id,
+                        "kind": task.kind,
+                        "search_id": task.search_id,
+                        "payload": task.payload,
+                        "attempts": task.attempts,
+                    }
+
+    def heartbeat(self, task_id: int, worker_id: str) -> bool:
+        """
+        임대 연장
+
+        Returns:
+            아직 이 워커가 임대 중이면 True
+        """
+        with self.db.session_local() as session:
+            extended = session.execute(
+                update(QueueTask)
+                .where(
+                    QueueTask.id == task_id,
+                    QueueTask.lease_owner == worker_id,
+                    QueueTask.status == "leased",
+                )
+                .values(
+                    lease_expires_at=datetime.utcnow()
+                    + timedelta(seconds=QUEUE_CONFIG["lease_seconds"])
+                )
+            ).rowcount
+            session.commit()
+        return bool(extended)
+
+    def complete(
+        self, task_id: int, worker_id: str, result: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        작업 완료 처리
+
+        Returns:
+            완료 기록에 성공하면 True (임대를 잃었으면 False)
+        """
+        with self.db.session_local() as session:
+            done = session.execute(
+                update(QueueTask)
+                .where(
+                    QueueTask.id == task_id,
+                    QueueTask.lease_owner == worker_id,
+                    QueueTask.status == "leased",
+                )
+                .values(status="done", result=result or {}, lease_expires_at=None)
+            ).rowcount
+            session.commit()
+
+        if not done:
+            logger.warning("작업 %d의 임대를 잃어 완료를 기록하지 못함", task_id)
+        return bool(done)
+
+    def fail(self, task_id: int, worker_id: str, error: str) -> bool:
+        """
+        작업 실패 처리 (시도 횟수가 남았으면 백오프 후 재시도)
+
+        Returns:
+            더 이상 재시도하지 않는 최종 실패이면 True
+        """
+        with self.db.session_local() as session:
+            task = session.get(QueueTask, task_id)
+            if task is None or task.lease_owner != worker_id or task.status != "leased":
+                return False
+
+            task.error = error[:2000]
+            task.lease_expires_at = None
+            if task.attempts >= QUEUE_CONFIG["max_attempts"]:
+                task.status = "failed"
+                logger.error("작업 %d 최종 실패: %s", task_id, error)
+            else:
+                backoff = QUEUE_CONFIG["retry_backoff"] * 2 ** (task.attempts - 1)
+                task.status = "pending"
+                task.available_at = datetime.utcnow() + timedelta(seconds=backoff)
+                logger.warning("작업 %d 실패, %d초 후 재시도: %s", task_id, backoff, error)
+            session.commit()
+            return task.status == "failed"
+
+    def remaining(self, search_id: str, kind: str) -> int:
+        """검색의 특정 종류 작업 중 아직 끝나지 않은 작업 수"""
+        with self.db.session_local() as session:
+            return (
+                session.query(func.count(QueueTask.id))
+                .filter(
+                    QueueTask.search_id == search_id,
+                    QueueTask.kind == kind,
+                    QueueTask.status.in_(["pending", "leased"]),
+                )
+                .scalar()
+            )
+
+    def results(self, search_id: str, kind: str) -> List[Dict[str, Any]]:
+        """검색의 특정 종류 완료 작업 결과 목록"""
+        with self.db.session_local() as session:
+            return [
+                row.result or {}
+                for row in session.query(QueueTask.result).filter(
+                    QueueTask.search_id == search_id,
+                    QueueTask.kind == kind,
+                    QueueTask.status == "done",
+                )
+            ]
+
+
+def _encode_post(post: Dict[str, Any]) -> Dict[str, Any]:
+    """게시물을 JSON 저장 가능한 형태로 변환"""
+    encoded = dict(post)
+    encoded["created_utc"] = post["created_utc"].isoformat()
+    return encoded
+
+
+def _decode_post(post: Dict[str, Any]) -> Dict[str, Any]:
+    """_encode_post로 변환한 게시물 복원"""
+    decoded = dict(post)
+    decoded["created_utc"] = datetime.fromisoformat(post["created_utc"])
+    return decoded
+
+
+def submit_search(
+    db: Database,
+    keywords: List[str],
+    subreddits: List[str],
+    limit: int,
+    deep: bool = False,
+) -> str:
+    """
+    검색을 작업 큐에 등록
+
+    Args:
+        db: 큐 데이터베이스
+        keywords: 검색 키워드
+        subreddits: 검색할 서브레딧
+        limit: 가져올 게시물 수
+        deep: 심층 검색 여부
+
+    Returns:
+        등록된 검색 ID
+    """
+    search_id = str(uuid.uuid4())
+    WorkQueue(db).enqueue(
+        "fetch",
+        search_id,
+        {"keywords": keywords, "subreddits": subreddits, "limit": limit, "deep": deep},
+        dedupe_key=f"fetch:{search_id}",
+    )
+    return search_id
+
+
+def _handle_fetch(queue: WorkQueue, task: Dict[str, Any], heartbeat: Callable) -> Dict[str, Any]:
+    """수집 작업: 게시물을 가져와 분석 작업으로 분할 등록"""
+    spec = task["payload"]
+    reddit_client = get_registry().get_reddit_client()
+    search = reddit_client.search_posts_deep if spec["deep"] else reddit_client.search_posts
+    # 심층 검색은 임대 시간보다 오래 걸릴 수 있으므로 서브레딧/검색 창마다 임대 연장
+    posts = search(spec["keywords"], spec["subreddits"], spec["limit"], progress=heartbeat)
+
+    batch_size = QUEUE_CONFIG["analyze_batch_size"]
+    batches = [posts[i : i + batch_size] for i in range(0, len(posts), batch_size)]
+    for index, batch in enumerate(batches):
+        queue.enqueue(
+            "analyze",
+            task["search_id"],
+            {"keywords": spec["keywords"], "posts": [_encode_post(p) for p in batch]},
+            dedupe_key=f"analyze:{task['search_id']}:{index}",
+        )
+
+    # 완료 결과가 마무리 작업의 입력이 됨
+    return dict(spec, post_count=len(posts))
+
+
+def _handle_analyze(queue: WorkQueue, task: Dict[str, Any], heartbeat: Callable) -> Dict[str, Any]:
+    """분석 작업: 게시물 묶음을 평가하고 필터링된 게시물 저장"""
+    payload = task["payload"]
+    analyzer = get_registry().get_analyzer()
+
+    filtered_posts = []
+    heuristic_ids = []
+    for post in map(_decode_post, payload["posts"]):
+        relevance_score, reason = analyzer.analyze_relevance(post, payload["keywords"])
+        post["relevance_score"] = relevance_score
+        post["analysis_reason"] = reason
+        if relevance_score >= FILTER_CRITERIA["min_relevance_score"]:
+            filtered_posts.append(post)
+        if post.get("scored_by") == "heuristic":
+            heuristic_ids.append(post["id"])
+        heartbeat()
+
+    queue.db.save_posts(task["search_id"], filtered_posts)
+    return {
+        "analyzed": len(payload["posts"]),
+        "heuristic": heuristic_ids,
+        # 인사이트 추출에 필요한 필드만 보관
+        "filtered": [
+            {
+                "id": p["id"],
+                "title": p["title"],
+                "text": p["text"][: INSIGHTS_CONFIG["max_text_chars"]],
+                "score": p["score"],
+                "relevance_score": p["relevance_score"],
+                "keywords_matched": p["keywords_matched"],
+            }
+            for p in filtered_posts
+        ],
+    }
+
+
+def _handle_finalize(queue: WorkQueue, task: Dict[str, Any], heartbeat: Callable) -> Dict[str, Any]:
+    """마무리 작업: 분석 결과를 모아 인사이트 추출 후 검색 기록 저장"""
+    spec = task["payload"]
+    results = queue.results(task["search_id"], "analyze")
+    filtered = [post for result in results for post in result.get("filtered", [])]
+    registry = get_registry()
+    insights = registry.get_analyzer().extract_insights(
+        filtered,
+        cache=queue.db,
+        comments_loader=comments_loader_for(registry.get_reddit_client()),
+    )
+    queue.db.save_search(
+        task["search_id"],
+        spec["keywords"],
+        spec["subreddits"],
+        spec["post_count"],
+        len(filtered),
+        insights,
+        heuristic_post_ids=[pid for r in results for pid in r.get("heuristic", [])],
+    )
+    return {"filtered_count": len(filtered)}
+
+
+def _maybe_finalize(queue: WorkQueue, search_id: str) -> None:
+    """수집이 끝났고 남은 분석 작업이 없으면 마무리 작업 등록 (키로 중복 방지)"""
+    if queue.remaining(search_id, "analyze"):
+        return
+    fetch_results = queue.results(search_id, "fetch")
+    if fetch_results:
+        queue.enqueue(
+            "finalize", search_id, fetch_results[0], dedupe_key=f"finalize:{search_id}"
+        )
+
+
+TASK_HANDLERS = {
+    "fetch": _handle_fetch,
+    "analyze": _handle_analyze,
+    "finalize": _handle_finalize,
+}
+
+
+def run_worker(
+    db: Database,
+    kinds: Optional[List[str]] = None,
+    worker_id: Optional[str] = None,
+    exit_when_idle: bool = False,
+) -> int:
+    """
+    작업 큐 워커 루프
+
+    Args:
+        db: 큐 데이터베이스 (결과도 같은 DB에 저장)
+        kinds: 처리할 작업 종류 (None이면 전체)
+        worker_id: 워커 식별자 (None이면 호스트명:PID)
+        exit_when_idle: True면 큐가 비었을 때 종료
+
+    Returns:
+        처리한 작업 수
+    """
+    queue = WorkQueue(db)
+    kinds = kinds or TASK_KINDS
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    processed = 0
+    logger.info("워커 %s 시작 (작업 종류: %s)", worker_id, ", ".join(kinds))
+
+    while True:
+        task = queue.lease(worker_id, kinds)
+        if task is None:
+            if exit_when_idle:
+                break
+            time.sleep(QUEUE_CONFIG["poll_interval"])
+            continue
+
+        try:
+            result = TASK_HANDLERS[task["kind"]](
+                queue, task, lambda: queue.heartbeat(task["id"], worker_id)
+            )
+        except Exception as e:
+            logger.exception("작업 %d(%s) 처리 실패", task["id"], task["kind"])
+            if queue.fail(task["id"], worker_id, str(e)) and task["kind"] == "analyze":
+                _maybe_finalize(queue, task["search_id"])
+            continue
+
+        if queue.complete(task["id"], worker_id, result):
+            processed += 1
+            # 수집 또는 마지막 분석을 끝낸 워커가 마무리 작업 등록
+            if task["kind"] in ("fetch", "analyze"):
+                _maybe_finalize(queue, task["search_id"])
+
+    logger.info("워커 %s 종료 (처리 %d개)", worker_id, processed)
+    return processed